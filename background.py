@@ -0,0 +1,80 @@
+# core/background.py
+import queue
+import threading
+import traceback
+from typing import Any, Callable, List, Tuple
+
+Message = Tuple[Any, ...]
+
+
+class SimulationCancelled(Exception):
+    """Raised at a cancellation point once a run's CancelToken is set."""
+
+
+class CancelToken:
+    """Cooperative cancellation flag, checked by simulation loops at safe points."""
+    __slots__ = ("_event",)
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise SimulationCancelled()
+
+
+class BackgroundRun:
+    """
+    Runs `target(cancel_token, post)` on a daemon thread. The target reports
+    through post(message); the UI thread collects messages with drain(),
+    e.g. from an after() poll, so Tk is only ever touched on its own thread.
+
+    The run ends with exactly one of ("done",), ("cancelled",) or
+    ("error", exception, formatted traceback).
+    """
+    def __init__(self, target: Callable[[CancelToken, Callable[[Message], None]], None]):
+        self.cancel_token = CancelToken()
+        self.messages: "queue.Queue[Message]" = queue.Queue()
+        self._target = target
+        self._thread = threading.Thread(target=self._main, name="simulation", daemon=True)
+
+    def start(self) -> "BackgroundRun":
+        self._thread.start()
+        return self
+
+    def _main(self):
+        try:
+            self._target(self.cancel_token, self.messages.put)
+        except SimulationCancelled:
+            self.messages.put(("cancelled",))
+        except Exception as exc:  # reported to the UI instead of dying silently
+            self.messages.put(("error", exc, traceback.format_exc()))
+        else:
+            self.messages.put(("done",))
+
+    def cancel(self):
+        self.cancel_token.cancel()
+
+    def join(self, timeout=None):
+        self._thread.join(timeout)
+
+    @property
+    def running(self) -> bool:
+        return self._thread.is_alive()
+
+    def drain(self, limit: int = 1000) -> List[Message]:
+        """Messages posted so far (at most `limit`), without blocking."""
+        out = []
+        while len(out) < limit:
+            try:
+                out.append(self.messages.get_nowait())
+            except queue.Empty:
+                break
+        return out
@@ -0,0 +1,277 @@
+# batch.py
+"""
+Headless batch runner: every scheduler over every workload file.
+
+    python batch.py TRACE [TRACE ...] [-s NAME[:key=value,...]] ... [-o OUT_DIR]
+                    [--format csv|jsonl|binary] [--timelines binary|csv|jsonl|none]
+                    [--no-timeline] [--alpha A] [--beta B] [--gamma G] [-j JOBS]
+
+Inputs are CSV (pid,arrival,burst[,priority] with a header), JSONL (one
+task object per line) or binary task traces (see core.trace_io), chosen
+by extension unless --format is given. Directories are searched for such
+files; "-" reads CSV or JSONL from stdin.
+
+Schedulers are picked by registry name with optional parameters, e.g.
+`-s FCFS -s RoundRobin:quantum=4`; the default is every registered
+scheduler with its default parameters.
+
+Files run in parallel, one worker process per file at a time (--jobs,
+default the CPU count). With -o, each worker writes its timelines to
+OUT_DIR/<file>.<scheduler>.<ext> and the runner appends one summary record
+per (file, scheduler) to OUT_DIR/summary.jsonl (or summary.csv with
+--summary-format csv); without -o the JSONL summary goes to stdout.
+--no-timeline never builds the timelines: runs go through the streaming
+engine, which keeps only the aggregates, so memory is bounded by the
+number of tasks in flight instead of the length of the schedule.
+
+Exits with status 1 if any file failed; its error is recorded in the
+summary and the other files still run.
+"""
+import argparse
+import contextlib
+import csv
+import io
+import json
+import multiprocessing
+import os
+import sys
+import time
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+from core.task_table import TaskTable
+from core.simulation_result import SimulationResult
+from core.simulation_engine import SimulationEngine
+from core.streaming import StreamingEngine
+from core.trace_io import MAGIC, open_tasks, read_csv_tasks, read_jsonl_tasks, write_result
+from evaluation.energy_model import EnergyParams, DEFAULT_ENERGY_PARAMS
+from evaluation.metrics import rescore_energy
+from schedulers.base import Scheduler
+from schedulers.registry import REGISTRY
+
+EXTENSIONS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".trace": "binary", ".bin": "binary"}
+TIMELINE_EXTENSIONS = {"binary": ".trace", "csv": ".csv", "jsonl": ".jsonl"}
+SUMMARY_FIELDS = ("file", "scheduler", "params", "tasks", "seconds", "energy", "context_switches",
+                  "idle_cycles", "avg_wait", "avg_turnaround", "throughput", "response_p95", "response_p99",
+                  "turnaround_p95", "turnaround_p99", "slowdown_p99", "timeline", "error")
+
+# (scheduler name, parameter strings as given on the command line)
+SchedulerChoice = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class Job(NamedTuple):
+    path: str
+    fmt: Optional[str]  # None: detect from the file
+    name: str  # output file stem, unique within the run
+    schedulers: Tuple[SchedulerChoice, ...]
+    energy: EnergyParams
+    out_dir: Optional[str]
+    timelines: str
+    materialize: bool
+    table: Optional[TaskTable] = None  # pre-read stdin
+
+
+# ---- inputs ----
+
+def detect_format(path: str) -> str:
+    fmt = EXTENSIONS.get(os.path.splitext(path)[1].lower())
+    if fmt is not None:
+        return fmt
+    with open(path, "rb") as f:
+        head = f.read(len(MAGIC))
+    if head == MAGIC:
+        return "binary"
+    return "jsonl" if head.lstrip().startswith(b"{") else "csv"
+
+def read_workload(path: str, fmt: str) -> TaskTable:
+    if fmt == "binary":
+        return open_tasks(path)
+    return read_jsonl_tasks(path) if fmt == "jsonl" else read_csv_tasks(path)
+
+def read_stdin(fmt: Optional[str]) -> TaskTable:
+    text = sys.stdin.read()
+    if fmt == "binary":
+        raise ValueError("binary traces are memory-mapped; pass them as files, not on stdin")
+    if fmt is None:
+        fmt = "jsonl" if text.lstrip().startswith("{") else "csv"
+    source = io.StringIO(text)
+    return read_jsonl_tasks(source) if fmt == "jsonl" else read_csv_tasks(source)
+
+def expand_inputs(paths: Iterable[str]) -> Iterator[str]:
+    """Paths as given, with directories replaced by the workload files under them (sorted)."""
+    for path in paths:
+        if path != "-" and os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if os.path.splitext(name)[1].lower() in EXTENSIONS:
+                        yield os.path.join(root, name)
+        else:
+            yield path
+
+def _unique_names(paths: Sequence[str]) -> List[str]:
+    seen: Dict[str, int] = {}
+    names = []
+    for path in paths:
+        stem = "stdin" if path == "-" else os.path.splitext(os.path.basename(path))[0]
+        count = seen.get(stem, 0)
+        seen[stem] = count + 1
+        names.append(stem if count == 0 else f"{stem}-{count}")
+    return names
+
+
+# ---- schedulers ----
+
+def parse_scheduler(text: str) -> SchedulerChoice:
+    """"RoundRobin:quantum=4,fast=false" -> ("RoundRobin", (("quantum", "4"), ("fast", "false")))."""
+    name, _, rest = text.partition(":")
+    params = []
+    for item in filter(None, rest.split(",")):
+        key, sep, value = item.partition("=")
+        if not sep:
+            raise ValueError(f"expected key=value in {text!r}, got {item!r}")
+        params.append((key.strip(), value.strip()))
+    return name.strip(), tuple(params)
+
+def make_scheduler(choice: SchedulerChoice) -> Scheduler:
+    name, params = choice
+    return REGISTRY[name].create(**dict(params))
+
+def _label(choice: SchedulerChoice) -> str:
+    name, params = choice
+    return name + "".join(f"-{k}={v}" for k, v in params)
+
+
+# ---- running ----
+
+def aggregate_only(scheduler: Scheduler, table: TaskTable) -> SimulationResult:
+    """
+    Metrics and counters without a timeline; same numbers as a full run
+    (percentiles to within the sketches' rank error beyond 1024 tasks).
+    """
+    if not scheduler.streams:
+        # no policy (a plugin with a run() of its own): run in full and drop the timeline
+        res = SimulationEngine(scheduler).run(table)
+        return SimulationResult(timeline=[], context_switches=res.context_switches, idle_cycles=res.idle_cycles,
+                                metrics=res.metrics, energy=res.energy, distributions=res.distributions)
+    return StreamingEngine(scheduler).run(table[i] for i in table.arrival_order())
+
+def write_timeline(path: str, result: SimulationResult, fmt: str):
+    if fmt == "binary":
+        write_result(path, result)
+    elif fmt == "csv":
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(("start", "end", "pid"))
+            writer.writerows(result.timeline)
+    else:
+        with open(path, "w") as f:
+            for s, e, pid in result.timeline:
+                f.write(json.dumps({"start": s, "end": e, "pid": pid}) + "\n")
+
+def run_job(job: Job) -> List[dict]:
+    """Run every scheduler on one file; returns its summary records."""
+    try:
+        table = job.table if job.table is not None else read_workload(job.path, job.fmt or detect_format(job.path))
+    except Exception as exc:  # unreadable input: recorded, the batch goes on
+        return [{"file": job.path, "error": f"{type(exc).__name__}: {exc}"}]
+    rows = []
+    for choice in job.schedulers:
+        row = {"file": job.path, "scheduler": choice[0], "params": dict(choice[1]), "tasks": len(table)}
+        try:
+            scheduler = make_scheduler(choice)
+            row["params"] = {k: getattr(scheduler, k, v) for k, v in choice[1]}  # coerced values
+            t0 = time.perf_counter()
+            if job.materialize:
+                res = SimulationEngine(scheduler).run(table.reset())
+            else:
+                res = aggregate_only(scheduler, table)
+            row["seconds"] = time.perf_counter() - t0
+            row["energy"] = rescore_energy(res, job.energy)
+            row["context_switches"] = res.context_switches
+            row["idle_cycles"] = res.idle_cycles
+            row.update(res.metrics)
+            if job.materialize and job.out_dir and job.timelines != "none":
+                path = os.path.join(job.out_dir, f"{job.name}.{_label(choice)}{TIMELINE_EXTENSIONS[job.timelines]}")
+                write_timeline(path, res, job.timelines)
+                row["timeline"] = path
+        except Exception as exc:
+            row["error"] = f"{type(exc).__name__}: {exc}"
+        rows.append(row)
+    return rows
+
+def run_batch(jobs: Sequence[Job], workers: int) -> Iterator[List[dict]]:
+    """Summary records per file, in completion order."""
+    if workers <= 1 or len(jobs) <= 1:
+        for job in jobs:
+            yield run_job(job)
+        return
+    with multiprocessing.Pool(min(workers, len(jobs))) as pool:
+        yield from pool.imap_unordered(run_job, jobs)
+
+
+# ---- output ----
+
+class _SummaryWriter:
+    def __init__(self, stream, fmt: str):
+        self.stream = stream
+        self.csv = csv.DictWriter(stream, SUMMARY_FIELDS, extrasaction="ignore") if fmt == "csv" else None
+        if self.csv is not None:
+            self.csv.writeheader()
+
+    def write(self, row: dict):
+        if self.csv is not None:
+            self.csv.writerow(dict(row, params=json.dumps(row.get("params", {}))))
+        else:
+            self.stream.write(json.dumps(row) + "\n")
+        self.stream.flush()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run schedulers over workload files")
+    parser.add_argument("inputs", nargs="+", metavar="TRACE", help="CSV/JSONL/binary task files, directories or -")
+    parser.add_argument("-s", "--scheduler", action="append", dest="schedulers", metavar="NAME[:k=v,...]")
+    parser.add_argument("--format", choices=("csv", "jsonl", "binary"), help="input format (default: by extension)")
+    parser.add_argument("-o", "--output", metavar="DIR")
+    parser.add_argument("--timelines", choices=("binary", "csv", "jsonl", "none"), default="binary")
+    parser.add_argument("--no-timeline", action="store_true", help="aggregates only; never build timelines")
+    parser.add_argument("--summary-format", choices=("jsonl", "csv"), default="jsonl")
+    parser.add_argument("--alpha", type=float, default=DEFAULT_ENERGY_PARAMS.alpha)
+    parser.add_argument("--beta", type=float, default=DEFAULT_ENERGY_PARAMS.beta)
+    parser.add_argument("--gamma", type=float, default=DEFAULT_ENERGY_PARAMS.gamma)
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    try:
+        choices = tuple(parse_scheduler(s) for s in args.schedulers or REGISTRY)
+        for choice in choices:
+            make_scheduler(choice)  # fail fast on unknown names or bad values
+    except (KeyError, ValueError, TypeError) as exc:
+        parser.error(str(exc.args[0] if isinstance(exc, KeyError) else exc))
+
+    paths = list(expand_inputs(args.inputs))
+    if paths.count("-") > 1:
+        parser.error("stdin can only be read once")
+    energy = DEFAULT_ENERGY_PARAMS._replace(alpha=args.alpha, beta=args.beta, gamma=args.gamma)
+    if args.output:
+        os.makedirs(args.output, exist_ok=True)
+    jobs = []
+    for path, name in zip(paths, _unique_names(paths)):
+        table = read_stdin(args.format) if path == "-" else None
+        jobs.append(Job(path, args.format, name, choices, energy, args.output, args.timelines,
+                        not args.no_timeline, table))
+
+    failed = 0
+    summary_path = os.path.join(args.output, f"summary.{args.summary_format}") if args.output else None
+    output = open(summary_path, "w", newline="") if summary_path else contextlib.nullcontext(sys.stdout)
+    with output as stream:
+        writer = _SummaryWriter(stream, args.summary_format)
+        for rows in run_batch(jobs, args.jobs):
+            for row in rows:
+                if "error" in row:
+                    failed += 1
+                    print(f"{row['file']}: {row.get('scheduler', 'read')}: {row['error']}", file=sys.stderr)
+                writer.write(row)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,38 @@
+# benchmarks/bench_srtf.py
+"""
+Scaling benchmark for the event-driven SRTF scheduler.
+
+    python -m benchmarks.bench_srtf [max_exponent]
+
+Runs SRTF on seeded random workloads of 10^3 .. 10^max_exponent tasks
+(default 6), once with short bursts and once with bursts up to 10^6, and
+prints wall time and tasks/sec. Because the loop advances per event rather
+than per time unit, long bursts should cost about the same as short ones.
+"""
+import sys
+import time
+from core.task_table import TaskTable
+from core.workloads import UniformArrivals, UniformBursts, Workload
+from schedulers.srtf import SRTF
+
+
+def make_workload(n: int, max_burst: int, seed: int = 0) -> TaskTable:
+    # keep the CPU roughly saturated: mean inter-arrival ~ mean burst
+    horizon = n * (max_burst + 1) // 2
+    return Workload(UniformArrivals(0, horizon - 1), UniformBursts(1, max_burst)).generate(seed, n)
+
+
+def main(max_exp: int = 6):
+    print(f"{'tasks':>10} {'max_burst':>10} {'seconds':>9} {'tasks/sec':>12} {'slices':>10}")
+    for exp in range(3, max_exp + 1):
+        n = 10 ** exp
+        for max_burst in (10, 10 ** 6):
+            table = make_workload(n, max_burst, seed=exp)
+            t0 = time.perf_counter()
+            res = SRTF().run(table)
+            dt = time.perf_counter() - t0
+            print(f"{n:>10} {max_burst:>10} {dt:>9.3f} {n / dt:>12.0f} {len(res.timeline):>10}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 6)
@@ -0,0 +1,175 @@
+# benchmarks/suite.py
+"""
+Benchmark suite for every scheduler and for the metrics pass.
+
+    python -m benchmarks.suite [--min-exp 3] [--max-exp 5] [--dists uniform,pareto,bursty]
+                               [--schedulers FCFS,SRTF,...] [--repeat 3]
+                               [--save BASELINE.json] [--baseline BASELINE.json] [--threshold 0.2]
+
+For each distribution (see benchmarks/workloads.py), size 10^min_exp ..
+10^max_exp and scheduler, it times the simulation and, separately, its
+evaluation: Scheduler.run with a timing-only Probe, whose "evaluate" phase
+(evaluate_simulation over the produced timeline) is subtracted from the
+run. It reports tasks/sec for both, the timeline length and the peak RSS. Times are the best of --repeat
+runs. Each case runs in a fresh worker process so that the peak RSS belongs
+to that case alone; --no-isolate runs everything in-process.
+
+--save writes the results as a JSON baseline. --baseline compares against
+one and exits with status 1 if any throughput fell by more than
+--threshold (a fraction, default 0.2). Baselines are machine specific, so
+they are not checked in.
+"""
+import argparse
+import json
+import multiprocessing
+import platform
+import sys
+import time
+from typing import Dict, List, Optional, Sequence
+from benchmarks.workloads import GENERATORS
+from core.kernel import Probe
+from evaluation.sweep import SCHEDULERS
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+THROUGHPUT_FIELDS = ("tasks_per_sec", "eval_tasks_per_sec")
+
+
+def _peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and KiB elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_case(case) -> dict:
+    """Time one (scheduler, distribution, size) case; best of `repeat` runs."""
+    scheduler, dist, n, seed, repeat = case
+    table = GENERATORS[dist](n, seed)
+    make = SCHEDULERS[scheduler]
+    best_run = best_eval = float("inf")
+    for _ in range(repeat):
+        run_table = table.reset()
+        # times the setup and evaluation phases without wrapping the per-slice calls
+        probe = Probe(count=False)
+        t0 = time.perf_counter()
+        res = make().run(run_table, probe=probe)
+        elapsed = time.perf_counter() - t0
+        evaluate = probe.phases["evaluate"]
+        best_run = min(best_run, elapsed - evaluate)
+        best_eval = min(best_eval, evaluate)
+    return {
+        "scheduler": scheduler,
+        "dist": dist,
+        "tasks": n,
+        "seconds": best_run,
+        "tasks_per_sec": n / best_run if best_run else float("inf"),
+        "eval_seconds": best_eval,
+        "eval_tasks_per_sec": n / best_eval if best_eval else float("inf"),
+        "timeline_len": len(res.timeline),
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def case_key(row: dict) -> str:
+    return f"{row['scheduler']}/{row['dist']}/{row['tasks']}"
+
+
+def run_suite(schedulers: Sequence[str], dists: Sequence[str], min_exp: int, max_exp: int,
+              repeat: int = 3, seed: int = 0, isolate: bool = True):
+    """Yield one result row per case, smallest workloads first."""
+    cases = [(s, d, 10 ** e, seed + e, repeat)
+             for e in range(min_exp, max_exp + 1) for d in dists for s in schedulers]
+    if not isolate:
+        for case in cases:
+            yield run_case(case)
+        return
+    with multiprocessing.Pool(1, maxtasksperchild=1) as pool:
+        yield from pool.imap(run_case, cases)
+
+
+def save_baseline(path: str, rows: List[dict]):
+    doc = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {case_key(r): r for r in rows},
+    }
+    with open(path, "w") as f:
+        json.dump(doc, f, indent=2)
+
+
+def load_baseline(path: str) -> Dict[str, dict]:
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def compare(rows: List[dict], baseline: Dict[str, dict], threshold: float) -> List[str]:
+    """Messages for every throughput that fell more than `threshold` below its baseline."""
+    regressions = []
+    for row in rows:
+        ref = baseline.get(case_key(row))
+        if ref is None:
+            continue
+        for fld in THROUGHPUT_FIELDS:
+            old, new = ref.get(fld), row[fld]
+            if old and new < old * (1 - threshold):
+                regressions.append(f"{case_key(row)} {fld}: {new:,.0f} vs baseline {old:,.0f} "
+                                   f"({(new / old - 1) * 100:+.1f}%)")
+    return regressions
+
+
+def _print_row(row: dict):
+    rss = row["peak_rss_mb"]
+    print(f"{row['scheduler']:>12} {row['dist']:>8} {row['tasks']:>9} {row['seconds']:>9.3f} "
+          f"{row['tasks_per_sec']:>12.0f} {row['eval_tasks_per_sec']:>12.0f} {row['timeline_len']:>10} "
+          f"{'-' if rss is None else f'{rss:.1f}':>9}", flush=True)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Scheduler benchmark suite")
+    parser.add_argument("--min-exp", type=int, default=3)
+    parser.add_argument("--max-exp", type=int, default=5)
+    parser.add_argument("--dists", default=",".join(GENERATORS))
+    parser.add_argument("--schedulers", default=",".join(SCHEDULERS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-isolate", action="store_true")
+    parser.add_argument("--save", metavar="PATH")
+    parser.add_argument("--baseline", metavar="PATH")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    schedulers = args.schedulers.split(",")
+    dists = args.dists.split(",")
+    for name in schedulers:
+        if name not in SCHEDULERS:
+            parser.error(f"unknown scheduler {name!r} (choose from {', '.join(SCHEDULERS)})")
+    for name in dists:
+        if name not in GENERATORS:
+            parser.error(f"unknown distribution {name!r} (choose from {', '.join(GENERATORS)})")
+
+    print(f"{'scheduler':>12} {'dist':>8} {'tasks':>9} {'seconds':>9} {'tasks/sec':>12} "
+          f"{'eval t/s':>12} {'timeline':>10} {'rss MB':>9}")
+    rows = []
+    for row in run_suite(schedulers, dists, args.min_exp, args.max_exp, args.repeat, args.seed,
+                         isolate=not args.no_isolate):
+        _print_row(row)
+        rows.append(row)
+
+    if args.save:
+        save_baseline(args.save, rows)
+    if args.baseline:
+        regressions = compare(rows, load_baseline(args.baseline), args.threshold)
+        for msg in regressions:
+            print("REGRESSION", msg)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
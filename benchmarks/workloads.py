@@ -0,0 +1,46 @@
+# benchmarks/workloads.py
+"""
+Seeded synthetic workloads for the benchmark suite, built from the
+generators in core.workloads (so they need NumPy).
+
+Every generator takes (n, seed, load) and returns a TaskTable whose arrivals
+keep the CPU at roughly `load` utilisation, so schedulers see a realistic
+mix of idle gaps and queueing at every size.
+
+    uniform  bursts uniform in 1..20, arrivals uniform over the horizon
+    pareto   Pareto(1.5) bursts (heavy tail, capped), Poisson arrivals
+    bursty   clusters of near-simultaneous arrivals separated by long gaps
+             (a two-phase MMPP), bimodal bursts (mostly short, some long)
+"""
+from typing import Callable, Dict
+from core.task_table import TaskTable
+from core.workloads import MMPP, Bimodal, Pareto, Poisson, PriorityMix, UniformArrivals, UniformBursts, Workload
+
+PRIORITIES = PriorityMix({p: 1 for p in range(10)})
+
+
+def uniform(n: int, seed: int = 0, load: float = 0.9) -> TaskTable:
+    horizon = max(1, int(n * 10.5 / load))
+    return Workload(UniformArrivals(0, horizon - 1), UniformBursts(1, 20), PRIORITIES).generate(seed, n)
+
+
+def pareto(n: int, seed: int = 0, load: float = 0.9, alpha: float = 1.5, cap: int = 10_000) -> TaskTable:
+    # mean of the Pareto(alpha) draw, plus about half a unit for rounding bursts up
+    mean_burst = alpha / (alpha - 1) + 0.5
+    return Workload(Poisson(load / mean_burst), Pareto(alpha, cap=cap), PRIORITIES).generate(seed, n)
+
+
+def bursty(n: int, seed: int = 0, load: float = 0.9, cluster: int = 64) -> TaskTable:
+    bursts = Bimodal((1, 5), (50, 200), 0.1)
+    mean_burst = 0.9 * 3 + 0.1 * 125
+    # a busy phase of ~`cluster` arrivals within 4 time units, then a quiet
+    # phase long enough for the CPU to catch up to `load`
+    arrivals = MMPP((0.0, cluster / 4), (cluster * mean_burst / load, 4.0))
+    return Workload(arrivals, bursts, PRIORITIES).generate(seed, n)
+
+
+GENERATORS: Dict[str, Callable[..., TaskTable]] = {
+    "uniform": uniform,
+    "pareto": pareto,
+    "bursty": bursty,
+}
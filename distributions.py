@@ -0,0 +1,394 @@
+# evaluation/distributions.py
+"""
+Per-task latency distributions in bounded memory.
+
+Each measure (response, queueing, turnaround, slowdown) is tracked by a
+Distribution: a KLL-style QuantileSketch for percentiles plus a
+fixed-size LogHistogram for the shape. Both are mergeable, so per-run
+distributions can be pooled across parallel replications or CPUs, and
+both keep a size that does not grow with the number of tasks. The sketch
+holds every value until it has seen `k` of them, so percentiles of small
+workloads are exact.
+
+    response    start - arrival (the quantity behind avg_wait)
+    queueing    turnaround - burst: all time spent ready but not running,
+                including after preemptions (not the avg_wait quantity)
+    turnaround  completion - arrival
+    slowdown    turnaround / burst (bursts below 1 count as 1)
+"""
+import math
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from core.task_table import NO_TIME, TaskTable
+
+try:
+    import numpy as np
+except ImportError:  # per-task Python loops below
+    np = None
+
+MEASURES = ("response", "queueing", "turnaround", "slowdown")
+PERCENTILES = (50, 95, 99)
+
+Distributions = Dict[str, "Distribution"]
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch after Karnin, Lang and Liberty (KLL). Level h
+    holds items of weight 2^h; a level that outgrows its capacity is sorted
+    and every other item moves up a level. Capacities shrink by 2/3 per
+    level below the top, so the size stays O(k) and a quantile's rank error
+    is about n / k. Compaction offsets alternate instead of being random,
+    which makes the sketch deterministic for a given input order.
+
+    quantile(q) is the nearest-rank percentile: the smallest value whose
+    (weighted) rank reaches ceil(q * count). Up to `k` values nothing is
+    compacted and the answer is exact.
+    """
+    __slots__ = ("k", "levels", "count", "min", "max", "_offsets")
+
+    def __init__(self, k: int = 1024):
+        self.k = k
+        self.levels: List[List[float]] = [[]]
+        self.count = 0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self._offsets = [0]
+
+    @classmethod
+    def from_values(cls, values, k: int = 1024) -> "QuantileSketch":
+        """Sketch of a NumPy array in one sort: equal-weight chunks of the sorted values, one item each."""
+        sketch = cls(k)
+        n = len(values)
+        if n == 0:
+            return sketch
+        ordered = np.sort(values)
+        sketch.count = n
+        sketch.min, sketch.max = ordered[0].item(), ordered[-1].item()
+        if n <= k:
+            sketch.levels[0] = ordered.tolist()
+            return sketch
+        top = (n // k).bit_length()  # chunks of 2^top: at most k of them
+        width = 1 << top
+        full = n >> top
+        sketch.levels = [[] for _ in range(top + 1)]
+        sketch._offsets = [0] * (top + 1)
+        sketch.levels[top] = ordered[width // 2:full * width:width].tolist()
+        # the remaining tail, split into chunks by the binary digits of its length
+        pos = full * width
+        for h in range(top - 1, -1, -1):
+            if (n - full * width) >> h & 1:
+                sketch.levels[h].append(ordered[pos + (1 << h) // 2].item())
+                pos += 1 << h
+        return sketch
+
+    def copy(self) -> "QuantileSketch":
+        """Independent sketch in the same state, at the cost of its O(k) items."""
+        other = QuantileSketch(self.k)
+        other.levels = [list(level) for level in self.levels]
+        other.count, other.min, other.max = self.count, self.min, self.max
+        other._offsets = list(self._offsets)
+        return other
+
+    def _capacity(self, h: int) -> int:
+        return max(2, int(self.k * (2 / 3) ** (len(self.levels) - 1 - h)))
+
+    def add(self, x: float):
+        self.levels[0].append(x)
+        self.count += 1
+        if self.min is None or x < self.min:
+            self.min = x
+        if self.max is None or x > self.max:
+            self.max = x
+        if len(self.levels[0]) > self._capacity(0):
+            self._compress()
+
+    def extend(self, values: List[float]):
+        """add() for a batch of values: one compaction pass instead of one per overflow."""
+        if not values:
+            return
+        self.levels[0].extend(values)
+        self.count += len(values)
+        low, high = min(values), max(values)
+        if self.min is None or low < self.min:
+            self.min = low
+        if self.max is None or high > self.max:
+            self.max = high
+        self._compress()
+
+    def merge(self, other: "QuantileSketch"):
+        """Add everything `other` has seen; `other` is left unchanged."""
+        if other.count == 0:
+            return
+        while len(self.levels) < len(other.levels):
+            self.levels.append([])
+            self._offsets.append(0)
+        for level, items in zip(self.levels, other.levels):
+            level.extend(items)
+        self.count += other.count
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self._compress()
+
+    def _compress(self):
+        h = 0
+        while h < len(self.levels):
+            level = self.levels[h]
+            if len(level) > self._capacity(h):
+                if h + 1 == len(self.levels):
+                    self.levels.append([])
+                    self._offsets.append(0)
+                level.sort()
+                # an odd item out stays behind so the total weight is unchanged
+                rest = [level.pop()] if len(level) % 2 else []
+                self.levels[h + 1].extend(level[self._offsets[h]::2])
+                self._offsets[h] ^= 1
+                self.levels[h] = rest
+            h += 1
+
+    @property
+    def exact(self) -> bool:
+        return len(self.levels) == 1
+
+    def __len__(self) -> int:
+        return self.count
+
+    def quantiles(self, qs: Sequence[float]) -> List[Optional[float]]:
+        """Nearest-rank quantile for each q in [0, 1]; None for an empty sketch."""
+        if self.count == 0:
+            return [None for _ in qs]
+        items = sorted((x, 1 << h) for h, level in enumerate(self.levels) for x in level)
+        out = []
+        for q in qs:
+            if q <= 0:
+                out.append(self.min)
+                continue
+            if q >= 1:
+                out.append(self.max)
+                continue
+            rank = max(1, math.ceil(q * self.count))
+            seen = 0
+            for x, w in items:
+                seen += w
+                if seen >= rank:
+                    out.append(x)
+                    break
+            else:
+                out.append(self.max)
+        return out
+
+    def quantile(self, q: float) -> Optional[float]:
+        return self.quantiles((q,))[0]
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, QuantileSketch):
+            return NotImplemented
+        return (self.k, self.count, self.min, self.max, self.levels) == \
+               (other.k, other.count, other.min, other.max, other.levels)
+
+    def __repr__(self):
+        return f"QuantileSketch(k={self.k}, count={self.count}, items={sum(map(len, self.levels))})"
+
+
+class LogHistogram:
+    """
+    Histogram with a fixed number of geometric bins: [0, low), then
+    [low * growth^(i-1), low * growth^i) for i = 1..bins, then an overflow
+    bin. The default covers 1 .. ~2.5e12 within 25% per bin in 130 counters.
+    Histograms with the same layout merge by adding counts.
+    """
+    __slots__ = ("low", "growth", "counts", "_log_growth")
+
+    def __init__(self, low: float = 1.0, growth: float = 1.25, bins: int = 128):
+        self.low = low
+        self.growth = growth
+        self.counts = array("q", bytes(8 * (bins + 2)))
+        self._log_growth = math.log(growth)
+
+    def index(self, x: float) -> int:
+        if x < self.low:
+            return 0
+        return min(int(math.log(x / self.low) / self._log_growth) + 1, len(self.counts) - 1)
+
+    def add(self, x: float):
+        self.counts[self.index(x)] += 1
+
+    def extend(self, values):
+        """Count a sequence or NumPy array of values, in one NumPy pass when available."""
+        if not len(values):
+            return
+        if np is None:
+            for x in values:
+                self.add(x)
+            return
+        x = np.asarray(values, dtype=float)
+        idx = np.zeros(len(x), dtype=np.int64)
+        above = x >= self.low
+        idx[above] = np.minimum(np.log(x[above] / self.low) / self._log_growth + 1, len(self.counts) - 1)
+        for i, c in enumerate(np.bincount(idx, minlength=len(self.counts)).tolist()):
+            self.counts[i] += c
+
+    def copy(self) -> "LogHistogram":
+        other = LogHistogram.__new__(LogHistogram)
+        other.low, other.growth, other._log_growth = self.low, self.growth, self._log_growth
+        other.counts = array("q", self.counts)
+        return other
+
+    def merge(self, other: "LogHistogram"):
+        if (other.low, other.growth, len(other.counts)) != (self.low, self.growth, len(self.counts)):
+            raise ValueError("cannot merge histograms with different bins")
+        for i, c in enumerate(other.counts):
+            self.counts[i] += c
+
+    def bins(self) -> Iterable[Tuple[float, float, int]]:
+        """(lower, upper, count) of every bin, the last one open-ended."""
+        last = len(self.counts) - 1
+        for i, c in enumerate(self.counts):
+            lower = 0.0 if i == 0 else self.low * self.growth ** (i - 1)
+            upper = math.inf if i == last else self.low * self.growth ** i
+            yield lower, upper, c
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, LogHistogram):
+            return NotImplemented
+        return (self.low, self.growth, self.counts) == (other.low, other.growth, other.counts)
+
+
+class Distribution:
+    """
+    Sketch, histogram and running sum of one per-task measure. add() only
+    buffers; the buffer goes into the sketch and histogram in batches of
+    FLUSH_EVERY values, or before anything reads them.
+    """
+    __slots__ = ("_sketch", "_histogram", "_total", "_pending")
+    FLUSH_EVERY = 4096
+
+    def __init__(self, k: int = 1024):
+        self._sketch = QuantileSketch(k)
+        self._histogram = LogHistogram()
+        self._total = 0
+        self._pending: List[float] = []
+
+    @classmethod
+    def from_values(cls, values, k: int = 1024) -> "Distribution":
+        dist = cls(k)
+        dist._sketch = QuantileSketch.from_values(values, k)
+        dist._histogram.extend(values)
+        dist._total = values.sum().item() if len(values) else 0
+        return dist
+
+    def add(self, x: float):
+        pending = self._pending
+        pending.append(x)
+        if len(pending) >= self.FLUSH_EVERY:
+            self.flush()
+
+    def flush(self):
+        values = self._pending
+        if values:
+            self._pending = []
+            self._sketch.extend(values)
+            self._histogram.extend(values)
+            self._total += sum(values)
+
+    def copy(self) -> "Distribution":
+        """Independent copy, unflushed values included, so both continue identically."""
+        other = Distribution.__new__(Distribution)
+        other._sketch = self._sketch.copy()
+        other._histogram = self._histogram.copy()
+        other._total = self._total
+        other._pending = list(self._pending)
+        return other
+
+    def merge(self, other: "Distribution"):
+        self.flush()
+        other.flush()
+        self._sketch.merge(other._sketch)
+        self._histogram.merge(other._histogram)
+        self._total += other._total
+
+    @property
+    def sketch(self) -> QuantileSketch:
+        self.flush()
+        return self._sketch
+
+    @property
+    def histogram(self) -> LogHistogram:
+        self.flush()
+        return self._histogram
+
+    @property
+    def total(self) -> float:
+        self.flush()
+        return self._total
+
+    @property
+    def count(self) -> int:
+        return self._sketch.count + len(self._pending)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> Optional[float]:
+        return self.sketch.quantile(q)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Distribution):
+            return NotImplemented
+        self.flush()
+        other.flush()
+        return (self._sketch, self._histogram, self._total) == (other._sketch, other._histogram, other._total)
+
+    def __repr__(self):
+        return f"Distribution(count={self.count}, mean={self.mean:.3f})"
+
+
+def new_distributions() -> Distributions:
+    return {m: Distribution() for m in MEASURES}
+
+def add_task(dists: Distributions, arrival: int, burst: int, start: Optional[int], completion: int):
+    """Record one finished task (start None: it never ran, so it has no response time)."""
+    turnaround = completion - arrival
+    if start is not None:
+        dists["response"].add(start - arrival)
+    dists["queueing"].add(turnaround - burst)
+    dists["turnaround"].add(turnaround)
+    dists["slowdown"].add(turnaround / max(burst, 1))
+
+def copy_distributions(dists: Distributions) -> Distributions:
+    return {m: dist.copy() for m, dist in dists.items()}
+
+def merge_distributions(into: Distributions, other: Distributions) -> Distributions:
+    for m, dist in other.items():
+        into[m].merge(dist)
+    return into
+
+def table_distributions(table: TaskTable) -> Distributions:
+    """Distributions of a finished run, from the TaskTable's columns."""
+    if np is None or not len(table):
+        dists = new_distributions()
+        for a, b, s, c in zip(table.arrival, table.burst, table.start_time, table.completion_time):
+            add_task(dists, a, b, None if s == NO_TIME else s, c)
+        return dists
+    arrival = np.frombuffer(table.arrival, dtype=np.int64)
+    burst = np.frombuffer(table.burst, dtype=np.int64)
+    start = np.frombuffer(table.start_time, dtype=np.int64)
+    turnaround = np.frombuffer(table.completion_time, dtype=np.int64) - arrival
+    return {
+        "response": Distribution.from_values((start - arrival)[start != NO_TIME]),
+        "queueing": Distribution.from_values(turnaround - burst),
+        "turnaround": Distribution.from_values(turnaround),
+        "slowdown": Distribution.from_values(turnaround / np.maximum(burst, 1)),
+    }
+
+def distribution_metrics(dists: Distributions) -> Dict[str, float]:
+    """{measure}_p50/_p95/_p99/_max for every measure (0 when it has no values)."""
+    metrics = {}
+    for m in MEASURES:
+        sketch = dists[m].sketch
+        values = sketch.quantiles([p / 100 for p in PERCENTILES] + [1.0])
+        for p, v in zip(PERCENTILES, values):
+            metrics[f"{m}_p{p}"] = v if v is not None else 0
+        metrics[f"{m}_max"] = values[-1] if values[-1] is not None else 0
+    return metrics
@@ -0,0 +1,168 @@
+# core/incremental.py
+import bisect
+from typing import Callable, List, NamedTuple, Optional, Tuple
+from core.task import Task
+from core.background import CancelToken, SimulationCancelled
+from core.task_table import TaskTable, Workload
+from core.simulation_result import SimulationResult
+from core.simulation_engine import SimulationEngine
+from core.streaming import Completion, LoopSnapshot, Segment, StreamingEngine
+from schedulers.base import Scheduler
+
+
+class Checkpoint(NamedTuple):
+    time: int
+    state: LoopSnapshot
+    timeline_len: int
+    completions_len: int
+
+
+def _key(t: Task) -> Tuple[str, int, int, int]:
+    return t.pid, t.arrival, t.burst, t.priority
+
+
+class IncrementalSimulator:
+    """
+    Re-simulates a workload after edits by resuming from a checkpoint
+    instead of starting again from t=0.
+
+    The schedule up to time T depends only on tasks arriving by T, so after
+    an edit whose earliest affected arrival is A, the latest checkpoint taken
+    before A is still valid. Its timeline prefix is kept and the run resumes
+    from there, so the cost is proportional to the changed suffix.
+    Checkpoints are compact LoopSnapshots taken every `checkpoint_every`
+    slices, or every so many slices as the engine holds tasks when it holds
+    more, so checkpointing adds linear time and memory.
+
+    lazy=True only checkpoints once resuming can pay off: a workload with
+    no earlier version sharing a prefix with it (the first run, or one that
+    changed from its earliest arrival on) gets a plain batch run, and only
+    re-runs after an edit go through the streaming engine with checkpoints.
+    That batch run polls `cancel` and reports progress from inside the
+    kernel loop just the same.
+    """
+    PROGRESS_EVERY = 4096
+    def __init__(self, scheduler: Scheduler, checkpoint_every: int = 256, lazy: bool = False):
+        self.engine = StreamingEngine(scheduler)
+        self.checkpoint_every = checkpoint_every
+        self.lazy = lazy
+        self.reset()
+
+    def reset(self):
+        self._tasks: List[Task] = []
+        self._checkpoints: List[Checkpoint] = []
+        self._checkpoint_times: List[int] = []
+        self.timeline: List[Segment] = []
+        self.completions: List[Completion] = []
+        self._result: Optional[SimulationResult] = None
+        # time the last run resumed from (None: full run or cache hit)
+        self.resumed_at: Optional[int] = None
+
+    def _record(self, state: LoopSnapshot):
+        self._checkpoints.append(Checkpoint(state.time, state, len(self.timeline), len(self.completions)))
+        self._checkpoint_times.append(state.time)
+
+    def _first_change(self, tasks: List[Task]) -> Optional[int]:
+        """Earliest arrival affected by the edit, or None if nothing changed."""
+        old = self._tasks
+        for a, b in zip(old, tasks):
+            if _key(a) != _key(b):
+                return min(a.arrival, b.arrival)
+        if len(old) == len(tasks):
+            return None
+        return (old[len(tasks)] if len(old) > len(tasks) else tasks[len(old)]).arrival
+
+    def run(self, tasks: Workload, cancel: Optional[CancelToken] = None,
+            progress: Optional[Callable[[int, int], None]] = None) -> SimulationResult:
+        """
+        Simulate `tasks`, reusing the previous run where possible. progress
+        receives (completed tasks, total tasks) every PROGRESS_EVERY events;
+        self.timeline holds everything produced so far when it is called.
+        A cancelled run raises SimulationCancelled and leaves the simulator
+        reset, so the next run starts from scratch.
+        """
+        if isinstance(tasks, TaskTable):
+            tasks = tasks.to_tasks()
+        tasks = sorted(tasks, key=lambda t: t.arrival)
+
+        resume: Optional[Checkpoint] = None
+        fresh = True  # nothing of the previous run could be kept
+        if self._result is not None:
+            changed_at = self._first_change(tasks)
+            if changed_at is None:
+                return self._result
+            if self._tasks and tasks:
+                fresh = changed_at <= min(self._tasks[0].arrival, tasks[0].arrival)
+            # latest checkpoint strictly before the change
+            k = bisect.bisect_left(self._checkpoint_times, changed_at)
+            if k:
+                resume = self._checkpoints[k - 1]
+                del self._checkpoints[k:]
+                del self._checkpoint_times[k:]
+
+        if resume is None and fresh and self.lazy:
+            return self._run_plain(tasks, cancel, progress)
+
+        if resume is None:
+            self._checkpoints.clear()
+            self._checkpoint_times.clear()
+            del self.timeline[:]
+            del self.completions[:]
+            state, start = None, 0
+            self.resumed_at = None
+        else:
+            del self.timeline[resume.timeline_len:]
+            del self.completions[resume.completions_len:]
+            # restore() builds fresh objects, so the checkpoint stays reusable for later edits
+            state = resume.state.restore(self.engine.scheduler.policy())
+            start = resume.state.admitted
+            self.resumed_at = resume.time
+
+        self._tasks = tasks
+        total = len(tasks)
+        countdown = self.PROGRESS_EVERY
+        try:
+            for ev in self.engine.events(tasks[start:], resume=state, checkpoint_every=self.checkpoint_every,
+                                         on_checkpoint=self._record, cancel=cancel):
+                if isinstance(ev, Segment):
+                    self.timeline.append(ev)
+                else:
+                    self.completions.append(ev)
+                if progress is not None:
+                    countdown -= 1
+                    if countdown <= 0:
+                        countdown = self.PROGRESS_EVERY
+                        progress(len(self.completions), total)
+        except SimulationCancelled:
+            self.reset()
+            raise
+        if progress is not None:
+            progress(len(self.completions), total)
+
+        result = self.engine.stats.result()
+        result.timeline = list(self.timeline)
+        self._result = result
+        return result
+
+    def _run_plain(self, tasks: List[Task], cancel: Optional[CancelToken],
+                   progress: Optional[Callable[[int, int], None]]) -> SimulationResult:
+        """Batch run without checkpoints (lazy mode, fresh workload); later edits re-run in full once."""
+        self.reset()
+        timeline = self.timeline
+        report = None
+        if progress is not None:
+            def report(done: int, total: int, partial):
+                # all but the last entry, which a compressed timeline may still extend
+                timeline.extend(partial[len(timeline):len(partial) - 1])
+                progress(done, total)
+        try:
+            result = SimulationEngine(self.engine.scheduler).run(tasks, cancel=cancel, progress=report)
+        except SimulationCancelled:
+            self.reset()
+            raise
+        self._tasks = tasks
+        self._result = result
+        if progress is not None:
+            timeline.extend(result.timeline[len(timeline):])
+            progress(len(tasks), len(tasks))
+        return result
@@ -0,0 +1,162 @@
+# core/instrumentation.py
+"""
+Optional instrumentation for scheduler runs.
+
+An instrumented run passes a core.kernel.Probe through Scheduler.run() to
+the kernel, which counts ready-queue pushes and pops, timeline entries,
+dispatches, preemptions, quantum expiries and idle jumps where they happen,
+and times the setup (arrival ordering, policy binding) and evaluation
+phases for that call only; runs without a probe skip the wrapped
+callables, so ordinary runs pay next to nothing. Schedulers whose run()
+takes no probe are still timed as a whole and report only their context
+switches.
+"""
+import cProfile
+import io
+import json
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Union
+from core.task_table import TaskTable, Workload, as_task_table
+from core.simulation_result import SimulationResult
+from core.kernel import Probe
+from schedulers.base import run_options
+
+
+class SamplingProfiler:
+    """
+    Minimal stack-sampling profiler: a background thread records the target
+    thread's stack every `interval` seconds. The effective rate is bounded by
+    the interpreter's switch interval (5 ms by default). stop() returns the
+    per-function sample counts and collapsed stacks (flame graph input).
+    """
+    def __init__(self, interval: float = 0.001, top: int = 25):
+        self.interval = interval
+        self.top = top
+        self._stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._target = 0
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_filename}:{code.co_name}:{frame.f_lineno}")
+                frame = frame.f_back
+            if stack:
+                self._stacks[";".join(reversed(stack))] += 1
+
+    def start(self):
+        self._target = threading.get_ident()
+        self._stop.clear()
+        self._stacks.clear()
+        self._thread = threading.Thread(target=self._sample, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Dict[str, Any]:
+        self._stop.set()
+        self._thread.join()
+        leaf = Counter()
+        for stack, count in self._stacks.items():
+            leaf[stack.rsplit(";", 1)[-1]] += count
+        return {
+            "samples": sum(self._stacks.values()),
+            "interval": self.interval,
+            "top": leaf.most_common(self.top),
+            "stacks": dict(self._stacks),
+        }
+
+
+class _CProfile:
+    """cProfile adapter; stop() returns the top functions by cumulative time as text."""
+    def __init__(self, top: int = 25):
+        self.top = top
+        self._prof = cProfile.Profile()
+
+    def start(self):
+        self._prof.enable()
+
+    def stop(self) -> str:
+        self._prof.disable()
+        out = io.StringIO()
+        pstats.Stats(self._prof, stream=out).sort_stats("cumulative").print_stats(self.top)
+        return out.getvalue()
+
+
+@dataclass
+class RunReport:
+    """Per-run instrumentation report, attached as SimulationResult.report."""
+    scheduler: str
+    tasks: int
+    counters: Dict[str, int] = field(default_factory=dict)
+    phases: Dict[str, float] = field(default_factory=dict)  # seconds
+    profile: Any = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        profile = self.profile
+        try:
+            json.dumps(profile)
+        except TypeError:
+            profile = repr(profile)
+        return {"scheduler": self.scheduler, "tasks": self.tasks, "counters": dict(self.counters),
+                "phases": dict(self.phases), "profile": profile}
+
+
+ProfilerSpec = Union[None, str, Any]
+
+
+class Instrumentation:
+    """
+    Runs a scheduler with event counters and phase timings, optionally under
+    a profiler: "cprofile", "sampling", or any object with start() and
+    stop() (stop()'s return value becomes RunReport.profile).
+    """
+    def __init__(self, profiler: ProfilerSpec = None, top: int = 25, sample_interval: float = 0.001):
+        self.profiler = profiler
+        self.top = top
+        self.sample_interval = sample_interval
+
+    def _make_profiler(self):
+        if self.profiler is None:
+            return None
+        if self.profiler == "cprofile":
+            return _CProfile(self.top)
+        if self.profiler == "sampling":
+            return SamplingProfiler(self.sample_interval, self.top)
+        if isinstance(self.profiler, str):
+            raise ValueError(f"Unknown profiler {self.profiler!r}; use 'cprofile', 'sampling' or an object")
+        return self.profiler
+
+    def run(self, scheduler, tasks: Workload) -> SimulationResult:
+        t0 = time.perf_counter()
+        table = tasks.reset() if isinstance(tasks, TaskTable) else as_task_table(tasks)
+        probe = Probe()
+        wrap = time.perf_counter() - t0
+        profiler = self._make_profiler()
+        kwargs = run_options(scheduler.run, probe=probe)
+
+        if profiler is not None:
+            profiler.start()
+        t1 = time.perf_counter()
+        try:
+            result = scheduler.run(table, **kwargs)
+        finally:
+            total = time.perf_counter() - t1
+            profile = profiler.stop() if profiler is not None else None
+
+        phases = probe.phases
+        # setup so far is the kernel's ordering and binding; add the table conversion
+        phases["loop"] = max(0.0, total - phases["evaluate"] - phases["setup"])
+        phases["setup"] += wrap
+        phases["total"] = time.perf_counter() - t0
+        counters = dict(probe.counters)
+        counters.setdefault("context_switches", result.context_switches)
+        result.report = RunReport(scheduler.name, len(table), counters, phases, profile)
+        return result
@@ -0,0 +1,573 @@
+# core/kernel.py
+"""
+Discrete-event kernel shared by every engine: the single-CPU schedulers,
+the streaming engine and each CPU of the SMP engine run the same loop.
+
+The kernel owns the clock, the arrival cursor, idle gaps, the timeline and
+the counters; a scheduler only supplies a Policy deciding which ready task
+runs next. Time jumps from event to event (arrivals, slice ends), so a run
+costs O(slices + n log n) whatever the burst lengths.
+
+A context switch is counted when the CPU starts running a task other than
+the one whose slice just ended (coming out of idle counts too), so a task
+that is re-dispatched because nothing else is ready keeps its CPU for free.
+
+simulate(..., probe=Probe()) also counts ready-queue operations and
+timeline entries, reports the kernel's event counters and times the setup
+and evaluation phases (see core.instrumentation); runs without a probe
+carry no instrumentation beyond a few integer counters. With a
+CancelToken or a progress callback it pauses every CANCEL_POLL_EVERY
+dispatches to check the token and report how far it got.
+"""
+import heapq
+import itertools
+from collections import Counter, deque
+from operator import attrgetter
+from time import perf_counter
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+from core.background import CancelToken
+from core.task_table import NO_TIME, TaskTable
+from core.simulation_result import SimulationResult, TimelineEntry
+from core.timeline import Timeline
+from evaluation.metrics import evaluate_simulation
+
+INFINITY = float("inf")
+# later than any int64 time: the kernel's own "never", as ints compare faster than a float infinity
+_NEVER = 1 << 63
+
+# slices between checks of a CancelToken (and progress reports)
+CANCEL_POLL_EVERY = 1024
+
+# progress(completed tasks, total tasks, timeline so far)
+Progress = Callable[[int, int, Sequence[TimelineEntry]], None]
+
+
+class Probe:
+    """
+    Counters and phase timings (seconds) collected by the simulate() calls
+    it is passed to. Queue operations and timeline entries are counted by
+    wrapping the kernel's push/pop and emit callables for that call only, so
+    concurrent runs never share state unless they share the probe. Round
+    Robin rounds the kernel fast-forwards involve no queue operations and
+    are not counted as such; the kernel's own event counters
+    (Kernel.counters()) are added when the run ends. count=False only
+    times the phases, leaving the per-slice callables unwrapped.
+    """
+    __slots__ = ("counters", "phases", "count")
+
+    def __init__(self, count: bool = True):
+        self.counters: Counter = Counter()
+        self.phases: Dict[str, float] = {"setup": 0.0, "evaluate": 0.0}
+        self.count = count
+
+    def counting(self, fn: Callable, counter: str) -> Callable:
+        """`fn`, counting its calls under `counter`."""
+        if not self.count:
+            return fn
+        counters = self.counters
+
+        def counted(*args):
+            counters[counter] += 1
+            return fn(*args)
+        return counted
+
+    def counting_entries(self, fn: Callable, counter: str) -> Callable:
+        """`fn` taking a list, counting its items under `counter`."""
+        if not self.count:
+            return fn
+        counters = self.counters
+
+        def counted(entries):
+            counters[counter] += len(entries)
+            return fn(entries)
+        return counted
+
+    def timed(self, phase: str, fn: Callable, *args):
+        """fn(*args), with its duration added to `phase`."""
+        t0 = perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            self.phases[phase] = self.phases.get(phase, 0.0) + perf_counter() - t0
+
+
+class Policy:
+    """
+    Ready-queue discipline for one run over TaskTable rows. bind() is called
+    once before the first enqueue(); the other hooks are the kernel's only
+    calls into scheduler code. operations() may hand the kernel cheaper
+    callables for the two per-slice hooks.
+
+    quantum: slice length (None: run until the task finishes or is preempted)
+    preemptive: consult should_preempt() at every arrival while a task runs
+    split_at_arrivals: cut the running slice at every arrival (timeline only)
+    rotates: enqueue() appends to `ready` and pick_next() takes its oldest
+        entry; lets the kernel skip whole rounds in which nothing changes
+
+    The SMP engine also migrates queued rows with steal(), and the streaming
+    engine checkpoints the queue with snapshot() / restore().
+    """
+    quantum: Optional[int] = None
+    preemptive = False
+    split_at_arrivals = False
+    rotates = False
+
+    def arrival_order(self, table: TaskTable) -> List[int]:
+        return table.arrival_order()
+
+    def bind(self, table: TaskTable):
+        pass
+
+    def enqueue(self, row: int):
+        raise NotImplementedError
+
+    def pick_next(self) -> int:
+        raise NotImplementedError
+
+    def should_preempt(self, row: int, remaining: int) -> bool:
+        """After an arrival: should the running `row` (with `remaining` left) give up the CPU?"""
+        return False
+
+    def operations(self) -> Tuple[Callable[[int], None], Callable[[], int]]:
+        """(enqueue, pick_next) as the kernel will call them, after bind()."""
+        return self.enqueue, self.pick_next
+
+    def steal(self) -> int:
+        """Remove and return some queued row, preferably one cheap to take out (migration)."""
+        raise NotImplementedError(f"{type(self).__name__} does not support migration")
+
+    def snapshot(self):
+        """Copy of the queued rows and ordering state, for restore() on a fresh bound policy."""
+        raise NotImplementedError(f"{type(self).__name__} does not support checkpoints")
+
+    def restore(self, state):
+        """Load a snapshot() into this policy, after bind() and before the kernel starts."""
+        raise NotImplementedError(f"{type(self).__name__} does not support checkpoints")
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+
+class FifoPolicy(Policy):
+    """Ready rows in queue order; with a quantum this is Round Robin."""
+    rotates = True
+
+    def __init__(self, quantum: Optional[int] = None):
+        self.quantum = quantum
+        self.ready: Deque[int] = deque()
+
+    def enqueue(self, row: int):
+        self.ready.append(row)
+
+    def pick_next(self) -> int:
+        return self.ready.popleft()
+
+    def operations(self):
+        # the deque's own methods: no Python frame per slice
+        return self.ready.append, self.ready.popleft
+
+    def steal(self) -> int:
+        """The most recently queued row."""
+        return self.ready.pop()
+
+    def snapshot(self) -> List[int]:
+        return list(self.ready)
+
+    def restore(self, state: List[int]):
+        self.ready.clear()
+        self.ready.extend(state)
+
+    def __len__(self) -> int:
+        return len(self.ready)
+
+
+class HeapPolicy(Policy):
+    """
+    Ready rows ordered by key(row), ties in enqueue order. Subclasses set
+    `keys` in bind() to a column holding each row's key (read when the row
+    is queued, so a live column such as table.remaining works), which keeps
+    key lookups out of Python calls; or they override key().
+
+    A preemptive heap policy yields the CPU to a strictly smaller key.
+    """
+    keys: Optional[Sequence] = None
+
+    def __init__(self):
+        self.heap = []
+        self._seq = itertools.count()
+
+    def key(self, row: int):
+        return self.keys[row]
+
+    def should_preempt(self, row: int, remaining: int) -> bool:
+        return self.heap[0][0] < self.key(row)
+
+    def enqueue(self, row: int):
+        heapq.heappush(self.heap, (self.key(row), next(self._seq), row))
+
+    def pick_next(self) -> int:
+        return heapq.heappop(self.heap)[2]
+
+    def operations(self):
+        heap, keys, seq = self.heap, self.keys, self._seq
+        push, pop = heapq.heappush, heapq.heappop
+        if keys is None:
+            key = self.key
+
+            def enqueue(row: int):
+                push(heap, (key(row), next(seq), row))
+        else:
+            def enqueue(row: int):
+                push(heap, (keys[row], next(seq), row))
+
+        def pick_next() -> int:
+            return pop(heap)[2]
+        return enqueue, pick_next
+
+    def steal(self) -> int:
+        """A row from the last heap slot: a leaf, so taking it out is O(1)."""
+        return self.heap.pop()[2]
+
+    def snapshot(self):
+        # entries are immutable tuples; the next sequence number keeps later ties ordered
+        return list(self.heap), next(self._seq)
+
+    def restore(self, state):
+        entries, seq = state
+        self.heap[:] = entries
+        self._seq = itertools.count(seq)
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+
+# kernel fields saved by Kernel.state(), besides the pending arrivals
+_STATE = ("time", "waiting", "current", "slice_start", "end", "last", "requeue", "slices",
+          "next_skip_check", "context_switches", "idle_cycles", "completed", "preemptions",
+          "quantum_expiries", "idle_jumps")
+_state_of = attrgetter(*_STATE)
+
+
+class Kernel:
+    """
+    The event loop of one CPU: `policy` (already bound) choosing among rows
+    of `table`. Rows enter as arrivals (add_arrivals(), queued when the
+    clock reaches their arrival time) or straight into the ready queue
+    (admit(), how the SMP engine places and migrates tasks). Every slice
+    goes to emit((start, end, pid)); extend() takes the many slices of a
+    fast-forwarded Round Robin stretch at once, and merged=True says the
+    timeline joins consecutive slices of one pid, so a lone task's stretch
+    is emitted as one slice. finished(row), if set, sees each completion.
+    A probe counts queue operations and emitted timeline entries.
+
+    run() may pause and be called again: at `until` (after everything that
+    ends exactly then, before any decision taken at that instant) or before
+    a dispatch once `stop` slices have been dispatched. The streaming engine
+    pauses to read more arrivals, to take checkpoints and to poll for
+    cancellation, and the SMP engine to step its CPUs in lockstep.
+    """
+    def __init__(self, policy: Policy, table: TaskTable, emit: Callable[[TimelineEntry], None],
+                 extend: Optional[Callable[[List[TimelineEntry]], None]] = None, merged: bool = False,
+                 fast: bool = True, finished: Optional[Callable[[int], None]] = None,
+                 probe: Optional[Probe] = None):
+        self.policy = policy
+        self.table = table
+        self._columns = table.pid, table.remaining, table.start_time, table.completion_time
+        if extend is None:
+            def extend(entries):
+                for entry in entries:
+                    emit(entry)
+        if probe is not None:
+            emit = probe.counting(emit, "timeline_entries")
+            extend = probe.counting_entries(extend, "timeline_entries")
+        self.emit, self.extend = emit, extend
+        self.merged = merged
+        self.finished = finished
+        enqueue, pick_next = policy.operations()
+        if probe is not None:
+            kind = "heap" if isinstance(policy, HeapPolicy) else "queue"
+            enqueue, pick_next = probe.counting(enqueue, kind + "_push"), probe.counting(pick_next, kind + "_pop")
+        self._enqueue, self._pick_next = enqueue, pick_next
+        # Round Robin rotation to fast-forward, if allowed
+        self._ready = policy.ready if policy.rotates and policy.quantum and fast else None
+        self.order: List[int] = []  # rows to admit, in admission order
+        self.arrivals: List[int] = [_NEVER]  # their arrival times, with a sentinel that never arrives
+        self.idx = 0  # next entry of order/arrivals
+        self.time = 0
+        self.waiting = 0  # ready rows held by the policy
+        self.current = -1  # row of the running slice, -1 if none
+        self.slice_start = 0
+        self.end = 0  # end of the running slice
+        self.last = -1  # row whose slice ended at `time`; -1 after idle or a completion
+        self.requeue = -1  # row whose slice ended at `time`, to queue behind that instant's arrivals
+        self.slices = 0
+        # slice count before which another round skip can't succeed
+        self.next_skip_check = 0
+        self.context_switches = 0
+        self.idle_cycles = 0
+        self.completed = 0
+        self.preemptions = 0
+        self.quantum_expiries = 0  # slices that ended with work left
+        self.idle_jumps = 0
+
+    def add_arrivals(self, rows: Iterable[int]):
+        """Admit `rows` at their arrival times, after the rows added before (so in arrival order)."""
+        order, arrivals = self.order, self.arrivals
+        if self.idx:
+            # drop the admitted prefix, so a stream holds only what is still to come
+            del order[:self.idx]
+            del arrivals[:self.idx]
+            self.idx = 0
+        rows = list(rows)
+        arrival = self.table.arrival
+        arrivals.pop()
+        order.extend(rows)
+        arrivals.extend([arrival[i] for i in rows])
+        arrivals.append(_NEVER)
+
+    def pending(self) -> List[int]:
+        """Rows added by add_arrivals() and not admitted yet."""
+        return self.order[self.idx:]
+
+    def admit(self, row: int):
+        """Queue `row` now, whatever its arrival time."""
+        self._enqueue(row)
+        self.waiting += 1
+
+    def steal(self) -> int:
+        """Take a queued row out for migration (see Policy.steal)."""
+        self.waiting -= 1
+        return self.policy.steal()
+
+    def flush(self):
+        """Queue the row whose slice ended at `time` now rather than on resuming."""
+        if self.requeue >= 0:
+            self._enqueue(self.requeue)
+            self.waiting += 1
+            self.requeue = -1
+
+    def state(self) -> tuple:
+        """The loop's clock, running slice and counters, for set_state() on a kernel over a copy."""
+        return _state_of(self)
+
+    def set_state(self, state: tuple):
+        """Restore the fields returned by state() (not the pending arrivals)."""
+        for name, value in zip(_STATE, state):
+            setattr(self, name, value)
+
+    def counters(self) -> Dict[str, int]:
+        """The loop's event counts so far."""
+        return {"dispatches": self.slices, "preemptions": self.preemptions,
+                "quantum_expiries": self.quantum_expiries, "idle_jumps": self.idle_jumps,
+                "context_switches": self.context_switches}
+
+    def run(self, until=INFINITY, stop=INFINITY) -> bool:
+        """
+        Simulate up to `until`, or until `stop` slices have been dispatched.
+        True once there is nothing left to run and nothing left to arrive;
+        False if paused.
+        """
+        pids, remaining, start_time, completion_time = self._columns
+        enqueue, pick_next = self._enqueue, self._pick_next
+        policy = self.policy
+        should_preempt = policy.should_preempt
+        emit, extend, merged, finished = self.emit, self.extend, self.merged, self.finished
+        quantum = policy.quantum
+        preemptive, split = policy.preemptive, policy.split_at_arrivals
+        interrupt = preemptive or split
+        ready = self._ready
+        order, arrivals, idx = self.order, self.arrivals, self.idx
+        time, waiting, current = self.time, self.waiting, self.current
+        slice_start, end, last, requeue = self.slice_start, self.end, self.last, self.requeue
+        slices, next_skip_check = self.slices, self.next_skip_check
+        context_switches, idle_cycles, completed = self.context_switches, self.idle_cycles, self.completed
+        preemptions, quantum_expiries, idle_jumps = self.preemptions, self.quantum_expiries, self.idle_jumps
+        done = False
+        unbounded = until == INFINITY
+        if unbounded:
+            until = _NEVER
+        if stop == INFINITY:
+            stop = _NEVER
+
+        while True:
+            while arrivals[idx] <= time:
+                enqueue(order[idx])
+                idx += 1
+                waiting += 1
+            if requeue >= 0:
+                # arrivals during the slice queue ahead of it
+                enqueue(requeue)
+                waiting += 1
+                requeue = -1
+
+            if current < 0:
+                if not waiting:
+                    next_arrival = arrivals[idx]
+                    if next_arrival >= until:
+                        if unbounded:
+                            done = True
+                        elif time < until:
+                            idle_cycles += until - time
+                            idle_jumps += 1
+                            emit((time, until, "IDLE"))
+                            time = until
+                            last = -1
+                        break
+                    idle_cycles += next_arrival - time
+                    idle_jumps += 1
+                    emit((time, next_arrival, "IDLE"))
+                    time = next_arrival
+                    last = -1
+                    continue
+                if slices >= stop:
+                    break
+
+                if ready is not None and slices >= next_skip_check:
+                    # Whole rounds in which nobody finishes and nothing arrives
+                    # leave the rotation order unchanged, so they can be skipped
+                    k = len(ready)
+                    rounds = (min(remaining[i] for i in ready) - 1) // quantum
+                    horizon = arrivals[idx] if arrivals[idx] < until else until
+                    if horizon != _NEVER:
+                        rounds = min(rounds, (horizon - time - 1) // (k * quantum))
+                    if rounds > 0:
+                        names = [pids[i] for i in ready]
+                        for pos, i in enumerate(ready):
+                            if start_time[i] == NO_TIME:
+                                start_time[i] = time + pos * quantum
+                            remaining[i] -= rounds * quantum
+                        if k == 1:
+                            context_switches += ready[0] != last
+                            if merged:
+                                emit((time, time + rounds * quantum, names[0]))
+                            else:
+                                extend([(time + m * quantum, time + (m + 1) * quantum, names[0])
+                                        for m in range(rounds)])
+                        else:
+                            # consecutive slices always belong to different tasks
+                            context_switches += rounds * k - (ready[0] == last)
+                            extend([(time + m * quantum, time + (m + 1) * quantum, names[m % k])
+                                    for m in range(rounds * k)])
+                        slices += rounds * k
+                        quantum_expiries += rounds * k
+                        time += rounds * k * quantum
+                        last = ready[-1]
+                    # a failed check can't succeed again until a full round has passed
+                    next_skip_check = slices + k
+
+                current = pick_next()
+                waiting -= 1
+                slices += 1
+                if current != last:
+                    context_switches += 1
+                if start_time[current] == NO_TIME:
+                    start_time[current] = time
+                slice_start = time
+                run_for = remaining[current]
+                if quantum is not None and quantum < run_for:
+                    run_for = quantum
+                end = time + run_for
+            elif preemptive and waiting and should_preempt(current, remaining[current]):
+                emit((slice_start, time, pids[current]))
+                enqueue(current)
+                waiting += 1
+                preemptions += 1
+                last = current
+                current = -1
+                continue
+
+            i = current
+            if interrupt and arrivals[idx] < end:
+                # run up to the arrival, which may preempt or cut the slice
+                t = arrivals[idx]
+                if t > until:
+                    remaining[i] -= until - time
+                    time = until
+                    break
+                remaining[i] -= t - time
+                time = t
+                if split:
+                    emit((slice_start, t, pids[i]))
+                    slice_start = t
+                if t == until:
+                    break
+                continue
+            if end > until:
+                remaining[i] -= until - time
+                time = until
+                break
+
+            remaining[i] -= end - time
+            time = end
+            emit((slice_start, end, pids[i]))
+            current = -1
+            if remaining[i] > 0:
+                requeue = last = i
+                quantum_expiries += 1
+            else:
+                completion_time[i] = end
+                last = -1
+                completed += 1
+                if finished is not None:
+                    finished(i)
+            if end == until:
+                break
+
+        self.idx, self.time, self.waiting, self.current = idx, time, waiting, current
+        self.slice_start, self.end, self.last, self.requeue = slice_start, end, last, requeue
+        self.slices, self.next_skip_check = slices, next_skip_check
+        self.context_switches, self.idle_cycles, self.completed = context_switches, idle_cycles, completed
+        self.preemptions, self.quantum_expiries, self.idle_jumps = preemptions, quantum_expiries, idle_jumps
+        return done
+
+
+def _evaluate(table: TaskTable, timeline, context_switches: int, idle_cycles: int, name: str,
+              probe: Optional[Probe]) -> SimulationResult:
+    if probe is None:
+        return evaluate_simulation(table, timeline, context_switches, idle_cycles, name)
+    return probe.timed("evaluate", evaluate_simulation, table, timeline, context_switches, idle_cycles, name)
+
+
+def simulate(policy: Policy, table: TaskTable, name: str, compress: bool = False,
+             fast: bool = True, probe: Optional[Probe] = None, cancel: Optional[CancelToken] = None,
+             progress: Optional[Progress] = None) -> SimulationResult:
+    """
+    Run `policy` over `table` (filling its start/completion columns) and
+    evaluate the schedule. compress=True returns a run-length-compressed
+    Timeline; fast=False disables the round skipping of rotating policies;
+    a Probe collects the run's counters and phase timings.
+
+    With `cancel`, SimulationCancelled is raised within CANCEL_POLL_EVERY
+    slices of the token being set; `progress` is called as often with the
+    completed and total task counts and the timeline so far (whose last
+    entry may still grow when compressed).
+    """
+    if probe is None:
+        order = policy.arrival_order(table)
+        policy.bind(table)
+    else:
+        order = probe.timed("setup", policy.arrival_order, table)
+        probe.timed("setup", policy.bind, table)
+    if compress:
+        timeline = Timeline()
+        append = timeline.append
+
+        def emit(entry):
+            append(*entry)
+    else:
+        timeline = []
+        emit = timeline.append
+    kernel = Kernel(policy, table, emit, timeline.extend, merged=compress, fast=fast, probe=probe)
+    kernel.add_arrivals(order)
+    if cancel is None and progress is None:
+        kernel.run()
+    else:
+        total = len(table)
+        while not kernel.run(stop=kernel.slices + CANCEL_POLL_EVERY):
+            if cancel is not None:
+                cancel.raise_if_cancelled()
+            if progress is not None:
+                progress(kernel.completed, total, timeline)
+    if probe is not None:
+        probe.counters.update(kernel.counters())
+    return _evaluate(table, timeline, kernel.context_switches, kernel.idle_cycles, name, probe)
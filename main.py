@@ -1,6 +1,7 @@
 # main.py
 from core.task import Task
-from core.simulation_engine import SimulationEngine
+from core.task_table import TaskTable
+from core.race import RaceRunner
 from schedulers.fcfs import FCFS
 from schedulers.sjf import SJF
 from schedulers.rr import RoundRobin
@@ -15,6 +16,8 @@ def sample_workload():
     ]
 
 def run_race(tasks):
+    # Build the columnar workload once; each engine run gets a cheap reset view
+    table = tasks if isinstance(tasks, TaskTable) else TaskTable.from_tasks(tasks)
     schedulers = [
         FCFS(),
         SJF(),
@@ -23,9 +26,8 @@ def run_race(tasks):
     ]
 
     results = {}
-    for s in schedulers:
-        engine = SimulationEngine(s)
-        res = engine.run(tasks)
+    # Fan the schedulers out across processes; results come back in list order
+    for s, res in RaceRunner(schedulers).iter_results(table):
         results[s.name] = res
         print(f"=== {s.name} ===")
         print(f"Energy: {res.energy:.3f}")
@@ -1,38 +1,119 @@
 # evaluation/metrics.py
-from typing import List, Tuple, Dict
-from core.task import Task
+from array import array
+from typing import List, NamedTuple, Optional, Tuple, Dict
+from core.task_table import NO_TIME, TaskTable, Workload, as_task_table
 from core.simulation_result import SimulationResult
-from evaluation.energy_model import compute_energy, DEFAULT_ENERGY_PARAMS
+from core.timeline import IDLE_INDEX, Timeline
+from evaluation.energy_model import EnergyParams, compute_energy, DEFAULT_ENERGY_PARAMS
+from evaluation.distributions import (Distributions, add_task, distribution_metrics, new_distributions,
+                                      table_distributions)
+
+try:
+    import numpy as np
+except ImportError:  # pure-Python fallback below
+    np = None
 
 TimelineEntry = Tuple[int, int, str]
 
+class CompactTimeline(NamedTuple):
+    """
+    Column form of a timeline: int64 start/end columns plus a pid_index
+    column into the interned `pids` table (IDLE_INDEX for idle slices).
+    """
+    start: array
+    end: array
+    pid_index: array
+    pids: List[str]
+
+    def to_entries(self) -> List[TimelineEntry]:
+        pids = self.pids
+        if np is not None and len(self.pid_index):
+            # one gather: IDLE_INDEX (-1) picks the trailing "IDLE"
+            table = np.empty(len(pids) + 1, dtype=object)
+            table[:-1] = pids
+            table[-1] = "IDLE"
+            names = table[_int_view(self.pid_index)].tolist()
+        else:
+            names = ["IDLE" if k == IDLE_INDEX else pids[k] for k in self.pid_index]
+        return list(zip(self.start, self.end, names))
+
+
+def compact_timeline(timeline: List[TimelineEntry]) -> CompactTimeline:
+    """Intern pids and split (start, end, pid) tuples into columns."""
+    index: Dict[str, int] = {}
+    pids: List[str] = []
+    start = array("q")
+    end = array("q")
+    pid_index = array("q")
+    for s, e, pid in timeline:
+        if pid == "IDLE":
+            k = IDLE_INDEX
+        else:
+            k = index.get(pid)
+            if k is None:
+                k = index[pid] = len(pids)
+                pids.append(pid)
+        start.append(s)
+        end.append(e)
+        pid_index.append(k)
+    return CompactTimeline(start, end, pid_index, pids)
+
+
 def compute_active_cycles(timeline: List[TimelineEntry]) -> int:
     """Sum total time the CPU was executing non-IDLE entries."""
+    if isinstance(timeline, (CompactTimeline, Timeline)):
+        return _compact_span_stats(timeline)[0]
     total = 0
     for s, e, pid in timeline:
         if pid != "IDLE":
             total += (e - s)
     return total
 
-def evaluate_simulation(tasks: List[Task], timeline: List[TimelineEntry], context_switches: int, idle_cycles: int, scheduler_name: str) -> SimulationResult:
-    # Compute per-task metrics
-    n = len(tasks)
-    total_wait = 0
-    total_turnaround = 0
-    for task in tasks:
-        if task.completion_time is None:
-            # Should not happen for well-formed schedulers, but be robust
-            task.completion_time = max(t[1] for t in timeline)
-        turnaround = task.completion_time - task.arrival
-        wait = (task.start_time - task.arrival) if task.start_time is not None else 0
-        total_turnaround += turnaround
-        total_wait += wait
+def _int_view(col: array):
+    return np.frombuffer(col, dtype=f"i{col.itemsize}")
+
+def _compact_span_stats(timeline: CompactTimeline) -> Tuple[int, Optional[int], Optional[int]]:
+    """(active_steps, min_start, max_end) of a CompactTimeline or Timeline in one batched pass."""
+    if not timeline.start:
+        return 0, None, None
+    if np is not None:
+        start = _int_view(timeline.start)
+        end = _int_view(timeline.end)
+        busy = _int_view(timeline.pid_index) != IDLE_INDEX
+        active = int((end - start)[busy].sum())
+        return active, int(start.min()), int(end.max())
+    active = 0
+    for s, e, k in zip(timeline.start, timeline.end, timeline.pid_index):
+        if k != IDLE_INDEX:
+            active += e - s
+    return active, min(timeline.start), max(timeline.end)
+
+def _task_totals(table: TaskTable, fallback_completion: Optional[int]) -> Tuple[int, int]:
+    """Total wait and turnaround computed directly on TaskTable columns."""
+    completion = table.completion_time
+    if NO_TIME in completion:
+        # Should not happen for well-formed schedulers, but be robust
+        for i, c in enumerate(completion):
+            if c == NO_TIME:
+                completion[i] = fallback_completion
+    if np is not None and len(table):
+        arrival = np.frombuffer(table.arrival, dtype=np.int64)
+        start = np.frombuffer(table.start_time, dtype=np.int64)
+        started = start != NO_TIME
+        total_turnaround = int(np.frombuffer(completion, dtype=np.int64).sum() - arrival.sum())
+        total_wait = int((start[started] - arrival[started]).sum())
+        return total_wait, total_turnaround
+    total_turnaround = sum(completion) - sum(table.arrival)
+    total_wait = sum(s - a for s, a in zip(table.start_time, table.arrival) if s != NO_TIME)
+    return total_wait, total_turnaround
 
+def _build_result(n: int, total_wait: int, total_turnaround: int, active_steps: int,
+                  min_start: Optional[int], max_end: Optional[int], timeline: List[TimelineEntry],
+                  context_switches: int, idle_cycles: int, distributions: Distributions) -> SimulationResult:
     avg_wait = total_wait / n if n else 0.0
     avg_turnaround = total_turnaround / n if n else 0.0
-    throughput = n / (max(e for _, e, _ in timeline) - min(s for s, _, _ in timeline)) if timeline else 0.0
+    throughput = n / (max_end - min_start) if max_end is not None else 0.0
 
-    active_steps = compute_active_cycles(timeline)
     energy = compute_energy(active_steps, context_switches, idle_cycles, DEFAULT_ENERGY_PARAMS)
 
     metrics: Dict[str, float] = {
@@ -41,7 +122,64 @@ def evaluate_simulation(tasks: List[Task], timeline: List[TimelineEntry], contex
         "throughput": throughput,
         "total_tasks": n,
         "active_steps": active_steps,
-        "timeline_length": max((e for _, e, _ in timeline), default=0)
+        "timeline_length": max_end if max_end is not None else 0
     }
+    metrics.update(distribution_metrics(distributions))
+
+    return SimulationResult(timeline=timeline, context_switches=context_switches, idle_cycles=idle_cycles, metrics=metrics, energy=energy,
+                            distributions=distributions)
+
+def evaluate_compact(tasks: TaskTable, timeline: CompactTimeline, context_switches: int, idle_cycles: int, scheduler_name: str) -> SimulationResult:
+    """
+    Vectorized counterpart of evaluate_simulation: works on TaskTable columns
+    and a CompactTimeline or Timeline (NumPy when available, one pure-Python
+    pass otherwise) and returns an identical SimulationResult. A Timeline is
+    kept as the result's timeline rather than expanded into tuples.
+    """
+    active_steps, min_start, max_end = _compact_span_stats(timeline)
+    total_wait, total_turnaround = _task_totals(tasks, max_end)
+    entries = timeline if isinstance(timeline, Timeline) else timeline.to_entries()
+    return _build_result(len(tasks), total_wait, total_turnaround, active_steps, min_start, max_end,
+                         entries, context_switches, idle_cycles, table_distributions(tasks))
+
+def evaluate_simulation(tasks: Workload, timeline: List[TimelineEntry], context_switches: int, idle_cycles: int, scheduler_name: str) -> SimulationResult:
+    if isinstance(timeline, (CompactTimeline, Timeline)):
+        return evaluate_compact(as_task_table(tasks), timeline, context_switches, idle_cycles, scheduler_name)
+
+    # Timeline aggregates in a single scan
+    active_steps = 0
+    min_start = max_end = None
+    for s, e, pid in timeline:
+        if pid != "IDLE":
+            active_steps += (e - s)
+        if min_start is None or s < min_start:
+            min_start = s
+        if max_end is None or e > max_end:
+            max_end = e
+
+    # Compute per-task metrics
+    n = len(tasks)
+    if isinstance(tasks, TaskTable):
+        total_wait, total_turnaround = _task_totals(tasks, max_end)
+        distributions = table_distributions(tasks)
+    else:
+        total_wait = 0
+        total_turnaround = 0
+        distributions = new_distributions()
+        for task in tasks:
+            if task.completion_time is None:
+                # Should not happen for well-formed schedulers, but be robust
+                task.completion_time = max_end
+            turnaround = task.completion_time - task.arrival
+            wait = (task.start_time - task.arrival) if task.start_time is not None else 0
+            total_turnaround += turnaround
+            total_wait += wait
+            add_task(distributions, task.arrival, task.burst, task.start_time, task.completion_time)
+
+    return _build_result(n, total_wait, total_turnaround, active_steps, min_start, max_end,
+                         timeline, context_switches, idle_cycles, distributions)
 
-    return SimulationResult(timeline=timeline, context_switches=context_switches, idle_cycles=idle_cycles, metrics=metrics, energy=energy)
+def rescore_energy(result: SimulationResult, params: EnergyParams) -> float:
+    """Energy of an existing result under other weights; the model is linear in its counters."""
+    return compute_energy(result.metrics["active_steps"], result.context_switches, result.idle_cycles, params,
+                          getattr(result, "migrations", 0))
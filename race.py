@@ -0,0 +1,200 @@
+# core/race.py
+import multiprocessing
+import os
+from array import array
+from itertools import accumulate
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+from typing import Collection, Dict, Iterator, List, Optional, Sequence, Set, Tuple, Union
+from core.background import CancelToken
+from core.task_table import TaskTable, Workload, as_task_table
+from core.trace_io import open_tasks
+from core.simulation_engine import SimulationEngine
+from core.simulation_result import SimulationResult
+from schedulers.base import Scheduler
+
+_ITEM = array("q").itemsize
+
+# seconds between checks of a CancelToken while waiting for workers
+CANCEL_POLL_SECONDS = 0.05
+
+
+class SharedTaskTable:
+    """
+    Packs the input columns of a TaskTable into one SharedMemory block:
+    arrival | burst | priority | pid offsets as int64, followed by the
+    concatenated pids. Offset k is where pid k starts in the decoded text
+    (n + 1 of them), so pids may contain any character. Workers attach by
+    name and read the columns in place.
+    """
+    def __init__(self, table: TaskTable):
+        self.n = len(table)
+        pid_bytes = "".join(table.pid).encode("utf-8", "surrogatepass")
+        offsets = array("q", accumulate(map(len, table.pid), initial=0))
+        self.pid_nbytes = len(pid_bytes)
+        cols = (4 * self.n + 1) * _ITEM
+        self.shm = shared_memory.SharedMemory(create=True, size=max(1, cols + self.pid_nbytes))
+        buf = self.shm.buf
+        for k, col in enumerate((table.arrival, table.burst, table.priority)):
+            off = k * self.n * _ITEM
+            buf[off:off + self.n * _ITEM] = array("q", col).tobytes()
+        buf[3 * self.n * _ITEM:cols] = offsets.tobytes()
+        buf[cols:cols + self.pid_nbytes] = pid_bytes
+
+    @property
+    def handle(self) -> Tuple[str, int, int]:
+        return self.shm.name, self.n, self.pid_nbytes
+
+    @staticmethod
+    def attach(handle: Tuple[str, int, int]) -> Tuple[shared_memory.SharedMemory, TaskTable]:
+        """Map a shared block back into a TaskTable without copying the columns."""
+        name, n, pid_nbytes = handle
+        shm = shared_memory.SharedMemory(name=name)
+        cols = [shm.buf[k * n * _ITEM:(k + 1) * n * _ITEM].cast("q") for k in range(3)]
+        end = (4 * n + 1) * _ITEM
+        offsets = shm.buf[3 * n * _ITEM:end].cast("q")
+        text = bytes(shm.buf[end:end + pid_nbytes]).decode("utf-8", "surrogatepass")
+        pids = [text[a:b] for a, b in zip(offsets, offsets[1:])]
+        offsets.release()
+        return shm, TaskTable(pids, cols[0], cols[1], cols[2])
+
+    def close(self):
+        self.shm.close()
+        self.shm.unlink()
+
+
+# Per-worker state set by _init_worker
+_worker_shm = None
+_worker_table: Optional[TaskTable] = None
+
+def _init_worker(handle):
+    global _worker_shm, _worker_table
+    if isinstance(handle, str):
+        # Binary trace file: every worker maps the same read-only pages
+        _worker_table = open_tasks(handle)
+    else:
+        _worker_shm, _worker_table = SharedTaskTable.attach(handle)
+
+def _run_job(index: int, scheduler: Scheduler) -> Tuple[int, SimulationResult]:
+    return index, SimulationEngine(scheduler).run(_worker_table)
+
+
+def _wait(futures: Collection[Future], cancel: Optional[CancelToken]) -> Set[Future]:
+    """Block until one of `futures` is done, raising SimulationCancelled as soon as `cancel` is set."""
+    while True:
+        done, _ = wait(futures, timeout=CANCEL_POLL_SECONDS if cancel is not None else None,
+                       return_when=FIRST_COMPLETED)
+        if cancel is not None:
+            cancel.raise_if_cancelled()
+        if done:
+            return done
+
+class _TrackingContext:
+    """
+    Multiprocessing context that remembers the worker processes it starts,
+    so an abandoned pool's workers can be killed without reaching into the
+    executor's internals.
+    """
+    def __init__(self, context=None):
+        self._context = context or multiprocessing.get_context()
+        self.processes: List[multiprocessing.process.BaseProcess] = []
+
+    def Process(self, *args, **kwargs):
+        process = self._context.Process(*args, **kwargs)
+        self.processes.append(process)
+        return process
+
+    def __getattr__(self, name):
+        return getattr(self._context, name)
+
+
+def _abandon(pool: ProcessPoolExecutor, context: _TrackingContext):
+    """Shut the pool down without waiting: queued jobs are dropped and running ones killed."""
+    pool.shutdown(wait=False, cancel_futures=True)
+    for process in context.processes:
+        if process.is_alive():
+            process.terminate()
+
+
+class RaceRunner:
+    """
+    Runs several schedulers on the same workload, one process per scheduler
+    configuration. The workload is placed in shared memory once instead of
+    being pickled for every job.
+
+    `tasks` may also be the path of a binary trace file (see core.trace_io),
+    in which case workers map the file instead of copying it into shared
+    memory.
+
+    ordered=True yields results in the order the schedulers were given;
+    otherwise they are yielded as they finish. Small workloads, a single
+    scheduler or parallel=False run in-process and produce identical results.
+
+    With a CancelToken, iter_results raises SimulationCancelled within
+    CANCEL_POLL_SECONDS of it being set (in-process: within the kernel's
+    CANCEL_POLL_EVERY slices, for schedulers whose run() takes `cancel`).
+    A race that is cancelled or abandoned by its consumer kills its worker
+    processes instead of waiting for the schedulers still running.
+    """
+    def __init__(self, schedulers: Sequence[Scheduler], max_workers: Optional[int] = None,
+                 parallel: bool = True, ordered: bool = True, min_parallel_tasks: int = 10_000):
+        self.schedulers = list(schedulers)
+        self.max_workers = max_workers
+        self.parallel = parallel
+        self.ordered = ordered
+        self.min_parallel_tasks = min_parallel_tasks
+
+    def _workers(self) -> int:
+        return min(self.max_workers or os.cpu_count() or 1, len(self.schedulers))
+
+    def _use_pool(self, table: TaskTable) -> bool:
+        return self.parallel and self._workers() > 1 and len(table) >= self.min_parallel_tasks
+
+    def iter_results(self, tasks: Union[Workload, str],
+                     cancel: Optional[CancelToken] = None) -> Iterator[Tuple[Scheduler, SimulationResult]]:
+        trace_path = tasks if isinstance(tasks, str) else None
+        table = open_tasks(trace_path) if trace_path else as_task_table(tasks)
+        if not self._use_pool(table):
+            for s in self.schedulers:
+                if cancel is not None:
+                    cancel.raise_if_cancelled()
+                yield s, SimulationEngine(s).run(table, cancel=cancel)
+            return
+
+        shared = None if trace_path else SharedTaskTable(table)
+        try:
+            context = _TrackingContext()
+            pool = ProcessPoolExecutor(max_workers=self._workers(), mp_context=context,
+                                       initializer=_init_worker, initargs=(trace_path or shared.handle,))
+            finished = False
+            try:
+                futures = [pool.submit(_run_job, i, s) for i, s in enumerate(self.schedulers)]
+                if self.ordered:
+                    for i, fut in enumerate(futures):
+                        _wait((fut,), cancel)
+                        yield self.schedulers[i], fut.result()[1]
+                else:
+                    pending = set(futures)
+                    while pending:
+                        for fut in _wait(pending, cancel):
+                            pending.remove(fut)
+                            i, res = fut.result()
+                            yield self.schedulers[i], res
+                finished = True
+            finally:
+                if finished:
+                    pool.shutdown()
+                else:
+                    # cancelled, failed or closed early by the consumer (e.g. a superseded UI race)
+                    _abandon(pool, context)
+        finally:
+            if shared is not None:
+                shared.close()
+
+    def run(self, tasks: Union[Workload, str]) -> Dict[str, SimulationResult]:
+        """Run the race and return results keyed by scheduler name."""
+        return {s.name: res for s, res in self.iter_results(tasks)}
+
+    def run_all(self, tasks: Union[Workload, str]) -> List[Tuple[Scheduler, SimulationResult]]:
+        """Like run(), but keeps every entry even when scheduler names repeat."""
+        return list(self.iter_results(tasks))
@@ -0,0 +1,249 @@
+# evaluation/replication.py
+"""
+Monte Carlo replications: the same schedulers over many seeded random
+workloads, summarized as means with confidence intervals.
+
+Replication r draws its workload from a WorkloadSpec with the r-th seed of
+a sequence derived from the base seed, and every scheduler configuration
+runs on that same workload (common random numbers), so differences between
+schedulers are not drowned in workload-to-workload noise. Replications run
+in batches on a process pool; after each batch the intervals are updated
+and the run stops early once every interval is narrower than the target.
+For a fixed seed and batch size the result is reproducible.
+"""
+import csv
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from statistics import NormalDist
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+from core.task_table import TaskTable
+from core.simulation_engine import SimulationEngine
+from core.simulation_result import SimulationResult
+from evaluation.energy_model import DEFAULT_ENERGY_PARAMS
+from evaluation.distributions import Distributions, distribution_metrics, merge_distributions, new_distributions
+from evaluation.metrics import rescore_energy
+from evaluation.sweep import SweepPoint, Uniform
+
+METRICS = ("energy", "avg_wait", "avg_turnaround", "throughput")
+
+
+@dataclass(frozen=True)
+class WorkloadSpec:
+    """
+    Distribution of random workloads: `tasks` tasks named P1..Pn whose
+    arrival, burst and priority are drawn from the given Uniform ranges.
+    The defaults are those of the UI's "Generate Random Tasks".
+    """
+    tasks: int = 50
+    arrival: Uniform = Uniform(0, 30)
+    burst: Uniform = Uniform(1, 15)
+    priority: Uniform = Uniform(1, 5)
+
+    def generate(self, seed: Optional[int] = None) -> TaskTable:
+        rng = random.Random(seed)
+        pids, arrival, burst, priority = [], [], [], []
+        for i in range(self.tasks):
+            pids.append(f"P{i + 1}")
+            arrival.append(self.arrival.sample(rng))
+            burst.append(self.burst.sample(rng))
+            priority.append(self.priority.sample(rng))
+        return TaskTable.from_columns(pids, arrival, burst, priority)
+
+
+def _t_central(t: float, df: int) -> float:
+    """P(|T| < t) for Student's t with integer df, t >= 0 (Abramowitz & Stegun 26.7.3-4)."""
+    theta = math.atan(t / math.sqrt(df))
+    c2 = math.cos(theta) ** 2
+    if df % 2:
+        term = total = 1.0
+        for k in range(1, (df - 1) // 2):
+            term *= c2 * 2 * k / (2 * k + 1)
+            total += term
+        series = math.sin(theta) * math.cos(theta) * total if df > 1 else 0.0
+        return 2 / math.pi * (theta + series)
+    term = total = 1.0
+    for k in range(1, df // 2):
+        term *= c2 * (2 * k - 1) / (2 * k)
+        total += term
+    return math.sin(theta) * total
+
+
+def t_quantile(p: float, df: int) -> float:
+    """
+    Quantile of Student's t distribution, p > 0.5. The Cornish-Fisher
+    expansion around the normal quantile is accurate to 1e-6 beyond 30
+    degrees of freedom; below that it seeds a bisection on the exact CDF.
+    """
+    z = NormalDist().inv_cdf(p)
+    g1 = (z ** 3 + z) / 4
+    g2 = (5 * z ** 5 + 16 * z ** 3 + 3 * z) / 96
+    g3 = (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / 384
+    g4 = (79 * z ** 9 + 776 * z ** 7 + 1482 * z ** 5 - 1920 * z ** 3 - 945 * z) / 92160
+    t = z + g1 / df + g2 / df ** 2 + g3 / df ** 3 + g4 / df ** 4
+    if df > 30:
+        return t
+    target = 2 * p - 1
+    low, high = 0.0, 2 * t
+    while _t_central(high, df) < target:
+        high *= 2
+    for _ in range(60):
+        mid = (low + high) / 2
+        if _t_central(mid, df) < target:
+            low = mid
+        else:
+            high = mid
+    return (low + high) / 2
+
+
+class RunningStats:
+    """Count, mean and variance of a stream of values (Welford's update)."""
+    __slots__ = ("n", "mean", "_m2")
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def add(self, x: float):
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self._m2 += delta * (x - self.mean)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (0.0 below two values)."""
+        return self._m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    def half_width(self, confidence: float) -> float:
+        """Half-width of the t confidence interval for the mean (inf below two values)."""
+        if self.n < 2:
+            return math.inf
+        return t_quantile(0.5 + confidence / 2, self.n - 1) * math.sqrt(self.variance / self.n)
+
+
+class Estimate(NamedTuple):
+    mean: float
+    half_width: float
+    n: int
+
+    @property
+    def low(self) -> float:
+        return self.mean - self.half_width
+
+    @property
+    def high(self) -> float:
+        return self.mean + self.half_width
+
+
+class ReplicationResults:
+    """
+    Estimates per sweep point and metric after `replications` replications.
+    converged is True when the run stopped because every interval met the
+    target width rather than at max_replications. distributions[i] pools
+    the per-task distributions of point i over all replications, so
+    tail_metrics(i) gives percentiles across every simulated task.
+    """
+    COLUMNS = ["scheduler", "params", "metric", "mean", "low", "high", "half_width", "replications"]
+
+    def __init__(self, points: Sequence[SweepPoint], stats: Sequence[Dict[str, RunningStats]],
+                 confidence: float, converged: bool, distributions: Optional[Sequence[Distributions]] = None):
+        self.points = list(points)
+        self.distributions = list(distributions or [])
+        self.confidence = confidence
+        self.converged = converged
+        self.estimates: List[Dict[str, Estimate]] = [
+            {m: Estimate(s.mean, s.half_width(confidence), s.n) for m, s in per_point.items()}
+            for per_point in stats
+        ]
+
+    def tail_metrics(self, i: int) -> Dict[str, float]:
+        """Pooled response/queueing/turnaround/slowdown percentiles of point i."""
+        return distribution_metrics(self.distributions[i])
+
+    @property
+    def replications(self) -> int:
+        return self.estimates[0][METRICS[0]].n if self.estimates else 0
+
+    def __getitem__(self, i: int) -> Dict[str, Estimate]:
+        return self.estimates[i]
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        for p, per_point in zip(self.points, self.estimates):
+            for metric, e in per_point.items():
+                yield {"scheduler": p.scheduler, "params": ";".join(f"{k}={v}" for k, v in p.params),
+                       "metric": metric, "mean": e.mean, "low": e.low, "high": e.high,
+                       "half_width": e.half_width, "replications": e.n}
+
+    def write_csv(self, path: str):
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=self.COLUMNS)
+            writer.writeheader()
+            writer.writerows(self.rows())
+
+
+def _replication(args: Tuple[Any, int, Sequence[SweepPoint]]) -> List[SimulationResult]:
+    """One replication: every distinct configuration on one seeded workload, timelines dropped."""
+    spec, seed, configs = args
+    table = spec.generate(seed)
+    return [replace(SimulationEngine(p.make_scheduler()).run(table.reset()), timeline=[]) for p in configs]
+
+
+def _as_point(p: Union[str, SweepPoint]) -> SweepPoint:
+    return SweepPoint(p, (), DEFAULT_ENERGY_PARAMS) if isinstance(p, str) else p
+
+
+def replicate(points: Iterable[Union[str, SweepPoint]], spec: Any = WorkloadSpec(),
+              confidence: float = 0.95, target_width: Optional[float] = None,
+              min_replications: int = 10, max_replications: int = 1000, batch_size: Optional[int] = None,
+              seed: int = 0, max_workers: Optional[int] = None, parallel: bool = True) -> ReplicationResults:
+    """
+    Replicate every point (a scheduler name or a SweepPoint with params and
+    energy weights) over workloads drawn from `spec`: a WorkloadSpec or
+    anything else with generate(seed), e.g. a core.workloads Workload.
+
+    target_width is a relative half-width: the run stops once, for every
+    point and metric, the interval is within +/- target_width * |mean|
+    (target_width itself when the mean is 0), after at least
+    min_replications. None runs max_replications. Replications go in
+    batches of batch_size (default four per worker) spread over
+    max_workers processes; parallel=False runs them in-process.
+    """
+    points = [_as_point(p) for p in points]
+    configs: Dict[Tuple, SweepPoint] = {}
+    for p in points:
+        configs.setdefault(p.config_key, p)
+    keys = list(configs)
+    column = [keys.index(p.config_key) for p in points]
+    stats = [{m: RunningStats() for m in METRICS} for _ in points]
+    pooled = [new_distributions() for _ in points]
+
+    workers = max_workers or os.cpu_count() or 1
+    batch_size = batch_size or 4 * workers
+    seeds = random.Random(seed)
+    executor = ProcessPoolExecutor(workers) if parallel and workers > 1 else None
+    done = 0
+    converged = False
+    try:
+        while done < max_replications and not converged:
+            count = min(batch_size, max_replications - done)
+            jobs = [(spec, seeds.getrandbits(63), list(configs.values())) for _ in range(count)]
+            results = executor.map(_replication, jobs, chunksize=max(1, count // workers)) if executor is not None else map(_replication, jobs)
+            for per_config in results:
+                for p, k, per_point, dists in zip(points, column, stats, pooled):
+                    res = per_config[k]
+                    merge_distributions(dists, res.distributions)
+                    per_point["energy"].add(rescore_energy(res, p.energy))
+                    for m in METRICS[1:]:
+                        per_point[m].add(res.metrics[m])
+            done += count
+            if target_width is not None and done >= min_replications:
+                converged = all(s.half_width(confidence) <= target_width * (abs(s.mean) or 1)
+                                for per_point in stats for s in per_point.values())
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return ReplicationResults(points, stats, confidence, converged, pooled)
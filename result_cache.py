@@ -0,0 +1,186 @@
+# core/result_cache.py
+import hashlib
+import os
+import pickle
+import threading
+from array import array
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Dict, Optional
+from core.task_table import TaskTable, Workload, as_task_table
+from core.simulation_result import SimulationResult
+from core.timeline import Timeline
+from evaluation.distributions import copy_distributions
+from evaluation.energy_model import EnergyParams
+from evaluation.metrics import rescore_energy
+from schedulers.base import Scheduler
+
+
+def workload_fingerprint(table: TaskTable) -> str:
+    """
+    Content hash of a workload's input columns and pids. The pids are hashed
+    as one NUL-joined buffer, built in C; should a pid contain a NUL, their
+    lengths are hashed too, so the split stays unambiguous.
+    """
+    h = hashlib.blake2b(digest_size=20)
+    h.update(len(table).to_bytes(8, "little"))
+    for col in (table.arrival, table.burst, table.priority):
+        h.update(memoryview(col).cast("B"))
+    pids = "\0".join(table.pid)
+    if pids.count("\0") > max(0, len(table) - 1):
+        h.update(b"\1")
+        h.update(array("q", map(len, table.pid)))
+    else:
+        h.update(b"\0")
+    h.update(pids.encode("utf-8", "surrogatepass"))
+    return h.hexdigest()
+
+
+def scheduler_key(scheduler: Scheduler) -> str:
+    """Scheduler class plus its constructor parameters (instance attributes)."""
+    cls = type(scheduler)
+    params = sorted((k, repr(v)) for k, v in vars(scheduler).items() if not k.startswith("_"))
+    return f"{cls.__module__}.{cls.__qualname__}:{scheduler.name}:{params}"
+
+
+def _copy(result: SimulationResult) -> SimulationResult:
+    """A cached result with its own timeline, metrics and distributions (entries are immutable tuples)."""
+    timeline = result.timeline
+    timeline = timeline.copy() if isinstance(timeline, Timeline) else list(timeline)
+    distributions = result.distributions
+    return replace(result, timeline=timeline, metrics=dict(result.metrics),
+                   distributions=None if distributions is None else copy_distributions(distributions))
+
+
+class ResultCache:
+    """
+    Content-addressed SimulationResult cache.
+
+    Keys hash the workload columns together with the scheduler class and
+    parameters. Energy weights are not part of the key: the stored counters
+    are re-scored, so changing only alpha/beta/gamma is still a hit. Results
+    live in an LRU memory tier (max_entries) and, if `directory` is given,
+    in a pickle-per-entry disk tier trimmed to max_disk_bytes by last use.
+    One cache may be shared between threads (e.g. UI runs that overlap).
+
+    get() returns a copy, so callers may modify what they get. A caller that
+    looks up and stores the same workload can hash it once with
+    workload_fingerprint() and pass `fingerprint` to get() and put().
+    """
+    def __init__(self, max_entries: int = 64, directory: Optional[str] = None,
+                 max_disk_bytes: int = 512 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self._memory: "OrderedDict[str, SimulationResult]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(tasks: Workload, scheduler: Scheduler, fingerprint: Optional[str] = None) -> str:
+        if fingerprint is None:
+            fingerprint = workload_fingerprint(as_task_table(tasks))
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(fingerprint.encode())
+        digest.update(scheduler_key(scheduler).encode())
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".pkl")
+
+    def _remember(self, key: str, result: SimulationResult):
+        with self._lock:
+            self._memory[key] = result
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _lookup(self, key: str) -> Optional[SimulationResult]:
+        with self._lock:
+            result = self._memory.get(key)
+            if result is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return result
+        if self.directory:
+            path = self._path(key)
+            try:
+                with open(path, "rb") as f:
+                    result = pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                result = None
+            if result is not None:
+                os.utime(path)  # mark as recently used for eviction
+                self._remember(key, result)
+                with self._lock:
+                    self.disk_hits += 1
+                return result
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def get(self, tasks: Workload, scheduler: Scheduler, energy: Optional[EnergyParams] = None,
+            fingerprint: Optional[str] = None) -> Optional[SimulationResult]:
+        """A copy of the cached result, re-scored for `energy` if given; None on a miss."""
+        result = self._lookup(self.key(tasks, scheduler, fingerprint))
+        if result is None:
+            return None
+        result = _copy(result)
+        if energy is not None:
+            result.energy = rescore_energy(result, energy)
+        return result
+
+    def put(self, tasks: Workload, scheduler: Scheduler, result: SimulationResult,
+            fingerprint: Optional[str] = None):
+        if not isinstance(result.timeline, (list, Timeline)):
+            # e.g. a MappedTimeline; store a plain, picklable copy
+            result = replace(result, timeline=list(result.timeline))
+        key = self.key(tasks, scheduler, fingerprint)
+        self._remember(key, result)
+        if self.directory:
+            tmp = f"{self._path(key)}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._path(key))
+            self._evict_disk()
+
+    def _evict_disk(self):
+        entries = []
+        total = 0
+        for name in os.listdir(self.directory):
+            if not name.endswith(".pkl"):
+                continue
+            st = os.stat(os.path.join(self.directory, name))
+            entries.append((st.st_mtime, st.st_size, name))
+            total += st.st_size
+        entries.sort()
+        for _, size, name in entries:
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+            total -= size
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+        if self.directory:
+            for name in os.listdir(self.directory):
+                if name.endswith(".pkl"):
+                    os.remove(os.path.join(self.directory, name))
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+            "memory_entries": len(self._memory),
+        }
@@ -1,14 +1,53 @@
 # schedulers/base.py
-from typing import List
-from core.task import Task
+import inspect
+from typing import Any, Callable, Dict, Optional
+from core.background import CancelToken
+from core.task_table import Workload, as_task_table
 from core.simulation_result import SimulationResult
+from core.kernel import Policy, Probe, Progress, simulate
 
 class Scheduler:
     """
-    Base scheduler interface. Implementations must run on a list of Task clones
-    and return a SimulationResult describing the execution.
+    Base scheduler interface. Implementations run on a TaskTable (or a list
+    of Task clones, which is converted to one) and return a SimulationResult
+    describing the execution.
+
+    Most schedulers only provide policy(): a fresh ready-queue Policy per
+    run, which the shared kernel in core.kernel drives. Schedulers with a
+    loop of their own override run() instead, passing `probe` (a
+    core.kernel.Probe, for instrumented runs), `cancel` and `progress` on
+    to simulate(). Plugin run() overrides may take none of them (see
+    run_options).
     """
     name = "BaseScheduler"
+    compress = False  # return a run-length-compressed Timeline
+
+    def policy(self) -> Policy:
+        raise NotImplementedError("Scheduler subclasses must implement policy() or run()")
+
+    @property
+    def streams(self) -> bool:
+        """Whether this scheduler has a policy(), which the streaming, incremental and SMP engines need."""
+        return type(self).policy is not Scheduler.policy
+
+    def run(self, tasks: Workload, probe: Optional[Probe] = None, cancel: Optional[CancelToken] = None,
+            progress: Optional[Progress] = None) -> SimulationResult:
+        return simulate(self.policy(), as_task_table(tasks), self.name, self.compress, probe=probe,
+                        cancel=cancel, progress=progress)
+
+    def run_instrumented(self, tasks: Workload, profiler=None) -> SimulationResult:
+        """
+        run() with event counters and phase timings attached as result.report;
+        profiler may be "cprofile", "sampling" or an object with start()/stop().
+        """
+        from core.instrumentation import Instrumentation
+        return Instrumentation(profiler).run(self, tasks)
+
 
-    def run(self, tasks: List[Task]) -> SimulationResult:
-        raise NotImplementedError("Scheduler subclasses must implement run()")
+def run_options(run: Callable, **options) -> Dict[str, Any]:
+    """The `options` that are set and that `run` (a scheduler's run method) takes as keywords."""
+    try:
+        params = inspect.signature(run).parameters
+    except (TypeError, ValueError):
+        return {}
+    return {k: v for k, v in options.items() if v is not None and k in params}
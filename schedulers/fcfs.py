@@ -1,33 +1,130 @@
 # schedulers/fcfs.py
-from typing import List
+from array import array
+from typing import List, Optional
 from schedulers.base import Scheduler
-from core.task import Task
+from core.background import CancelToken
+from core.kernel import FifoPolicy, Probe, Progress, simulate
+from core.task_table import TaskTable, Workload, as_task_table
 from core.simulation_result import SimulationResult
-from evaluation.metrics import evaluate_simulation
+from core.timeline import IDLE_INDEX
+from evaluation.metrics import CompactTimeline, evaluate_simulation
+
+try:
+    import numpy as np
+except ImportError:  # the kernel loop is used instead
+    np = None
+
+# |arrival| + total burst must stay below this for int64 sums to be exact
+_INT64_LIMIT = 2 ** 62
+
+
+class ArrivalOrder(FifoPolicy):
+    """Ready rows in arrival order, ties broken by pid."""
+    def arrival_order(self, table: TaskTable) -> List[int]:
+        return table.arrival_order(by_pid=True)
+
+
+def _arrival_order(table: TaskTable, arrival) -> Optional["np.ndarray"]:
+    """ArrivalOrder's row order as an index array; None if NumPy can't reproduce Python's pid ordering."""
+    order = np.argsort(arrival, kind="stable")
+    sorted_arrival = arrival[order]
+    if not (sorted_arrival[1:] == sorted_arrival[:-1]).any():
+        return order
+    try:
+        # NumPy strings drop trailing NULs, so such pids could compare differently
+        if "\0" in "".join(table.pid):
+            return None
+    except TypeError:  # non-string pids
+        return None
+    return np.lexsort((np.array(table.pid), arrival))
+
+def closed_form(table: TaskTable, name: str = "FCFS", probe: Optional[Probe] = None) -> Optional[SimulationResult]:
+    """
+    FCFS without a per-task loop. In arrival order, completion_k =
+    max(arrival_k, completion_{k-1}) + burst_k, which unrolls to
+    completion_k = S_k + max(0, max_{j<=k} (arrival_j - S_{j-1})) with S the
+    prefix sums of the bursts: one cumsum and one running maximum. Idle gaps
+    are the rows where a task arrives after its predecessor completed.
+
+    Fills the table's start/completion columns and returns the result the
+    kernel loop would, or None (nothing written) when the workload is empty
+    or outside what int64 arrays reproduce exactly. A probe gets the
+    counts the kernel loop would report (no queue operations: there is no
+    queue) and times the evaluation.
+    """
+    n = len(table)
+    if n == 0:
+        return None
+    arrival = np.frombuffer(table.arrival, dtype=np.int64)
+    burst = np.frombuffer(table.burst, dtype=np.int64)
+    if burst.min() < 0:
+        return None
+    if max(-int(arrival.min()), int(arrival.max())) + n * int(burst.max()) >= _INT64_LIMIT:
+        return None
+    order = _arrival_order(table, arrival)
+    if order is None:
+        return None
+
+    a = arrival[order]
+    b = burst[order]
+    prefix = np.cumsum(b)
+    completion = prefix + np.maximum(np.maximum.accumulate(a - (prefix - b)), 0)
+    start = completion - b
+    previous = np.empty_like(completion)
+    previous[0] = 0
+    previous[1:] = completion[:-1]
+    idle = start > previous
+
+    np.frombuffer(table.start_time, dtype=np.int64)[order] = start
+    np.frombuffer(table.completion_time, dtype=np.int64)[order] = completion
+
+    # timeline rows: each task, preceded by an IDLE row when it starts after a gap
+    pos = np.arange(n) + np.cumsum(idle)
+    idle_pos = pos[idle] - 1
+    size = n + len(idle_pos)
+    slice_start = np.empty(size, dtype=np.int64)
+    slice_end = np.empty(size, dtype=np.int64)
+    pid_index = np.empty(size, dtype=np.int64)
+    slice_start[pos] = start
+    slice_end[pos] = completion
+    pid_index[pos] = order
+    slice_start[idle_pos] = previous[idle]
+    slice_end[idle_pos] = start[idle]
+    pid_index[idle_pos] = IDLE_INDEX
+    idle_cycles = int((start[idle] - previous[idle]).sum())
+
+    timeline = CompactTimeline(array("q", slice_start.tobytes()), array("q", slice_end.tobytes()),
+                               array("q", pid_index.tobytes()), table.pid)
+    # every task is dispatched once, right after another task or idle
+    if probe is not None:
+        probe.counters.update(dispatches=n, preemptions=0, quantum_expiries=0, idle_jumps=len(idle_pos),
+                              context_switches=n, timeline_entries=size)
+        return probe.timed("evaluate", evaluate_simulation, table, timeline, n, idle_cycles, name)
+    return evaluate_simulation(table, timeline, n, idle_cycles, name)
+
 
 class FCFS(Scheduler):
+    """
+    First come, first served. vectorized=True computes the schedule in
+    closed form with NumPy (see closed_form); without NumPy, with
+    compress=True or for workloads it can't reproduce exactly, the kernel
+    loop runs instead. Both give identical results.
+    """
     name = "FCFS"
 
-    def run(self, tasks: List[Task]) -> SimulationResult:
-        tasks = sorted(tasks, key=lambda t: (t.arrival, t.pid))
-        time = 0
-        timeline = []
-        context_switches = 0
-        idle_cycles = 0
-
-        for task in tasks:
-            if time < task.arrival:
-                idle_cycles += (task.arrival - time)
-                timeline.append((time, task.arrival, "IDLE"))
-                time = task.arrival
-
-            # context switch (count when switching from IDLE or another task)
-            context_switches += 1
-            start = time
-            end = start + task.burst
-            timeline.append((start, end, task.pid))
-            task.start_time = start
-            task.completion_time = end
-            time = end
-
-        return evaluate_simulation(tasks, timeline, context_switches, idle_cycles, self.name)
+    def __init__(self, vectorized: bool = True):
+        self.vectorized = vectorized
+
+    def policy(self) -> ArrivalOrder:
+        return ArrivalOrder()
+
+    def run(self, tasks: Workload, probe: Optional[Probe] = None, cancel: Optional[CancelToken] = None,
+            progress: Optional[Progress] = None) -> SimulationResult:
+        table = as_task_table(tasks)
+        if self.vectorized and not self.compress and np is not None:
+            # a handful of array passes: nothing to poll or report along the way
+            res = closed_form(table, self.name, probe)
+            if res is not None:
+                return res
+        return simulate(self.policy(), table, self.name, self.compress, probe=probe, cancel=cancel,
+                        progress=progress)
@@ -0,0 +1,194 @@
+# schedulers/registry.py
+"""
+Scheduler registry: name -> SchedulerSpec.
+
+A spec names its class as "module:Class" and is only imported when a
+scheduler is created, so listing the available schedulers (UI combobox,
+CLI --help) imports none of them. Each spec declares its constructor
+parameters as Params, from which the UI builds its controls and which
+coerce and range-check values coming from text fields or the command line.
+
+Third-party schedulers are discovered through the "cpusched.schedulers"
+entry-point group, e.g. in a plugin's pyproject.toml:
+
+    [project.entry-points."cpusched.schedulers"]
+    Lottery = "my_plugin.lottery:LotteryScheduler"
+
+The target may be a Scheduler subclass (its `param_schema` class attribute,
+if any, supplies the Params) or a SchedulerSpec. Plugin modules are
+likewise imported on first use; built-in names take precedence.
+"""
+import importlib
+from dataclasses import dataclass
+from importlib.metadata import entry_points
+from typing import Any, Dict, Iterator, Mapping, Optional, Sequence, Tuple, Type
+from schedulers.base import Scheduler
+
+ENTRY_POINT_GROUP = "cpusched.schedulers"
+
+_TRUE = ("1", "true", "yes", "on")
+_FALSE = ("0", "false", "no", "off")
+
+
+@dataclass(frozen=True)
+class Param:
+    """One constructor parameter: its type, default and allowed values."""
+    name: str
+    type: type = int
+    default: Any = None
+    min: Optional[float] = None
+    max: Optional[float] = None
+    choices: Tuple[Any, ...] = ()
+    label: str = ""
+    help: str = ""
+
+    @property
+    def title(self) -> str:
+        return self.label or self.name.replace("_", " ").capitalize()
+
+    def coerce(self, value: Any) -> Any:
+        """`value` (possibly a string) converted to this parameter's type; ValueError if out of range."""
+        if self.type is bool and isinstance(value, str):
+            text = value.strip().lower()
+            if text not in _TRUE + _FALSE:
+                raise ValueError(f"{self.name}: expected a boolean, got {value!r}")
+            value = text in _TRUE
+        else:
+            try:
+                value = self.type(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"{self.name}: expected {self.type.__name__}, got {value!r}") from None
+        if self.choices and value not in self.choices:
+            raise ValueError(f"{self.name} must be one of {', '.join(map(str, self.choices))}")
+        if self.min is not None and value < self.min:
+            raise ValueError(f"{self.name} must be >= {self.min}")
+        if self.max is not None and value > self.max:
+            raise ValueError(f"{self.name} must be <= {self.max}")
+        return value
+
+
+class SchedulerSpec:
+    """
+    A registered scheduler. target is "module:Class"; params=None means
+    "ask the class" (its param_schema), which imports it.
+    Calling a spec creates a scheduler, like calling the class would.
+    """
+    __slots__ = ("name", "target", "description", "_params", "_cls")
+
+    def __init__(self, name: str, target: str, params: Optional[Sequence[Param]] = (), description: str = ""):
+        self.name = name
+        self.target = target
+        self.description = description
+        self._params = None if params is None else tuple(params)
+        self._cls: Optional[Type[Scheduler]] = None
+
+    def __repr__(self):
+        return f"SchedulerSpec({self.name!r}, {self.target!r})"
+
+    def load(self) -> Type[Scheduler]:
+        """Import and return the scheduler class."""
+        if self._cls is None:
+            module, _, attr = self.target.partition(":")
+            obj = importlib.import_module(module)
+            for part in filter(None, attr.split(".")):
+                obj = getattr(obj, part)
+            if isinstance(obj, SchedulerSpec):
+                # plugin entry point naming a spec: adopt its schema
+                if self._params is None:
+                    self._params = obj.params
+                obj = obj.load()
+            self._cls = obj
+        return self._cls
+
+    @property
+    def params(self) -> Tuple[Param, ...]:
+        if self._params is None:
+            cls = self.load()
+            # loading a plugin's spec adopts its schema
+            if self._params is None:
+                self._params = tuple(getattr(cls, "param_schema", ()))
+        return self._params
+
+    def defaults(self) -> Dict[str, Any]:
+        return {p.name: p.default for p in self.params}
+
+    def create(self, **params) -> Scheduler:
+        """
+        New scheduler instance. Declared params are coerced and checked;
+        others go to the constructor unchanged (e.g. RoundRobin's fast flag).
+        """
+        schema = {p.name: p for p in self.params}
+        kwargs = {k: schema[k].coerce(v) if k in schema else v for k, v in params.items()}
+        return self.load()(**kwargs)
+
+    __call__ = create
+
+    def from_config(self, values: Mapping[str, Any]) -> Scheduler:
+        """Scheduler built from shared control values, taking only the params this spec declares."""
+        return self.create(**{p.name: values[p.name] for p in self.params if p.name in values})
+
+
+class SchedulerRegistry(Mapping[str, SchedulerSpec]):
+    """Specs by name, in registration order, with plugins discovered on first lookup."""
+    def __init__(self, group: Optional[str] = ENTRY_POINT_GROUP):
+        self._specs: Dict[str, SchedulerSpec] = {}
+        self._group = group
+
+    def register(self, spec: SchedulerSpec, replace: bool = False) -> SchedulerSpec:
+        if spec.name in self._specs and not replace:
+            raise ValueError(f"scheduler {spec.name!r} is already registered")
+        self._specs[spec.name] = spec
+        return spec
+
+    def _discover(self):
+        """Register the entry points of the plugin group once, without importing them."""
+        group, self._group = self._group, None
+        if group is None:
+            return
+        for ep in entry_points(group=group):
+            if ep.name not in self._specs:
+                self._specs[ep.name] = SchedulerSpec(ep.name, ep.value, params=None)
+
+    def __getitem__(self, name: str) -> SchedulerSpec:
+        spec = self._specs.get(name)
+        if spec is None:
+            self._discover()
+            spec = self._specs.get(name)
+            if spec is None:
+                raise KeyError(f"unknown scheduler {name!r} (choose from {', '.join(self)})")
+        return spec
+
+    def __iter__(self) -> Iterator[str]:
+        self._discover()
+        return iter(self._specs)
+
+    def __len__(self) -> int:
+        self._discover()
+        return len(self._specs)
+
+    def create(self, name: str, **params) -> Scheduler:
+        return self[name].create(**params)
+
+
+REGISTRY = SchedulerRegistry()
+for _spec in (
+    SchedulerSpec("FCFS", "schedulers.fcfs:FCFS", description="First come, first served"),
+    SchedulerSpec("SJF", "schedulers.sjf:SJF", description="Shortest job first (non-preemptive)"),
+    SchedulerSpec("RoundRobin", "schedulers.rr:RoundRobin", (
+        Param("quantum", int, 2, min=1, help="time slice per turn"),
+    ), "Round robin with a fixed quantum"),
+    SchedulerSpec("Priority", "schedulers.priority:PriorityScheduler",
+                  description="Non-preemptive priority (lower number first)"),
+    SchedulerSpec("SRTF", "schedulers.srtf:SRTF", description="Shortest remaining time first (preemptive)"),
+    SchedulerSpec("EnergyAware", "schedulers.energy_aware:EnergyAwareScheduler", (
+        Param("switch_penalty", float, 2.0, min=0, label="Switch penalty"),
+        Param("idle_penalty", float, 1.0, min=0, label="Idle penalty"),
+    ), "Remaining work plus switch/idle penalties"),
+):
+    REGISTRY.register(_spec)
+del _spec
+
+
+def create_scheduler(name: str, **params) -> Scheduler:
+    """Shortcut for REGISTRY.create(name, **params)."""
+    return REGISTRY.create(name, **params)
@@ -1,57 +1,34 @@
 # schedulers/round_robin.py
-from typing import List, Deque
-from collections import deque
+from typing import Optional
 from schedulers.base import Scheduler
-from core.task import Task
+from core.background import CancelToken
+from core.kernel import FifoPolicy, Probe, Progress, simulate
+from core.task_table import Workload, as_task_table
 from core.simulation_result import SimulationResult
-from evaluation.metrics import evaluate_simulation
 
 class RoundRobin(Scheduler):
+    """
+    Round Robin with a fixed quantum.
+
+    fast=True lets the kernel fast-forward stretches where the ready set
+    cannot change: when no task finishes and nothing arrives within r full
+    rounds, all k ready tasks are advanced by r * quantum at once. The
+    schedule is exactly the one the per-quantum loop produces. compress=True
+    returns a run-length compressed Timeline, merging consecutive slices of
+    the same pid. A task re-dispatched after its quantum because nothing
+    else is ready is not charged another context switch.
+    """
     name = "RoundRobin"
 
-    def __init__(self, quantum: int = 2):
+    def __init__(self, quantum: int = 2, fast: bool = True, compress: bool = False):
         self.quantum = quantum
+        self.fast = fast
+        self.compress = compress
 
-    def run(self, tasks: List[Task]) -> SimulationResult:
-        tasks = sorted(tasks, key=lambda t: t.arrival)
-        time = 0
-        idx = 0
-        ready: Deque[Task] = deque()
-        timeline = []
-        context_switches = 0
-        idle_cycles = 0
+    def policy(self) -> FifoPolicy:
+        return FifoPolicy(self.quantum)
 
-        while idx < len(tasks) or ready:
-            while idx < len(tasks) and tasks[idx].arrival <= time:
-                ready.append(tasks[idx])
-                idx += 1
-
-            if not ready:
-                next_arrival = tasks[idx].arrival
-                idle_cycles += (next_arrival - time)
-                timeline.append((time, next_arrival, "IDLE"))
-                time = next_arrival
-                continue
-
-            task = ready.popleft()
-            context_switches += 1
-            start = time
-            run_for = min(self.quantum, task.remaining)
-            end = start + run_for
-            timeline.append((start, end, task.pid))
-            if task.start_time is None:
-                task.start_time = start
-            task.remaining -= run_for
-            time = end
-
-            # Push newly arrived tasks during quantum
-            while idx < len(tasks) and tasks[idx].arrival <= time:
-                ready.append(tasks[idx])
-                idx += 1
-
-            if task.remaining > 0:
-                ready.append(task)
-            else:
-                task.completion_time = time
-
-        return evaluate_simulation(tasks, timeline, context_switches, idle_cycles, self.name)
+    def run(self, tasks: Workload, probe: Optional[Probe] = None, cancel: Optional[CancelToken] = None,
+            progress: Optional[Progress] = None) -> SimulationResult:
+        return simulate(self.policy(), as_task_table(tasks), self.name, self.compress, self.fast, probe,
+                        cancel, progress)
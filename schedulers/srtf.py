@@ -0,0 +1,32 @@
+# schedulers/srtf.py
+from schedulers.base import Scheduler
+from core.kernel import HeapPolicy
+from core.task_table import TaskTable
+
+
+class ShortestRemaining(HeapPolicy):
+    """
+    Ready rows by remaining time, ties to whoever queued first. The running
+    task stays out of the heap and is only pushed back, with its updated
+    remaining time, when an arrival preempts it; only someone with strictly
+    less work left takes the CPU.
+    """
+    preemptive = True
+
+    def bind(self, table: TaskTable):
+        self.keys = table.remaining
+
+
+class SRTF(Scheduler):
+    """
+    Preemptive shortest-remaining-time-first.
+
+    The kernel jumps from event to event (arrivals and completions) instead
+    of ticking per time unit, so a run costs O(n log n) regardless of burst
+    lengths. A task that keeps running across arrivals produces a single
+    timeline slice.
+    """
+    name = "SRTF"
+
+    def policy(self) -> ShortestRemaining:
+        return ShortestRemaining()
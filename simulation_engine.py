@@ -1,19 +1,52 @@
 # core/simulation_engine.py
-from typing import List
-from core.task import Task
-from schedulers.base import Scheduler
+from dataclasses import replace
+from typing import Optional
+from core.background import CancelToken
+from core.kernel import Progress
+from core.task_table import TaskTable, Workload
+from schedulers.base import Scheduler, run_options
 from core.simulation_result import SimulationResult
-import copy
+from core.result_cache import ResultCache, workload_fingerprint
+from core.instrumentation import Instrumentation
 
 class SimulationEngine:
     """
-    Runs one Scheduler on a *fresh clone* of the provided task list to ensure
-    fairness when comparing multiple schedulers.
+    Runs one Scheduler on a *fresh view* of the provided workload to ensure
+    fairness when comparing multiple schedulers. A TaskTable is reset (its
+    input columns are shared, not copied); a Task list is converted once.
+    With a ResultCache, repeated runs of the same workload and scheduler
+    config return the cached result. With an Instrumentation, every run is
+    simulated (never served from the cache) and carries a RunReport.
+
+    run() passes `cancel` and `progress` (see core.kernel.simulate) to
+    schedulers whose run() takes them; other plugin schedulers run to the
+    end unobserved.
     """
-    def __init__(self, scheduler: Scheduler):
+    def __init__(self, scheduler: Scheduler, cache: Optional[ResultCache] = None,
+                 instrumentation: Optional[Instrumentation] = None):
         self.scheduler = scheduler
+        self.cache = cache
+        self.instrumentation = instrumentation
 
-    def run(self, tasks: List[Task]) -> SimulationResult:
-        # Clone tasks so each run is independent
-        tasks_clone = [t.clone() for t in tasks]
-        return self.scheduler.run(tasks_clone)
+    def run(self, tasks: Workload, cancel: Optional[CancelToken] = None,
+            progress: Optional[Progress] = None) -> SimulationResult:
+        if self.instrumentation is not None:
+            result = self.instrumentation.run(self.scheduler, tasks)
+            if self.cache is not None:
+                self.cache.put(tasks, self.scheduler, replace(result, report=None))
+            return result
+        # Fresh view so each run is independent
+        if isinstance(tasks, TaskTable):
+            table = tasks.reset()
+        else:
+            table = TaskTable.from_tasks(tasks)
+        # hashed once for both the lookup and the store
+        fingerprint = workload_fingerprint(table) if self.cache is not None else None
+        if self.cache is not None:
+            cached = self.cache.get(table, self.scheduler, fingerprint=fingerprint)
+            if cached is not None:
+                return cached
+        result = self.scheduler.run(table, **run_options(self.scheduler.run, cancel=cancel, progress=progress))
+        if self.cache is not None:
+            self.cache.put(table, self.scheduler, result, fingerprint)
+        return result
@@ -1,6 +1,10 @@
 # core/simulation_result.py
 from dataclasses import dataclass
-from typing import List, Tuple, Dict
+from typing import TYPE_CHECKING, List, Optional, Tuple, Dict
+
+if TYPE_CHECKING:
+    from core.instrumentation import RunReport
+    from evaluation.distributions import Distribution
 
 # timeline entries: (start_time, end_time, pid) - end_time is exclusive
 TimelineEntry = Tuple[int, int, str]
@@ -12,3 +16,8 @@ class SimulationResult:
     idle_cycles: int
     metrics: Dict[str, float]
     energy: float
+    # set by instrumented runs only (see core.instrumentation)
+    report: Optional["RunReport"] = None
+    # per-task response/queueing/turnaround/slowdown sketches (see evaluation.distributions);
+    # their percentiles are also in metrics
+    distributions: Optional[Dict[str, "Distribution"]] = None
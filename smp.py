@@ -0,0 +1,229 @@
+# core/smp.py
+import random
+from dataclasses import dataclass, field
+from typing import List, Optional
+from core.kernel import Kernel
+from core.task_table import TaskRow, Workload, as_task_table
+from core.simulation_result import SimulationResult, TimelineEntry
+from evaluation.energy_model import EnergyParams, DEFAULT_ENERGY_PARAMS, compute_energy
+from evaluation.metrics import evaluate_simulation
+from schedulers.base import Scheduler
+
+
+@dataclass
+class SMPResult(SimulationResult):
+    """
+    SimulationResult for an N-CPU run. `timeline` holds the slices of every
+    CPU ordered by start time; `cpu_timelines[c]` holds CPU c's own slices.
+    idle_cycles and context_switches are summed over CPUs.
+    """
+    cpu_timelines: List[List[TimelineEntry]] = field(default_factory=list)
+    migrations: int = 0
+
+
+class CPU:
+    """
+    One processor: a kernel running the scheduler's policy over the shared
+    task table, with its own ready queue and slice timeline.
+    """
+    __slots__ = ("index", "kernel", "timeline")
+
+    def __init__(self, index: int, kernel: Kernel, timeline: List[TimelineEntry]):
+        self.index = index
+        self.kernel = kernel
+        self.timeline = timeline
+
+    @property
+    def queued(self) -> int:
+        return self.kernel.waiting
+
+    @property
+    def running(self) -> bool:
+        return self.kernel.current >= 0
+
+    @property
+    def load(self) -> int:
+        return self.kernel.waiting + (self.kernel.current >= 0)
+
+    def push(self, row: int):
+        self.kernel.admit(row)
+
+    def steal(self) -> int:
+        """Take a queued (never the running) row off this CPU."""
+        return self.kernel.steal()
+
+
+# ---- load balancers ----
+
+class LoadBalancer:
+    """
+    Places arriving tasks and migrates queued (never running) tasks between
+    CPUs. The base class puts each arrival on the least loaded CPU and never
+    migrates. reset() is called at the start of every SMPEngine.run(), so a
+    balancer's state (timers, random streams) never carries over between runs.
+    """
+    def reset(self):
+        """Forget the state of the previous run."""
+
+    def place(self, task: TaskRow, cpus: List[CPU]) -> int:
+        return min(cpus, key=lambda c: (c.load, c.index)).index
+
+    def balance(self, cpus: List[CPU], time: int) -> int:
+        """Move tasks between queues; return the number of migrations."""
+        return 0
+
+
+class PushMigration(LoadBalancer):
+    """Every `interval` time units, push tasks from the busiest to the idlest CPU."""
+    def __init__(self, interval: int = 10, threshold: int = 1):
+        self.interval = interval
+        self.threshold = threshold
+        self._next = 0
+
+    def reset(self):
+        self._next = 0
+
+    def balance(self, cpus: List[CPU], time: int) -> int:
+        if time < self._next:
+            return 0
+        self._next = time + self.interval
+        moved = 0
+        while True:
+            busiest = max(cpus, key=lambda c: (c.queued, -c.index))
+            idlest = min(cpus, key=lambda c: (c.load, c.index))
+            if not busiest.queued or busiest.load - idlest.load <= self.threshold:
+                return moved
+            idlest.push(busiest.steal())
+            moved += 1
+
+
+class PullMigration(LoadBalancer):
+    """A CPU with nothing to run pulls one queued task from the longest queue."""
+    def balance(self, cpus: List[CPU], time: int) -> int:
+        moved = 0
+        for cpu in cpus:
+            if not cpu.running and not cpu.queued:
+                victim = max(cpus, key=lambda c: (c.queued, -c.index))
+                if victim.queued:
+                    cpu.push(victim.steal())
+                    moved += 1
+        return moved
+
+
+class WorkStealing(LoadBalancer):
+    """A CPU with nothing to run steals one queued task from a random victim."""
+    def __init__(self, seed: Optional[int] = None):
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+    def reset(self):
+        # seed=None draws fresh OS entropy per run, as a new Random would
+        self.rng.seed(self.seed)
+
+    def balance(self, cpus: List[CPU], time: int) -> int:
+        moved = 0
+        for cpu in cpus:
+            if not cpu.running and not cpu.queued:
+                victims = [c for c in cpus if c.queued]
+                if victims:
+                    cpu.push(self.rng.choice(victims).steal())
+                    moved += 1
+        return moved
+
+
+def _cpu_emit(timeline: List[TimelineEntry]):
+    """Slice sink for one CPU; idle time arrives in per-step pieces, which are joined."""
+    append = timeline.append
+
+    def emit(entry: TimelineEntry):
+        if entry[2] == "IDLE" and timeline and timeline[-1][2] == "IDLE" and timeline[-1][1] == entry[0]:
+            timeline[-1] = (timeline[-1][0], entry[1], "IDLE")
+        else:
+            append(entry)
+    return emit
+
+
+class SMPEngine:
+    """
+    Simulates `cpus` processors, each running its own ready queue with the
+    given scheduler's policy on the shared kernel (core.kernel), so any
+    scheduler with a policy() runs here. Arrivals are placed and migrated
+    by a LoadBalancer; each migration costs `delta` in the energy model.
+    With cpus=1 the schedule and metrics match the single-CPU schedulers.
+
+    The CPUs advance in lockstep from event to event (an arrival or the end
+    of any CPU's slice). At each event time, slices ending then are wound
+    up, arrivals are placed, requeued tasks queue behind them, the balancer
+    migrates, and then every CPU decides (preempts and dispatches).
+    """
+    def __init__(self, scheduler: Scheduler, cpus: int = 2, balancer: Optional[LoadBalancer] = None,
+                 energy: EnergyParams = DEFAULT_ENERGY_PARAMS):
+        if cpus < 1:
+            raise ValueError("SMPEngine needs at least one CPU")
+        if not scheduler.streams:
+            raise ValueError(f"SMPEngine needs a scheduler with a policy(), not {scheduler.name!r}")
+        self.scheduler = scheduler
+        self.cpus = cpus
+        self.balancer = balancer or LoadBalancer()
+        self.energy = energy
+
+    def run(self, tasks: Workload) -> SMPResult:
+        # a fresh view: the kernels write its simulation columns, never the caller's
+        table = as_task_table(tasks).reset()
+        arrival = table.arrival
+        balancer = self.balancer
+        balancer.reset()
+        cpus = []
+        for c in range(self.cpus):
+            policy = self.scheduler.policy()
+            if not c:
+                # arrivals are placed in the policy's admission order (e.g. FCFS's pid tie-break)
+                order = policy.arrival_order(table)
+            policy.bind(table)
+            timeline: List[TimelineEntry] = []
+            # Round Robin can't skip rounds when every event pauses the CPUs
+            cpus.append(CPU(c, Kernel(policy, table, _cpu_emit(timeline), fast=False), timeline))
+        n = len(order)
+        kernels = [cpu.kernel for cpu in cpus]
+        preemptive = policy.preemptive
+        time = 0
+        idx = 0
+        migrations = 0
+
+        while sum(k.completed for k in kernels) < n:
+            next_time = arrival[order[idx]] if idx < n else None
+            for k in kernels:
+                # a CPU left with queued work (after a zero-length slice) decides again right away
+                end = k.end if k.current >= 0 else time if k.waiting else None
+                if end is not None and (next_time is None or end < next_time):
+                    next_time = end
+            time = max(time, next_time)
+
+            # 1. run the CPUs up to now, winding up the slices ending now; unless
+            #    it may be preempted, a CPU in the middle of a slice catches up later
+            for k in kernels:
+                if preemptive or k.current < 0 or k.end <= time:
+                    k.run(time)
+            # 2. arrivals, then re-queued slices (as in single-CPU RR)
+            while idx < n and arrival[order[idx]] <= time:
+                i = order[idx]
+                cpus[balancer.place(table[i], cpus)].push(i)
+                idx += 1
+            for k in kernels:
+                k.flush()
+            # 3. migrations
+            migrations += balancer.balance(cpus, time)
+            # 4. preemption and dispatch
+            for k in kernels:
+                if preemptive or (k.current < 0 and k.waiting):
+                    k.run(time)
+
+        timeline = sorted((e for cpu in cpus for e in cpu.timeline), key=lambda e: e[0])
+        context_switches = sum(k.context_switches for k in kernels)
+        idle_cycles = sum(k.idle_cycles for k in kernels)
+        res = evaluate_simulation(table, timeline, context_switches, idle_cycles, self.scheduler.name)
+        res.metrics.update(cpus=self.cpus, migrations=migrations)
+        energy = compute_energy(res.metrics["active_steps"], context_switches, idle_cycles, self.energy, migrations)
+        return SMPResult(timeline=timeline, context_switches=context_switches, idle_cycles=idle_cycles,
+                         metrics=res.metrics, energy=energy, distributions=res.distributions,
+                         cpu_timelines=[cpu.timeline for cpu in cpus], migrations=migrations)
@@ -0,0 +1,310 @@
+# core/streaming.py
+from array import array
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional, Union
+from core.task import Task
+from core.task_table import NO_TIME, TaskTable
+from core.background import CancelToken
+from core.kernel import CANCEL_POLL_EVERY, INFINITY, Kernel, Policy
+from core.simulation_result import SimulationResult
+from evaluation.energy_model import compute_energy, DEFAULT_ENERGY_PARAMS
+from evaluation.distributions import add_task, copy_distributions, distribution_metrics, new_distributions
+from schedulers.base import Scheduler
+
+
+class Segment(NamedTuple):
+    """One timeline slice; end is exclusive."""
+    start: int
+    end: int
+    pid: str
+
+
+class Completion(NamedTuple):
+    """Per-task record emitted when a task finishes."""
+    pid: str
+    arrival: int
+    burst: int
+    start_time: int
+    completion_time: int
+
+    @property
+    def wait(self) -> int:
+        return self.start_time - self.arrival
+
+    @property
+    def turnaround(self) -> int:
+        return self.completion_time - self.arrival
+
+
+StreamEvent = Union[Segment, Completion]
+
+# tasks read ahead of the clock at a time (plus the rest of the last one's arrival time)
+READ_AHEAD = 512
+
+
+def _slot_table() -> TaskTable:
+    """Empty table whose simulation columns exist up front, so rows can be appended to every column."""
+    table = TaskTable([], array("q"), array("q"), array("q"))
+    table.remaining, table.start_time, table.completion_time  # allocate them
+    return table
+
+def _columns(table: TaskTable) -> tuple:
+    return (table.pid, table.arrival, table.burst, table.priority,
+            table.remaining, table.start_time, table.completion_time)
+
+def _add(columns: tuple, free: List[int], task: Task) -> int:
+    """Store a fresh copy of `task` in a free row of the table with these _columns() (a new row if none is free)."""
+    pid, arrival, burst, priority, remaining, start_time, completion_time = columns
+    if free:
+        i = free.pop()
+        pid[i] = task.pid
+        arrival[i] = task.arrival
+        burst[i] = remaining[i] = task.burst
+        priority[i] = task.priority
+        start_time[i] = completion_time[i] = NO_TIME
+        return i
+    pid.append(task.pid)
+    arrival.append(task.arrival)
+    burst.append(task.burst)
+    priority.append(task.priority)
+    remaining.append(task.burst)
+    start_time.append(NO_TIME)
+    completion_time.append(NO_TIME)
+    return len(pid) - 1
+
+
+class StreamAccumulator:
+    """
+    Running totals that reproduce evaluate_simulation's metrics without
+    storing the timeline. Percentiles come from bounded-size sketches, so
+    they match a batch run exactly while a measure has at most the
+    sketch's k values and to within its rank error beyond that.
+    """
+    def __init__(self):
+        self.total_tasks = 0
+        self.total_wait = 0
+        self.total_turnaround = 0
+        self.active_steps = 0
+        self.idle_cycles = 0
+        self.context_switches = 0
+        self.first_start: Optional[int] = None
+        self.last_end: Optional[int] = None
+        self.distributions = new_distributions()
+
+    def copy(self) -> "StreamAccumulator":
+        """Independent copy: the totals plus copies of the sketches' compact state."""
+        other = StreamAccumulator.__new__(StreamAccumulator)
+        other.__dict__.update(self.__dict__)
+        other.distributions = copy_distributions(self.distributions)
+        return other
+
+    def add_segment(self, seg: Segment):
+        if seg.pid == "IDLE":
+            self.idle_cycles += seg.end - seg.start
+        else:
+            self.active_steps += seg.end - seg.start
+        if self.first_start is None:
+            self.first_start = seg.start
+        if self.last_end is None or seg.end > self.last_end:
+            self.last_end = seg.end
+
+    def add_completion(self, rec: Completion):
+        self.total_tasks += 1
+        self.total_wait += rec.wait
+        self.total_turnaround += rec.turnaround
+        add_task(self.distributions, rec.arrival, rec.burst, rec.start_time, rec.completion_time)
+
+    def result(self) -> SimulationResult:
+        n = self.total_tasks
+        span = (self.last_end - self.first_start) if self.last_end is not None else None
+        metrics = {
+            "avg_wait": self.total_wait / n if n else 0.0,
+            "avg_turnaround": self.total_turnaround / n if n else 0.0,
+            "throughput": n / span if span is not None else 0.0,
+            "total_tasks": n,
+            "active_steps": self.active_steps,
+            "timeline_length": self.last_end if self.last_end is not None else 0,
+        }
+        metrics.update(distribution_metrics(self.distributions))
+        energy = compute_energy(self.active_steps, self.context_switches, self.idle_cycles, DEFAULT_ENERGY_PARAMS)
+        # a copy: the accumulator may keep going after a partial result
+        return SimulationResult(timeline=[], context_switches=self.context_switches,
+                                idle_cycles=self.idle_cycles, metrics=metrics, energy=energy,
+                                distributions=copy_distributions(self.distributions))
+
+
+class LoopState:
+    """
+    Everything the streaming loop needs to resume: the slot table holding
+    the tasks admitted and not finished yet (`free` lists the rows of
+    finished ones, which are reused), the policy bound to it, the kernel's
+    state, the accumulators and how many input tasks have been admitted.
+    A fresh state starts a run from t=0.
+    """
+    def __init__(self, policy: Policy, table: Optional[TaskTable] = None, free: Optional[List[int]] = None,
+                 stats: Optional[StreamAccumulator] = None, kernel: Optional[tuple] = None,
+                 admitted: int = 0, last_arrival: Optional[int] = None):
+        self.policy = policy
+        self.table = _slot_table() if table is None else table
+        self.free = [] if free is None else free
+        self.stats = StreamAccumulator() if stats is None else stats
+        self.kernel = kernel
+        self.admitted = admitted
+        self.last_arrival = last_arrival
+        if table is None:
+            policy.bind(self.table)
+
+
+class LoopSnapshot(NamedTuple):
+    """
+    A copy of the streaming loop's state, taken between two kernel runs;
+    restore() may be called any number of times. Copies cost O(tasks in
+    the slot table + sketch size) and share nothing mutable with the run.
+    """
+    columns: tuple
+    free: List[int]
+    queue: object
+    kernel: tuple
+    stats: StreamAccumulator
+    time: int
+    admitted: int
+
+    def restore(self, policy: Policy) -> LoopState:
+        """Fresh LoopState, with the saved ready queue loaded into `policy` (a new one from the same scheduler)."""
+        pid, *numbers = self.columns
+        table = TaskTable(list(pid), *(array("q", c) for c in numbers[:3]))
+        for column, saved in zip(_columns(table)[4:], numbers[3:]):
+            column[:] = saved
+        policy.bind(table)
+        policy.restore(self.queue)
+        # tasks arriving at `time` may still be unread; nothing earlier is
+        return LoopState(policy, table, list(self.free), self.stats.copy(), self.kernel, self.admitted, self.time)
+
+
+class StreamingEngine:
+    """
+    Runs a scheduler over an arrival-ordered iterator of Tasks (or TaskRows),
+    yielding timeline Segments and Completion records as they are produced.
+    The scheduler's policy runs on the shared kernel (core.kernel), so any
+    scheduler with a policy() streams, with the batch run's schedule and
+    timeline. Tasks are read READ_AHEAD at a time into a table whose rows
+    are reused once their task finishes, so only those read ahead or
+    arrived and not yet finished are held in memory and traces may be far
+    larger than RAM. The input is never written, so one task list can be
+    streamed through any number of runs.
+    """
+    def __init__(self, scheduler: Scheduler):
+        self.scheduler = scheduler
+        self.stats = StreamAccumulator()
+
+    def events(self, tasks: Iterable[Task], resume: Optional[LoopState] = None, checkpoint_every: int = 0,
+               on_checkpoint: Optional[Callable[["LoopSnapshot"], None]] = None,
+               cancel: Optional[CancelToken] = None) -> Iterator[StreamEvent]:
+        """
+        Yield events for `tasks`. With `resume`, continue from that state;
+        `tasks` must then start with the first task it had not admitted.
+        With checkpoint_every=k, on_checkpoint receives a LoopSnapshot after
+        all events so far have been yielded, at most every k slices. A
+        snapshot costs O(tasks held), so successive ones are also at least
+        that many slices apart (linear total cost however many tasks are
+        held) and at strictly increasing times. With `cancel`,
+        SimulationCancelled is raised within CANCEL_POLL_EVERY slices of
+        the token being set.
+        """
+        if not self.scheduler.streams:
+            raise ValueError(f"Scheduler {self.scheduler.name!r} has no policy() to stream")
+        fresh = resume is None
+        state = LoopState(self.scheduler.policy()) if fresh else resume
+        policy, table, free, stats = state.policy, state.table, state.free, state.stats
+        self.stats = stats
+        columns = _columns(table)
+        pids, arrival, burst, priority, _, start_time, completion_time = columns
+        out: List[StreamEvent] = []
+
+        def emit(entry):
+            seg = Segment(*entry)
+            stats.add_segment(seg)
+            out.append(seg)
+
+        def extend(entries):
+            for entry in entries:
+                emit(entry)
+
+        def finished(row: int):
+            rec = Completion(pids[row], arrival[row], burst[row], start_time[row], completion_time[row])
+            stats.add_completion(rec)
+            out.append(rec)
+            free.append(row)
+
+        kernel = Kernel(policy, table, emit, extend, finished=finished)
+        if state.kernel is not None:
+            kernel.set_state(state.kernel)
+        # a resumed run already has a checkpoint at its start time
+        checkpointed_at = None if fresh else kernel.time
+        read = state.admitted
+        last_arrival = state.last_arrival
+        source = iter(tasks)
+        pending = next(source, None)
+        own_order = type(policy).arrival_order is not Policy.arrival_order
+
+        def read_ahead():
+            """Add the next READ_AHEAD tasks and the rest of the last one's arrival time; the new `until`."""
+            nonlocal pending, last_arrival, read
+            rows = []
+            while pending is not None and (len(rows) < READ_AHEAD or pending.arrival == last_arrival):
+                if last_arrival is not None and pending.arrival < last_arrival:
+                    raise ValueError(f"Task {pending.pid!r} arrives before its predecessor; "
+                                     "streaming input must be ordered by arrival")
+                last_arrival = pending.arrival
+                rows.append(_add(columns, free, pending))
+                read += 1
+                pending = next(source, None)
+            if own_order and rows:
+                # the policy's admission order within the new rows (e.g. FCFS's pid tie-break)
+                chunk = TaskTable([pids[i] for i in rows], *(array("q", [c[i] for i in rows])
+                                                              for c in (arrival, burst, priority)))
+                rows = [rows[k] for k in policy.arrival_order(chunk)]
+            kernel.add_arrivals(rows)
+            return INFINITY if pending is None else last_arrival
+
+        def snapshot() -> LoopSnapshot:
+            unread = kernel.pending()
+            return LoopSnapshot(tuple(list(c) if c is pids else c[:] for c in columns),
+                                free + unread, policy.snapshot(), kernel.state(), stats.copy(), kernel.time,
+                                read - len(unread))
+
+        until = read_ahead()
+        next_poll = CANCEL_POLL_EVERY if cancel is not None else INFINITY
+        next_checkpoint = checkpoint_every if checkpoint_every else INFINITY
+        while True:
+            done = kernel.run(until, min(next_poll, next_checkpoint))
+            stats.context_switches = kernel.context_switches
+            if out:
+                yield from out
+                del out[:]
+            if done:
+                break
+            slices = kernel.slices
+            if slices >= next_poll:
+                next_poll = slices + CANCEL_POLL_EVERY
+                cancel.raise_if_cancelled()
+            if slices >= next_checkpoint:
+                if checkpointed_at is None or kernel.time > checkpointed_at:
+                    checkpointed_at = kernel.time
+                    next_checkpoint = slices + max(checkpoint_every, len(pids) - len(free))
+                    on_checkpoint(snapshot())
+                else:
+                    # the clock has not moved since the last one: retry after the next slice
+                    next_checkpoint = slices + 1
+            if kernel.time >= until:
+                until = read_ahead()
+
+    def run(self, tasks: Iterable[Task], on_segment: Optional[Callable[[Segment], None]] = None,
+            on_completion: Optional[Callable[[Completion], None]] = None) -> SimulationResult:
+        """Drain the stream, forwarding events to the callbacks; the result has an empty timeline."""
+        for ev in self.events(tasks):
+            if isinstance(ev, Segment):
+                if on_segment is not None:
+                    on_segment(ev)
+            elif on_completion is not None:
+                on_completion(ev)
+        return self.stats.result()
@@ -0,0 +1,179 @@
+# evaluation/sweep.py
+import csv
+import itertools
+import random
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+from core.task_table import Workload, as_task_table
+from core.race import RaceRunner
+from core.simulation_result import SimulationResult
+from evaluation.energy_model import EnergyParams, DEFAULT_ENERGY_PARAMS
+from evaluation.metrics import rescore_energy
+from schedulers.base import Scheduler
+from schedulers.registry import REGISTRY
+
+# name -> SchedulerSpec; SCHEDULERS[name](**params) builds a scheduler,
+# importing its module on first use
+SCHEDULERS = REGISTRY
+
+
+class Uniform(NamedTuple):
+    """Continuous range for random search (ints if both bounds are ints)."""
+    low: float
+    high: float
+
+    def sample(self, rng: random.Random):
+        if isinstance(self.low, int) and isinstance(self.high, int):
+            return rng.randint(self.low, self.high)
+        return rng.uniform(self.low, self.high)
+
+
+Domain = Union[Sequence[Any], Uniform]
+
+
+@dataclass
+class SearchSpace:
+    """
+    Parameters to explore for one scheduler. `params` are constructor kwargs
+    (e.g. {"quantum": [1, 2, 4]}), `energy` maps alpha/beta/gamma to values;
+    unspecified energy weights keep their DEFAULT_ENERGY_PARAMS value.
+    """
+    scheduler: str
+    params: Dict[str, Domain] = field(default_factory=dict)
+    energy: Dict[str, Domain] = field(default_factory=dict)
+
+
+class SweepPoint(NamedTuple):
+    scheduler: str
+    params: Tuple[Tuple[str, Any], ...]
+    energy: EnergyParams
+
+    @property
+    def config_key(self) -> Tuple[str, Tuple[Tuple[str, Any], ...]]:
+        """Everything that affects the schedule; energy weights do not."""
+        return self.scheduler, self.params
+
+    def make_scheduler(self) -> Scheduler:
+        return SCHEDULERS[self.scheduler](**dict(self.params))
+
+
+def _point(space: SearchSpace, params: Dict[str, Any], energy: Dict[str, Any]) -> SweepPoint:
+    weights = DEFAULT_ENERGY_PARAMS._replace(**energy)
+    return SweepPoint(space.scheduler, tuple(sorted(params.items())), weights)
+
+def grid(spaces: Iterable[SearchSpace]) -> Iterator[SweepPoint]:
+    """Cartesian product of every listed value in each search space."""
+    for space in spaces:
+        names = list(space.params) + list(space.energy)
+        domains = list(space.params.values()) + list(space.energy.values())
+        for d in domains:
+            if isinstance(d, Uniform):
+                raise ValueError("grid() needs explicit values; use random_search() for Uniform ranges")
+        k = len(space.params)
+        for combo in itertools.product(*domains):
+            values = dict(zip(names, combo))
+            yield _point(space, {n: values[n] for n in names[:k]}, {n: values[n] for n in names[k:]})
+
+def random_search(spaces: Sequence[SearchSpace], samples: int, seed: Optional[int] = None) -> Iterator[SweepPoint]:
+    """Draw `samples` points, picking a search space and then each parameter at random."""
+    rng = random.Random(seed)
+
+    def draw(domain: Domain):
+        return domain.sample(rng) if isinstance(domain, Uniform) else rng.choice(list(domain))
+
+    for _ in range(samples):
+        space = rng.choice(list(spaces))
+        params = {n: draw(d) for n, d in space.params.items()}
+        energy = {n: draw(d) for n, d in space.energy.items()}
+        yield _point(space, params, energy)
+
+
+class SweepResults:
+    """Rows of a finished sweep, one per SweepPoint, with columnar export."""
+    COLUMNS = ["scheduler", "params", "alpha", "beta", "gamma", "energy", "avg_wait",
+               "avg_turnaround", "throughput", "context_switches", "idle_cycles", "active_steps"]
+
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self.rows = rows
+
+    def __len__(self):
+        return len(self.rows)
+
+    def to_columns(self) -> Dict[str, List[Any]]:
+        return {c: [r[c] for r in self.rows] for c in self.COLUMNS}
+
+    def write_csv(self, path: str):
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=self.COLUMNS)
+            writer.writeheader()
+            writer.writerows(self.rows)
+
+    def pareto_front(self, objectives: Sequence[str] = ("energy", "avg_wait")) -> List[Dict[str, Any]]:
+        """Rows not dominated on any of the (minimized) objectives."""
+        return pareto_front(self.rows, objectives)
+
+
+def pareto_front(rows: Sequence[Dict[str, Any]], objectives: Sequence[str]) -> List[Dict[str, Any]]:
+    # After sorting, a row can only be dominated by one that comes before it
+    ordered = sorted(rows, key=lambda r: tuple(r[o] for o in objectives))
+    front: List[Dict[str, Any]] = []
+    for r in ordered:
+        v = tuple(r[o] for o in objectives)
+        dominated = False
+        for f in front:
+            fv = tuple(f[o] for o in objectives)
+            if all(a <= b for a, b in zip(fv, v)) and fv != v:
+                dominated = True
+                break
+        if not dominated:
+            front.append(r)
+    return front
+
+
+class ParameterSweep:
+    """
+    Evaluates sweep points on one workload. Each distinct scheduler config is
+    simulated once (in parallel through RaceRunner) and cached; points that
+    differ only in energy weights re-score the cached counters.
+    """
+    def __init__(self, tasks: Workload, max_workers: Optional[int] = None, parallel: bool = True):
+        self.table = as_task_table(tasks)
+        self.max_workers = max_workers
+        self.parallel = parallel
+        self._cache: Dict[Tuple, SimulationResult] = {}
+        self.simulations = 0
+
+    def run(self, points: Iterable[SweepPoint]) -> SweepResults:
+        points = list(points)
+        missing: Dict[Tuple, SweepPoint] = {}
+        for p in points:
+            if p.config_key not in self._cache:
+                missing.setdefault(p.config_key, p)
+
+        if missing:
+            keys = list(missing)
+            runner = RaceRunner([missing[k].make_scheduler() for k in keys],
+                                max_workers=self.max_workers, parallel=self.parallel)
+            for key, (_, res) in zip(keys, runner.run_all(self.table)):
+                # Only the counters and metrics are needed for scoring
+                self._cache[key] = replace(res, timeline=[])
+            self.simulations += len(keys)
+
+        rows = []
+        for p in points:
+            res = self._cache[p.config_key]
+            rows.append({
+                "scheduler": p.scheduler,
+                "params": ";".join(f"{k}={v}" for k, v in p.params),
+                "alpha": p.energy.alpha,
+                "beta": p.energy.beta,
+                "gamma": p.energy.gamma,
+                "energy": rescore_energy(res, p.energy),
+                "avg_wait": res.metrics["avg_wait"],
+                "avg_turnaround": res.metrics["avg_turnaround"],
+                "throughput": res.metrics["throughput"],
+                "context_switches": res.context_switches,
+                "idle_cycles": res.idle_cycles,
+                "active_steps": res.metrics["active_steps"],
+            })
+        return SweepResults(rows)
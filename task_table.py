@@ -0,0 +1,173 @@
+# core/task_table.py
+from array import array
+from typing import Iterable, Iterator, List, Optional, Sequence, Union
+from core.task import Task
+
+# Sentinel stored in the start/completion columns while a value is unset: the
+# int64 minimum, which no schedule reaches (-1 is a real time when arrivals
+# are negative).
+NO_TIME = -(1 << 63)
+
+
+class TaskRow:
+    """
+    Thin view over one row of a TaskTable. Exposes the same attributes as
+    Task so code written against Task objects keeps working.
+    """
+    __slots__ = ("_table", "_i")
+
+    def __init__(self, table: "TaskTable", i: int):
+        self._table = table
+        self._i = i
+
+    @property
+    def pid(self) -> str:
+        return self._table.pid[self._i]
+
+    @property
+    def arrival(self) -> int:
+        return self._table.arrival[self._i]
+
+    @property
+    def burst(self) -> int:
+        return self._table.burst[self._i]
+
+    @property
+    def priority(self) -> int:
+        return self._table.priority[self._i]
+
+    @property
+    def remaining(self) -> int:
+        return self._table.remaining[self._i]
+
+    @remaining.setter
+    def remaining(self, value: int):
+        self._table.remaining[self._i] = value
+
+    @property
+    def start_time(self) -> Optional[int]:
+        v = self._table.start_time[self._i]
+        return None if v == NO_TIME else v
+
+    @start_time.setter
+    def start_time(self, value: Optional[int]):
+        self._table.start_time[self._i] = NO_TIME if value is None else value
+
+    @property
+    def completion_time(self) -> Optional[int]:
+        v = self._table.completion_time[self._i]
+        return None if v == NO_TIME else v
+
+    @completion_time.setter
+    def completion_time(self, value: Optional[int]):
+        self._table.completion_time[self._i] = NO_TIME if value is None else value
+
+    def clone(self) -> Task:
+        """Return a standalone Task with this row's input fields."""
+        return Task(self.pid, self.arrival, self.burst, self.priority)
+
+    def __repr__(self):
+        return (f"TaskRow(pid={self.pid!r}, arrival={self.arrival}, burst={self.burst}, "
+                f"priority={self.priority}, remaining={self.remaining})")
+
+
+class TaskTable:
+    """
+    Column-oriented workload: one array per Task field instead of one Task
+    object per task.
+
+    The input columns (pid, arrival, burst, priority) are never written by
+    schedulers, so reset() hands out a fresh simulation view that shares them.
+    The mutable columns (remaining, start_time, completion_time) are only
+    allocated on first access, which makes a reset effectively free until a
+    scheduler starts writing.
+    """
+    __slots__ = ("pid", "arrival", "burst", "priority",
+                 "_remaining", "_start_time", "_completion_time")
+
+    def __init__(self, pid: List[str], arrival: array, burst: array, priority: array):
+        if not (len(pid) == len(arrival) == len(burst) == len(priority)):
+            raise ValueError("TaskTable columns must have equal length")
+        self.pid = pid
+        self.arrival = arrival
+        self.burst = burst
+        self.priority = priority
+        self._remaining = None
+        self._start_time = None
+        self._completion_time = None
+
+    @classmethod
+    def from_columns(cls, pid: Sequence[str], arrival: Iterable[int], burst: Iterable[int],
+                     priority: Optional[Iterable[int]] = None) -> "TaskTable":
+        pid = list(pid)
+        if priority is None:
+            priority = array("q", bytes(8 * len(pid)))
+        return cls(pid, array("q", arrival), array("q", burst), array("q", priority))
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[Task]) -> "TaskTable":
+        tasks = list(tasks)
+        return cls.from_columns([t.pid for t in tasks], [t.arrival for t in tasks],
+                                [t.burst for t in tasks], [t.priority for t in tasks])
+
+    def __len__(self) -> int:
+        return len(self.pid)
+
+    def __getitem__(self, i: int) -> TaskRow:
+        if i < 0:
+            i += len(self.pid)
+        if not 0 <= i < len(self.pid):
+            raise IndexError("TaskTable index out of range")
+        return TaskRow(self, i)
+
+    def __iter__(self) -> Iterator[TaskRow]:
+        for i in range(len(self.pid)):
+            yield TaskRow(self, i)
+
+    # ---- mutable simulation columns (allocated lazily) ----
+
+    @property
+    def remaining(self) -> array:
+        if self._remaining is None:
+            # frombytes copies any int64 buffer (array or shared memoryview) in one go
+            self._remaining = array("q")
+            self._remaining.frombytes(memoryview(self.burst).cast("B"))
+        return self._remaining
+
+    @property
+    def start_time(self) -> array:
+        if self._start_time is None:
+            self._start_time = array("q", [NO_TIME]) * len(self.pid)
+        return self._start_time
+
+    @property
+    def completion_time(self) -> array:
+        if self._completion_time is None:
+            self._completion_time = array("q", [NO_TIME]) * len(self.pid)
+        return self._completion_time
+
+    def reset(self) -> "TaskTable":
+        """Return a fresh view for an independent simulation run."""
+        return TaskTable(self.pid, self.arrival, self.burst, self.priority)
+
+    def arrival_order(self, by_pid: bool = False) -> List[int]:
+        """Row indices sorted by arrival (stable; optionally tie-broken by pid)."""
+        arrival = self.arrival
+        if by_pid:
+            pid = self.pid
+            return sorted(range(len(pid)), key=lambda i: (arrival[i], pid[i]))
+        return sorted(range(len(arrival)), key=arrival.__getitem__)
+
+    def to_tasks(self) -> List[Task]:
+        """Materialize standalone Task objects (input fields only)."""
+        return [Task(p, a, b, pr) for p, a, b, pr in zip(self.pid, self.arrival, self.burst, self.priority)]
+
+
+Workload = Union[TaskTable, Sequence[Task]]
+
+
+def as_task_table(tasks: Workload) -> TaskTable:
+    """Return tasks as a TaskTable, converting a Task list if needed."""
+    if isinstance(tasks, TaskTable):
+        return tasks
+    return TaskTable.from_tasks(tasks)
@@ -0,0 +1,18 @@
+# tests/conftest.py
+import random
+from typing import List
+import pytest
+from core.task import Task
+
+
+def random_tasks(seed: int, n: int = 30, horizon: int = 50, max_burst: int = 12) -> List[Task]:
+    """Small random workload in arrival order, with arrival ties, idle gaps and mixed priorities."""
+    rng = random.Random(seed)
+    tasks = [Task(f"P{i}", rng.randint(0, horizon), rng.randint(1, max_burst), rng.randint(0, 4))
+             for i in range(rng.randint(1, n))]
+    return sorted(tasks, key=lambda t: t.arrival)
+
+
+@pytest.fixture(params=range(40))
+def tasks(request) -> List[Task]:
+    return random_tasks(request.param)
@@ -0,0 +1,122 @@
+# tests/test_batch.py
+import csv
+import io
+import json
+import pytest
+import batch
+from conftest import random_tasks
+from core.simulation_engine import SimulationEngine
+from core.task_table import TaskTable
+from core.trace_io import open_result, write_tasks
+from schedulers.registry import REGISTRY
+
+CHOICES = ["FCFS", "RoundRobin:quantum=3", "SRTF"]
+
+
+def write_csv(path, tasks):
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(("pid", "arrival", "burst", "priority"))
+        writer.writerows((t.pid, t.arrival, t.burst, t.priority) for t in tasks)
+
+
+@pytest.fixture
+def inputs(tmp_path):
+    """Three workloads in each input format; returns {stem: tasks}."""
+    workloads = {f"w{seed}": random_tasks(seed) for seed in range(3)}
+    write_csv(tmp_path / "w0.csv", workloads["w0"])
+    with open(tmp_path / "w1.jsonl", "w") as f:
+        for t in workloads["w1"]:
+            f.write(json.dumps({"pid": t.pid, "arrival": t.arrival, "burst": t.burst, "priority": t.priority}) + "\n")
+    write_tasks(str(tmp_path / "w2.trace"), TaskTable.from_tasks(workloads["w2"]))
+    return workloads
+
+
+def run_main(argv, capsys):
+    status = batch.main(argv)
+    out = capsys.readouterr().out
+    return status, [json.loads(line) for line in out.splitlines()]
+
+
+def expected_metrics(tasks, choice):
+    name, params = batch.parse_scheduler(choice)
+    return SimulationEngine(REGISTRY[name].create(**dict(params))).run(tasks)
+
+
+def by_key(rows):
+    return {(row["file"].rsplit("/", 1)[-1].split(".")[0], row["scheduler"]): row for row in rows}
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_summary_has_one_record_per_file_and_scheduler(tmp_path, inputs, capsys, jobs):
+    args = [str(tmp_path), "-j", jobs]
+    for choice in CHOICES:
+        args += ["-s", choice]
+    status, rows = run_main(args, capsys)
+    assert status == 0
+    rows = by_key(rows)
+    assert len(rows) == len(inputs) * len(CHOICES)
+    for stem, tasks in inputs.items():
+        for choice in CHOICES:
+            row = rows[stem, choice.split(":")[0]]
+            expected = expected_metrics(tasks, choice)
+            assert row["tasks"] == len(tasks) and "error" not in row
+            assert {k: row[k] for k in expected.metrics} == expected.metrics
+            assert row["context_switches"] == expected.context_switches
+    assert rows["w0", "RoundRobin"]["params"] == {"quantum": 3}
+
+
+def test_timelines_are_written_per_file_and_scheduler(tmp_path, inputs, capsys):
+    out = tmp_path / "out"
+    assert batch.main([str(tmp_path / "w0.csv"), "-s", "FCFS", "-s", "RoundRobin:quantum=3", "-o", str(out),
+                       "--timelines", "csv", "--summary-format", "csv", "-j", "1"]) == 0
+    assert capsys.readouterr().out == ""
+    with open(out / "summary.csv", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["scheduler"] for row in rows] == ["FCFS", "RoundRobin"]
+    assert json.loads(rows[1]["params"]) == {"quantum": 3}
+    with open(out / "w0.RoundRobin-quantum=3.csv", newline="") as f:
+        written = [(int(s), int(e), pid) for s, e, pid in list(csv.reader(f))[1:]]
+    assert rows[1]["timeline"].endswith("w0.RoundRobin-quantum=3.csv")
+    assert written == list(expected_metrics(inputs["w0"], "RoundRobin:quantum=3").timeline)
+
+    assert batch.main([str(tmp_path / "w2.trace"), "-s", "SRTF", "-o", str(out), "-j", "1"]) == 0
+    result = open_result(str(out / "w2.SRTF.trace"))
+    expected = expected_metrics(inputs["w2"], "SRTF")
+    assert list(result.timeline) == list(expected.timeline) and result.metrics == expected.metrics
+
+
+def test_no_timeline_gives_the_same_aggregates(tmp_path, inputs, capsys):
+    out = tmp_path / "out"
+    args = [str(tmp_path), "-s", "SRTF", "-s", "RoundRobin", "-j", "1", "-o", str(out)]
+    batch.main(args)
+    batch.main(args[:-2] + ["--no-timeline"])
+    full = [json.loads(line) for line in (out / "summary.jsonl").read_text().splitlines()]
+    streamed = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    for row, same in zip(full, streamed):
+        del row["seconds"], row["timeline"], same["seconds"]
+        assert same == row
+
+
+def test_a_bad_file_is_recorded_and_the_rest_still_run(tmp_path, inputs, capsys):
+    (tmp_path / "bad.csv").write_text("pid,arrival,burst\nA,zero,1\n")
+    status, rows = run_main([str(tmp_path), "-s", "FCFS", "-j", "1"], capsys)
+    assert status == 1
+    assert [row for row in rows if "error" in row] == \
+           [{"file": str(tmp_path / "bad.csv"), "error": "ValueError: invalid literal for int() with base 10: 'zero'"}]
+    assert len(rows) == 1 + len(inputs)
+
+
+@pytest.mark.parametrize("choice", ["Nope", "RoundRobin:quantum=0", "RoundRobin:quantum"])
+def test_bad_schedulers_fail_before_running(tmp_path, inputs, choice):
+    with pytest.raises(SystemExit) as exc:
+        batch.main([str(tmp_path), "-s", choice])
+    assert exc.value.code == 2
+
+
+def test_stdin_is_read_as_csv_or_jsonl(inputs, monkeypatch, capsys):
+    tasks = inputs["w1"]
+    text = "".join(json.dumps({"pid": t.pid, "arrival": t.arrival, "burst": t.burst}) + "\n" for t in tasks)
+    monkeypatch.setattr("sys.stdin", io.StringIO(text))
+    status, rows = run_main(["-", "-s", "SJF"], capsys)
+    assert status == 0 and rows[0]["file"] == "-" and rows[0]["tasks"] == len(tasks)
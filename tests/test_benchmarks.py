@@ -0,0 +1,26 @@
+# tests/test_benchmarks.py
+from benchmarks.suite import case_key, compare, run_case
+from core.kernel import Probe
+from evaluation.sweep import SCHEDULERS
+
+
+def test_run_case_times_simulation_and_evaluation_apart():
+    row = run_case(("SRTF", "uniform", 200, 0, 1))
+    assert row["seconds"] > 0 and row["eval_seconds"] > 0
+    assert row["tasks_per_sec"] == 200 / row["seconds"]
+    assert row["timeline_len"] >= 200
+
+
+def test_timing_probe_leaves_the_counters_to_the_kernel(tasks):
+    probe = Probe(count=False)
+    SCHEDULERS["RoundRobin"]().run(tasks, probe=probe)
+    assert "queue_pop" not in probe.counters and "timeline_entries" not in probe.counters
+    assert probe.counters["dispatches"] >= len(tasks)
+
+
+def test_compare_flags_only_large_throughput_drops():
+    row = {"scheduler": "SJF", "dist": "uniform", "tasks": 1000, "tasks_per_sec": 70.0, "eval_tasks_per_sec": 95.0}
+    baseline = {case_key(row): {"tasks_per_sec": 100.0, "eval_tasks_per_sec": 100.0}}
+    regressions = compare([row], baseline, threshold=0.2)
+    assert len(regressions) == 1 and "tasks_per_sec" in regressions[0]
+    assert compare([row], {}, threshold=0.2) == []
@@ -0,0 +1,79 @@
+# tests/test_cancellation.py
+import pytest
+from core.background import CancelToken, SimulationCancelled
+from core.incremental import IncrementalSimulator
+from core.kernel import CANCEL_POLL_EVERY
+from core.simulation_engine import SimulationEngine
+from core.task import Task
+from evaluation.sweep import SCHEDULERS
+from schedulers.base import Scheduler
+from schedulers.fcfs import FCFS
+
+SCHEDULER_NAMES = list(SCHEDULERS)
+
+
+def long_workload(n: int = 5000):
+    return [Task(f"P{i}", i, 1 + i % 7, i % 5) for i in range(n)]
+
+
+@pytest.mark.parametrize("name", SCHEDULER_NAMES)
+def test_progress_reports_a_growing_prefix_of_the_timeline(name):
+    tasks = long_workload()
+    scheduler = SCHEDULERS[name]() if name != "FCFS" else FCFS(vectorized=False)
+    reports = []
+    result = SimulationEngine(scheduler).run(tasks, progress=lambda done, total, timeline:
+                                             reports.append((done, total, list(timeline))))
+    assert reports
+    final = list(result.timeline)
+    done = 0
+    for completed, total, timeline in reports:
+        assert total == len(tasks) and done <= completed <= total
+        assert timeline[:-1] == final[:len(timeline) - 1]
+        done = completed
+
+
+@pytest.mark.parametrize("name", SCHEDULER_NAMES)
+def test_batch_run_stops_soon_after_cancel(name):
+    tasks = long_workload()
+    scheduler = SCHEDULERS[name]() if name != "FCFS" else FCFS(vectorized=False)
+    cancel = CancelToken()
+    reports = []
+
+    def progress(done, total, timeline):
+        reports.append(len(timeline))
+        cancel.cancel()
+
+    with pytest.raises(SimulationCancelled):
+        SimulationEngine(scheduler).run(tasks, cancel=cancel, progress=progress)
+    assert len(reports) == 1
+
+
+def test_lazy_first_run_is_cancellable_and_streams_its_timeline():
+    scheduler = SCHEDULERS["SRTF"]()
+    tasks = long_workload()
+    sim = IncrementalSimulator(scheduler, lazy=True)
+    cancel = CancelToken()
+    with pytest.raises(SimulationCancelled):
+        sim.run(tasks, cancel=cancel, progress=lambda done, total: cancel.cancel())
+    assert sim.timeline == []
+
+    seen = []
+    result = sim.run(tasks, progress=lambda done, total: seen.append((done, len(sim.timeline))))
+    assert len(seen) > 1 and seen[-1][0] == len(tasks)
+    assert sim.timeline == list(result.timeline)
+    assert 0 < seen[0][1] < len(sim.timeline)
+
+
+class Plugin(Scheduler):
+    """A scheduler with a run() of its own that knows nothing of cancel or progress."""
+    name = "Plugin"
+
+    def run(self, tasks):
+        return FCFS(vectorized=False).run(tasks)
+
+
+def test_plugins_without_the_options_still_run():
+    tasks = long_workload(CANCEL_POLL_EVERY * 2)
+    expected = SimulationEngine(FCFS()).run(tasks)
+    result = SimulationEngine(Plugin()).run(tasks, cancel=CancelToken(), progress=lambda *a: None)
+    assert result.metrics == expected.metrics
@@ -0,0 +1,71 @@
+# tests/test_distributions.py
+import math
+import random
+import pytest
+from evaluation.distributions import QuantileSketch, copy_distributions, new_distributions, add_task
+
+QS = [0.0, 0.01, 0.25, 0.5, 0.9, 0.95, 0.99, 1.0]
+
+
+def nearest_rank(values, q):
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(q * len(ordered))) - 1]
+
+
+def sample(n: int, seed: int = 0):
+    rng = random.Random(seed)
+    return [rng.randint(0, 50) for _ in range(n)]
+
+
+@pytest.mark.parametrize("n", [1, 2, 7, 100, 1024])
+def test_sketch_is_exact_up_to_k(n):
+    values = sample(n)
+    sketch = QuantileSketch(k=1024)
+    for x in values:
+        sketch.add(x)
+    assert sketch.exact
+    assert sketch.quantiles(QS) == [nearest_rank(values, q) for q in QS]
+
+
+@pytest.mark.parametrize("n", [1, 100, 1024])
+def test_bulk_sketch_is_exact_up_to_k(n):
+    np = pytest.importorskip("numpy")
+    values = sample(n, seed=1)
+    sketch = QuantileSketch.from_values(np.array(values), k=1024)
+    assert sketch.exact
+    assert sketch.quantiles(QS) == [nearest_rank(values, q) for q in QS]
+
+
+def test_merged_sketches_are_exact_up_to_k():
+    a, b = sample(300, seed=2), sample(200, seed=3)
+    left, right = QuantileSketch(k=512), QuantileSketch(k=512)
+    left.extend(a)
+    right.extend(b)
+    left.merge(right)
+    assert left.exact and len(right) == 200
+    assert left.quantiles(QS) == [nearest_rank(a + b, q) for q in QS]
+
+
+def test_sketch_beyond_k_stays_small_and_close():
+    values = list(range(100_000))
+    random.Random(4).shuffle(values)
+    sketch = QuantileSketch(k=256)
+    for x in values:
+        sketch.add(x)
+    assert not sketch.exact
+    assert sum(map(len, sketch.levels)) <= 3 * 256
+    # values are their own ranks here, so this is the rank error: a small multiple of n / k
+    for q in QS[1:-1]:
+        assert abs(sketch.quantile(q) - nearest_rank(values, q)) <= 4 * len(values) / 256
+    assert (sketch.quantile(0), sketch.quantile(1)) == (0, 99_999)
+
+
+def test_copies_are_independent():
+    dists = new_distributions()
+    for i in range(50):
+        add_task(dists, i, 1 + i % 5, i + i % 3, i + 10)
+    copy = copy_distributions(dists)
+    assert copy == dists
+    add_task(copy, 60, 2, 70, 90)
+    assert copy != dists
+    assert dists["turnaround"].count == 50
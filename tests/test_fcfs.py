@@ -0,0 +1,42 @@
+# tests/test_fcfs.py
+import pytest
+from core.task import Task
+from core.task_table import TaskTable
+from schedulers.fcfs import FCFS, closed_form
+
+pytest.importorskip("numpy")
+
+
+def assert_same_run(a, a_table, b, b_table):
+    assert list(a.timeline) == list(b.timeline)
+    assert list(a_table.start_time) == list(b_table.start_time)
+    assert list(a_table.completion_time) == list(b_table.completion_time)
+    assert (a.context_switches, a.idle_cycles, a.energy) == (b.context_switches, b.idle_cycles, b.energy)
+    assert a.metrics == b.metrics
+
+
+def test_closed_form_matches_loop(tasks):
+    table = TaskTable.from_tasks(tasks)
+    loop_table = table.reset()
+    result = closed_form(table)
+    assert result is not None
+    assert_same_run(result, table, FCFS(vectorized=False).run(loop_table), loop_table)
+
+
+def test_closed_form_breaks_arrival_ties_by_pid():
+    tasks = [Task("P3", 5, 2), Task("P1", 5, 1), Task("P2", 0, 1), Task("P0", 5, 4)]
+    table = TaskTable.from_tasks(tasks)
+    loop_table = table.reset()
+    result = closed_form(table)
+    assert [pid for _, _, pid in result.timeline] == ["P2", "IDLE", "P0", "P1", "P3"]
+    assert_same_run(result, table, FCFS(vectorized=False).run(loop_table), loop_table)
+
+
+def test_closed_form_declines_what_it_cannot_reproduce():
+    assert closed_form(TaskTable.from_tasks([])) is None
+    # NumPy strings drop trailing NULs, so tied pids like these need the loop
+    table = TaskTable.from_tasks([Task("A\0", 0, 1), Task("A", 0, 2)])
+    assert closed_form(table) is None
+    assert list(table.completion_time) == list(table.reset().completion_time)  # nothing written
+    loop_table = table.reset()
+    assert_same_run(FCFS().run(table), table, FCFS(vectorized=False).run(loop_table), loop_table)
@@ -0,0 +1,77 @@
+# tests/test_gantt_lod.py
+import random
+import pytest
+from schedulers.rr import RoundRobin
+from ui.components.gantt_lod import LaneIndex, RowIndex, Viewport, grid_ticks, pixel_bars
+
+
+def slices(seed: int, n: int = 2000):
+    rng = random.Random(seed)
+    starts, ends, t = [], [], 0
+    for _ in range(n):
+        t += rng.choice([0, 0, 3])
+        starts.append(t)
+        t += rng.randint(1, 4)
+        ends.append(t)
+    return starts, ends
+
+
+@pytest.mark.parametrize("width", [50, 400, 5000])
+@pytest.mark.parametrize("seed", range(5))
+def test_bars_cover_every_visible_slice_once(seed, width):
+    starts, ends = slices(seed)
+    t0, t1 = 100.5, ends[-1] * 0.8
+    scale = width / (t1 - t0)
+    bars = list(pixel_bars(starts, ends, t0, t1, scale))
+    visible = [i for i in range(len(starts)) if ends[i] > t0 and starts[i] < t1]
+    assert [i for _, _, first, last in bars for i in range(first, last + 1)] == visible
+    # at most one bar per pixel column, in order and on screen
+    assert len(bars) <= width + 1
+    assert all(a[1] <= b[0] + 1 for a, b in zip(bars, bars[1:]))
+    assert bars[0][0] >= 0 and bars[-1][1] <= width + 1
+
+
+def test_zoomed_in_bars_are_exact():
+    starts, ends = [0, 7, 9, 20], [5, 8, 12, 30]
+    bars = list(pixel_bars(starts, ends, 4, 25, 10.0))
+    assert bars == [(0.0, 10.0, 0, 0), (30.0, 40.0, 1, 1), (50.0, 80.0, 2, 2), (160.0, 210.0, 3, 3)]
+    # slices that meet inside one pixel column share a bar
+    assert list(pixel_bars([0, 5], [5, 9], 0, 10, 10.0)) == [(0.0, 90.0, 0, 1)]
+
+
+def test_viewport_zoom_keeps_the_anchor_and_stays_in_range():
+    view = Viewport(1000)
+    view.zoom(4, 500)
+    assert (view.t0, view.t1) == (375.0, 625.0)
+    view.pan(-10_000)
+    assert (view.t0, view.t1) == (0.0, 250.0)
+    view.zoom(1e9, 100)
+    assert view.span == Viewport.MIN_SPAN and view.t0 <= 100 <= view.t1
+    view.zoom(1e-9, 100)
+    assert (view.t0, view.t1) == (0.0, 1000.0)
+    assert view.time_at(500, 1000) == 500
+
+
+@pytest.mark.parametrize("t0, t1, width", [(0, 1000, 800), (13, 17, 500), (0, 10 ** 7, 300), (5.5, 9000, 610)])
+def test_grid_ticks_are_round_and_spaced(t0, t1, width):
+    step, ticks = grid_ticks(t0, t1, width)
+    assert step >= 1 and str(int(step)).rstrip("0") in ("1", "2", "5")
+    assert step * width / (t1 - t0) >= 60 or step == 1
+    assert ticks and t0 <= ticks[0] < t0 + step and ticks[-1] <= t1
+    assert all(b - a == step for a, b in zip(ticks, ticks[1:]))
+
+
+def test_streamed_rows_match_rows_built_at_once(tasks):
+    timeline = list(RoundRobin(quantum=2).run(tasks).timeline)
+    whole = RowIndex(timeline)
+    streamed = RowIndex()
+    for k in range(0, len(timeline), 7):
+        streamed.extend(timeline[k:k + 7])
+    assert streamed.pids == whole.pids and streamed.max_time == whole.max_time
+    for key, pid in zip(whole.row_keys, whole.pids):
+        other = streamed.row_keys[streamed.pids.index(pid)]
+        assert (list(streamed.starts[other]), list(streamed.ends[other])) == \
+               (list(whole.starts[key]), list(whole.ends[key]))
+    lane = LaneIndex(timeline)
+    assert [(s, e, lane.pid(i)) for i, (s, e) in enumerate(zip(lane.starts, lane.ends))] == \
+           [entry for entry in whole.timeline if entry[2] != "IDLE"]
@@ -0,0 +1,69 @@
+# tests/test_incremental.py
+import random
+import pytest
+from core.incremental import IncrementalSimulator
+from core.simulation_engine import SimulationEngine
+from core.task import Task
+from core.timeline import Timeline
+from evaluation.sweep import SCHEDULERS
+
+SCHEDULER_NAMES = list(SCHEDULERS)
+
+
+def workload(seed: int, n: int = 400):
+    rng = random.Random(seed)
+    return [Task(f"P{i}", 3 * i + rng.randint(0, 2), rng.randint(1, 9), rng.randint(0, 4)) for i in range(n)]
+
+
+def edited(tasks, i: int, burst: int):
+    tasks = list(tasks)
+    t = tasks[i]
+    tasks[i] = Task(t.pid, t.arrival, burst, t.priority)
+    return tasks
+
+
+def assert_matches_fresh_run(result, tasks, scheduler):
+    fresh = SimulationEngine(scheduler).run(tasks)
+    assert list(Timeline.from_entries(result.timeline)) == list(Timeline.from_entries(fresh.timeline))
+    assert result.metrics == fresh.metrics
+    assert (result.context_switches, result.idle_cycles, result.energy) == \
+           (fresh.context_switches, fresh.idle_cycles, fresh.energy)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+@pytest.mark.parametrize("name", SCHEDULER_NAMES)
+def test_resumed_run_matches_fresh_run(name, lazy):
+    scheduler = SCHEDULERS[name]()
+    sim = IncrementalSimulator(scheduler, checkpoint_every=16, lazy=lazy)
+    tasks = workload(1)
+    assert_matches_fresh_run(sim.run(tasks), tasks, scheduler)
+    assert sim.resumed_at is None
+
+    # lazy mode only starts checkpointing on the first edit, so it resumes from the second
+    edits = [edited(tasks, 200, 30)]
+    edits.append(edited(edits[-1], 300, 1))
+    for i, version in enumerate(edits):
+        result = sim.run(version)
+        assert_matches_fresh_run(result, version, scheduler)
+        if i or not lazy:
+            assert sim.resumed_at is not None and sim.resumed_at > 0
+
+    # an edit before the last one keeps resuming from the checkpoints still valid
+    earlier = edited(edits[-1], 100, 12)
+    assert_matches_fresh_run(sim.run(earlier), earlier, scheduler)
+
+
+def test_unchanged_workload_is_not_rerun():
+    sim = IncrementalSimulator(SCHEDULERS["RoundRobin"]())
+    tasks = workload(2)
+    first = sim.run(tasks)
+    assert sim.run(list(tasks)) is first
+
+
+def test_unrelated_workload_runs_from_scratch():
+    scheduler = SCHEDULERS["SRTF"]()
+    sim = IncrementalSimulator(scheduler, checkpoint_every=16)
+    sim.run(workload(3))
+    other = [Task(f"Q{i}", 2 * i, 3, 1) for i in range(100)]
+    assert_matches_fresh_run(sim.run(other), other, scheduler)
+    assert sim.resumed_at is None
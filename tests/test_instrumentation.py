@@ -0,0 +1,58 @@
+# tests/test_instrumentation.py
+import pytest
+from core.instrumentation import Instrumentation
+from core.task import Task
+from evaluation.sweep import SCHEDULERS
+from schedulers.fcfs import FCFS
+from schedulers.rr import RoundRobin
+from schedulers.srtf import SRTF
+
+SCHEDULER_NAMES = list(SCHEDULERS)
+QUEUE_COUNTERS = {"queue_push", "queue_pop", "heap_push", "heap_pop"}
+
+
+def counters(scheduler, tasks):
+    result = Instrumentation().run(scheduler, tasks)
+    return result, result.report.counters
+
+
+def kernel_counters(counts):
+    return {k: v for k, v in counts.items() if k not in QUEUE_COUNTERS}
+
+
+@pytest.mark.parametrize("name", SCHEDULER_NAMES)
+def test_counters_agree_with_the_timeline(tasks, name):
+    result, counts = counters(SCHEDULERS[name](), tasks)
+    timeline = list(result.timeline)
+    assert counts["timeline_entries"] == len(timeline)
+    assert counts["idle_jumps"] == sum(pid == "IDLE" for _, _, pid in timeline)
+    assert counts["context_switches"] == result.context_switches
+    # every slice ends in a completion, a preemption or a quantum expiry
+    assert counts["dispatches"] == len(tasks) + counts["preemptions"] + counts["quantum_expiries"]
+
+
+def test_preemptions_are_counted_where_they_happen():
+    # A is preempted by B, then by C; the split-free timeline is A B A C A
+    tasks = [Task("A", 0, 10, 0), Task("B", 1, 2, 0), Task("C", 5, 1, 0)]
+    _, counts = counters(SRTF(), tasks)
+    assert (counts["dispatches"], counts["preemptions"], counts["quantum_expiries"]) == (5, 2, 0)
+
+
+@pytest.mark.parametrize("fast", [False, True])
+def test_fast_forwarded_rounds_count_their_quantum_expiries(fast):
+    tasks = [Task("A", 0, 10, 0), Task("B", 0, 7, 0), Task("C", 40, 1, 0)]
+    _, counts = counters(RoundRobin(quantum=2, fast=fast), tasks)
+    assert (counts["dispatches"], counts["quantum_expiries"], counts["idle_jumps"]) == (10, 7, 1)
+
+
+def test_round_robin_fast_forward_reports_the_same_counters(tasks):
+    _, slow = counters(RoundRobin(quantum=1, fast=False), tasks)
+    _, fast = counters(RoundRobin(quantum=1, fast=True), tasks)
+    assert kernel_counters(fast) == kernel_counters(slow)
+
+
+def test_fcfs_closed_form_reports_the_kernel_counters(tasks):
+    pytest.importorskip("numpy")
+    _, closed = counters(FCFS(), tasks)
+    _, loop = counters(FCFS(vectorized=False), tasks)
+    assert closed == kernel_counters(loop)
@@ -0,0 +1,258 @@
+# tests/test_kernel.py
+"""
+The shared kernel against the per-scheduler loops it replaced. The
+reference loops below are those loops, reduced to what the schedule
+depends on; every scheduler must reproduce their timeline, start and
+completion times, idle cycles and context switches.
+
+The one intended difference is Round Robin's context-switch count: the old
+loop charged every dispatch, the kernel does not charge a task that is
+re-dispatched because nothing else is ready.
+"""
+import heapq
+import random
+from collections import deque
+import pytest
+from core.kernel import INFINITY, Kernel
+from core.task import Task
+from core.task_table import NO_TIME, TaskTable
+from core.timeline import Timeline
+from schedulers.energy_aware import EnergyAwareScheduler
+from schedulers.fcfs import FCFS
+from schedulers.priority import PriorityScheduler
+from schedulers.rr import RoundRobin
+from schedulers.sjf import SJF
+from schedulers.srtf import SRTF
+
+
+def _admit(table, order, idx, time, push):
+    while idx < len(order) and table.arrival[order[idx]] <= time:
+        push(idx)
+        idx += 1
+    return idx
+
+
+def reference_fcfs(table):
+    timeline, switches, idle, time = [], 0, 0, 0
+    for i in table.arrival_order(by_pid=True):
+        if time < table.arrival[i]:
+            idle += table.arrival[i] - time
+            timeline.append((time, table.arrival[i], "IDLE"))
+            time = table.arrival[i]
+        switches += 1
+        table.start_time[i], time = time, time + table.burst[i]
+        table.completion_time[i] = time
+        timeline.append((table.start_time[i], time, table.pid[i]))
+    return timeline, switches, idle
+
+
+def reference_nonpreemptive(table, key):
+    """SJF (key: burst) and Priority (key: priority); ties go to the earlier arrival."""
+    order = table.arrival_order()
+    ready, timeline, switches, idle, time, idx = [], [], 0, 0, 0, 0
+    while idx < len(order) or ready:
+        idx = _admit(table, order, idx, time, lambda k: heapq.heappush(ready, (key[order[k]], k)))
+        if not ready:
+            nxt = table.arrival[order[idx]]
+            idle += nxt - time
+            timeline.append((time, nxt, "IDLE"))
+            time = nxt
+            continue
+        i = order[heapq.heappop(ready)[1]]
+        switches += 1
+        table.start_time[i], time = time, time + table.burst[i]
+        table.completion_time[i] = time
+        timeline.append((table.start_time[i], time, table.pid[i]))
+    return timeline, switches, idle
+
+
+def reference_srtf(table):
+    order = table.arrival_order()
+    remaining, arrival = table.remaining, table.arrival
+    ready, timeline, switches, idle, time, idx, seq = [], [], 0, 0, 0, 0, 0
+    current, slice_start = None, 0
+
+    def push(row):
+        nonlocal seq
+        heapq.heappush(ready, (remaining[row], seq, row))
+        seq += 1
+
+    while idx < len(order) or ready or current is not None:
+        idx = _admit(table, order, idx, time, lambda k: push(order[k]))
+        if current is None:
+            if not ready:
+                nxt = arrival[order[idx]]
+                idle += nxt - time
+                timeline.append((time, nxt, "IDLE"))
+                time = nxt
+                continue
+            current = heapq.heappop(ready)[2]
+            switches += 1
+            slice_start = time
+            if table.start_time[current] == NO_TIME:
+                table.start_time[current] = time
+        finish = time + remaining[current]
+        if idx == len(order) or finish <= arrival[order[idx]]:
+            timeline.append((slice_start, finish, table.pid[current]))
+            remaining[current] = 0
+            table.completion_time[current] = time = finish
+            current = None
+            continue
+        remaining[current] -= arrival[order[idx]] - time
+        time = arrival[order[idx]]
+        idx = _admit(table, order, idx, time, lambda k: push(order[k]))
+        if ready[0][0] < remaining[current]:
+            timeline.append((slice_start, time, table.pid[current]))
+            push(current)
+            current = None
+    return timeline, switches, idle
+
+
+def reference_energy_aware(table, switch_penalty=2, idle_penalty=1):
+    """Non-preemptive by score, with the running slice cut at every arrival."""
+    order = table.arrival_order()
+    remaining, arrival = table.remaining, table.arrival
+    ready, timeline, switches, idle, time, idx = [], [], 0, 0, 0, 0
+    current = None
+    score = lambda i: 0.6 * remaining[i] + 0.3 * switch_penalty + 0.1 * idle_penalty
+    while idx < len(order) or ready or current is not None:
+        idx = _admit(table, order, idx, time, lambda k: heapq.heappush(ready, (score(order[k]), k)))
+        if current is None:
+            if not ready:
+                nxt = arrival[order[idx]]
+                idle += nxt - time
+                timeline.append((time, nxt, "IDLE"))
+                time = nxt
+                continue
+            current = order[heapq.heappop(ready)[1]]
+            if table.start_time[current] == NO_TIME:
+                table.start_time[current] = time
+            switches += 1
+        finish = time + remaining[current]
+        if idx == len(order) or arrival[order[idx]] >= finish:
+            timeline.append((time, finish, table.pid[current]))
+            remaining[current] = 0
+            table.completion_time[current] = time = finish
+            current = None
+        else:
+            timeline.append((time, arrival[order[idx]], table.pid[current]))
+            remaining[current] -= arrival[order[idx]] - time
+            time = arrival[order[idx]]
+    return timeline, switches, idle
+
+
+def reference_rr(table, quantum, charge_redispatch=False):
+    """The per-quantum Round Robin loop; charge_redispatch=True is the old switch count."""
+    order = table.arrival_order()
+    remaining = table.remaining
+    ready, timeline, switches, idle, time, idx = deque(), [], 0, 0, 0, 0
+    previous = None  # task whose slice just ended; None after idle
+    while idx < len(order) or ready:
+        idx = _admit(table, order, idx, time, lambda k: ready.append(order[k]))
+        if not ready:
+            nxt = table.arrival[order[idx]]
+            idle += nxt - time
+            timeline.append((time, nxt, "IDLE"))
+            time, previous = nxt, None
+            continue
+        i = ready.popleft()
+        switches += charge_redispatch or i != previous
+        run_for = min(quantum, remaining[i])
+        timeline.append((time, time + run_for, table.pid[i]))
+        if table.start_time[i] == NO_TIME:
+            table.start_time[i] = time
+        remaining[i] -= run_for
+        time += run_for
+        idx = _admit(table, order, idx, time, lambda k: ready.append(order[k]))
+        if remaining[i] > 0:
+            ready.append(i)
+        else:
+            table.completion_time[i] = time
+        previous = i
+    return timeline, switches, idle
+
+
+CASES = [
+    (FCFS(vectorized=False), reference_fcfs),
+    (SJF(), lambda t: reference_nonpreemptive(t, t.burst)),
+    (PriorityScheduler(), lambda t: reference_nonpreemptive(t, t.priority)),
+    (SRTF(), reference_srtf),
+    (EnergyAwareScheduler(), reference_energy_aware),
+    (EnergyAwareScheduler(switch_penalty=5, idle_penalty=0), lambda t: reference_energy_aware(t, 5, 0)),
+    (RoundRobin(quantum=1), lambda t: reference_rr(t, 1)),
+    (RoundRobin(quantum=3), lambda t: reference_rr(t, 3)),
+    (RoundRobin(quantum=3, fast=False), lambda t: reference_rr(t, 3)),
+]
+
+
+def assert_same_schedule(result, table, reference, expected):
+    timeline, switches, idle = reference
+    assert list(result.timeline) == timeline
+    assert list(table.start_time) == list(expected.start_time)
+    assert list(table.completion_time) == list(expected.completion_time)
+    assert result.context_switches == switches
+    assert result.idle_cycles == idle
+
+
+@pytest.mark.parametrize("scheduler, reference", CASES, ids=lambda c: getattr(c, "name", ""))
+def test_kernel_matches_reference_loop(tasks, scheduler, reference):
+    table = TaskTable.from_tasks(tasks)
+    expected = table.reset()
+    result = scheduler.run(table)
+    assert_same_schedule(result, table, reference(expected), expected)
+
+
+@pytest.mark.parametrize("quantum", [1, 2, 5])
+def test_round_robin_fast_forward_matches_reference(quantum):
+    # long bursts and sparse arrivals, so whole rounds are skipped
+    tasks = [Task("A", 0, 400), Task("B", 3, 250), Task("C", 900, 7), Task("D", 901, 3000)]
+    table = TaskTable.from_tasks(tasks)
+    expected = table.reset()
+    result = RoundRobin(quantum=quantum).run(table)
+    assert_same_schedule(result, table, reference_rr(expected, quantum), expected)
+
+
+def test_round_robin_does_not_charge_a_redispatch():
+    table = TaskTable.from_tasks([Task("A", 0, 6), Task("B", 10, 2)])
+    result = RoundRobin(quantum=2).run(table)
+    # A runs three quanta alone: one switch in, then one for B after the idle gap
+    assert result.context_switches == 2
+    old_timeline, old_switches, _ = reference_rr(table.reset(), 2, charge_redispatch=True)
+    assert list(result.timeline) == old_timeline
+    assert old_switches == 4
+
+
+def test_round_robin_switches_differ_from_the_old_count_only_by_redispatches(tasks):
+    table = TaskTable.from_tasks(tasks)
+    result = RoundRobin(quantum=2).run(table)
+    timeline, old_switches, _ = reference_rr(table.reset(), 2, charge_redispatch=True)
+    redispatches = sum(1 for a, b in zip(timeline, timeline[1:])
+                       if b[2] != "IDLE" and a[2] == b[2] and a[1] == b[0])
+    assert result.context_switches == old_switches - redispatches
+
+
+@pytest.mark.parametrize("scheduler", [s for s, _ in CASES], ids=lambda s: s.name)
+def test_paused_run_matches_uninterrupted_run(tasks, scheduler):
+    table = TaskTable.from_tasks(tasks)
+    expected = table.reset()
+    whole = scheduler.run(expected)
+
+    policy = scheduler.policy()
+    order = policy.arrival_order(table)
+    policy.bind(table)
+    timeline = []
+    kernel = Kernel(policy, table, timeline.append, fast=getattr(scheduler, "fast", True))
+    kernel.add_arrivals(order)
+    rng = random.Random(len(tasks))
+    # pausing past the last arrival would idle up to the pause, as it should
+    last_arrival = max(t.arrival for t in tasks)
+    until = 0
+    while not kernel.run(until, kernel.slices + rng.randint(1, 4)):
+        if kernel.time >= until:
+            until = min(kernel.time + rng.randint(0, 3), last_arrival) if kernel.time < last_arrival else INFINITY
+
+    # pauses split idle gaps, never a task's slices
+    assert list(Timeline.from_entries(timeline)) == list(Timeline.from_entries(whole.timeline))
+    assert list(table.start_time) == list(expected.start_time)
+    assert list(table.completion_time) == list(expected.completion_time)
+    assert (kernel.context_switches, kernel.idle_cycles) == (whole.context_switches, whole.idle_cycles)
@@ -0,0 +1,69 @@
+# tests/test_metrics.py
+import pytest
+import evaluation.metrics as metrics_module
+from core.task_table import TaskTable
+from core.timeline import Timeline
+from evaluation.energy_model import EnergyParams, compute_energy
+from evaluation.metrics import compact_timeline, compute_active_cycles, evaluate_simulation, rescore_energy
+from schedulers.srtf import SRTF
+
+
+def finished_run(tasks):
+    table = TaskTable.from_tasks(tasks)
+    result = SRTF().run(table)
+    timeline = list(result.timeline)
+    finished = [t.clone() for t in table]
+    for task, row in zip(finished, table):
+        task.start_time, task.completion_time = row.start_time, row.completion_time
+    return table, finished, timeline, result
+
+
+def evaluations(tasks):
+    table, finished, timeline, result = finished_run(tasks)
+    args = (result.context_switches, result.idle_cycles, "SRTF")
+    return [
+        evaluate_simulation(finished, timeline, *args),
+        evaluate_simulation(table, timeline, *args),
+        evaluate_simulation(table, compact_timeline(timeline), *args),
+        evaluate_simulation(table, Timeline.from_entries(timeline, merge=False), *args),
+    ], timeline
+
+
+def test_every_timeline_form_evaluates_alike(tasks):
+    results, timeline = evaluations(tasks)
+    first = results[0]
+    for other in results[1:]:
+        assert other.metrics == first.metrics
+        assert other.energy == first.energy
+        assert list(other.timeline) == timeline
+
+
+def test_pure_python_fallback_evaluates_alike(tasks, monkeypatch):
+    with_numpy, _ = evaluations(tasks)
+    monkeypatch.setattr(metrics_module, "np", None)
+    without, _ = evaluations(tasks)
+    assert [r.metrics for r in without] == [r.metrics for r in with_numpy]
+
+
+def test_compact_timeline_round_trips_and_counts_active_time():
+    timeline = [(0, 2, "A"), (2, 5, "IDLE"), (5, 6, "B"), (6, 9, "A")]
+    compact = compact_timeline(timeline)
+    assert compact.pids == ["A", "B"]
+    assert compact.to_entries() == timeline
+    assert compute_active_cycles(timeline) == compute_active_cycles(compact) == 6
+
+
+def test_totals_and_span():
+    result = finished_run([])[3]
+    assert result.metrics["total_tasks"] == 0 and result.metrics["throughput"] == 0.0
+    result = finished_run(TaskTable.from_columns(["A", "B"], [0, 4], [3, 2]).to_tasks())[3]
+    assert result.metrics["avg_wait"] == 0 and result.metrics["avg_turnaround"] == 2.5
+    assert result.metrics["timeline_length"] == 6 and result.metrics["throughput"] == pytest.approx(2 / 6)
+    assert result.idle_cycles == 1
+
+
+def test_rescoring_matches_a_fresh_energy_computation(tasks):
+    result = finished_run(tasks)[3]
+    params = EnergyParams(alpha=2.0, beta=3.0, gamma=0.1)
+    assert rescore_energy(result, params) == compute_energy(result.metrics["active_steps"],
+                                                            result.context_switches, result.idle_cycles, params)
@@ -0,0 +1,80 @@
+# tests/test_race.py
+import multiprocessing
+import threading
+import time
+import pytest
+from core.background import CancelToken, SimulationCancelled
+from core.race import RaceRunner, SharedTaskTable
+from core.task import Task
+from core.task_table import TaskTable
+from core.trace_io import write_tasks
+from evaluation.sweep import SCHEDULERS
+from schedulers.rr import RoundRobin
+
+
+def workload(n: int):
+    return TaskTable.from_tasks([Task(f"P{i}", i // 2, 1 + 7 * i % 13, i % 4) for i in range(n)])
+
+
+def test_shared_table_round_trips_any_pid():
+    pids = ["P1", "", "a\0b", "\0", "ünï", "x" * 100]
+    table = TaskTable.from_columns(pids, range(6), [3] * 6, [1, 2, 3, 4, 5, 6])
+    shared = SharedTaskTable(table)
+    try:
+        shm, copy = SharedTaskTable.attach(shared.handle)
+        assert copy.pid == pids
+        assert list(copy.arrival) == list(table.arrival) and list(copy.priority) == list(table.priority)
+        del copy
+        shm.close()
+    finally:
+        shared.close()
+
+
+def assert_same_results(left, right):
+    assert [s.name for s, _ in left] == [s.name for s, _ in right]
+    for (_, a), (_, b) in zip(left, right):
+        assert list(a.timeline) == list(b.timeline)
+        assert (a.metrics, a.context_switches, a.idle_cycles, a.energy) == \
+               (b.metrics, b.context_switches, b.idle_cycles, b.energy)
+
+
+def test_parallel_race_matches_serial_race(tmp_path):
+    schedulers = [SCHEDULERS[name]() for name in SCHEDULERS]
+    table = workload(3000)
+    serial = RaceRunner(schedulers, parallel=False).run_all(table)
+    parallel = RaceRunner(schedulers, max_workers=2, min_parallel_tasks=0).run_all(table)
+    assert_same_results(parallel, serial)
+
+    path = str(tmp_path / "tasks.trace")
+    write_tasks(path, table)
+    assert_same_results(RaceRunner(schedulers, max_workers=2, min_parallel_tasks=0).run_all(path), serial)
+
+
+def test_unordered_race_yields_every_scheduler_once():
+    schedulers = [RoundRobin(q) for q in (1, 2, 3, 4)]
+    results = list(RaceRunner(schedulers, ordered=False, max_workers=2, min_parallel_tasks=0)
+                   .iter_results(workload(500)))
+    assert sorted(s.quantum for s, _ in results) == [1, 2, 3, 4]
+
+
+def test_in_process_race_is_cancelled_mid_run():
+    cancel = CancelToken()
+    timer = threading.Timer(0.05, cancel.cancel)
+    timer.start()
+    t0 = time.perf_counter()
+    with pytest.raises(SimulationCancelled):
+        list(RaceRunner([RoundRobin(1, fast=False)], parallel=False).iter_results(workload(400_000), cancel))
+    assert time.perf_counter() - t0 < 2.0
+    timer.join()
+
+
+def test_cancelled_parallel_race_kills_its_workers():
+    cancel = CancelToken()
+    threading.Timer(0.2, cancel.cancel).start()
+    schedulers = [RoundRobin(1, fast=False), SCHEDULERS["SRTF"]()]
+    with pytest.raises(SimulationCancelled):
+        list(RaceRunner(schedulers, max_workers=2, min_parallel_tasks=0).iter_results(workload(400_000), cancel))
+    deadline = time.monotonic() + 5
+    while multiprocessing.active_children() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not multiprocessing.active_children()
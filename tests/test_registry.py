@@ -0,0 +1,104 @@
+# tests/test_registry.py
+import sys
+from importlib.metadata import EntryPoint
+import pytest
+import schedulers.registry as registry
+from schedulers.registry import REGISTRY, Param, SchedulerRegistry, SchedulerSpec
+from schedulers.rr import RoundRobin
+
+PLUGIN = '''
+from schedulers.fcfs import FCFS
+from schedulers.registry import Param, SchedulerSpec
+
+class Lottery(FCFS):
+    name = "Lottery"
+    param_schema = (Param("tickets", int, 10, min=1),)
+
+    def __init__(self, tickets=10):
+        super().__init__()
+        self.tickets = tickets
+
+SPEC = SchedulerSpec("Stride", "lottery_plugin:Lottery", (Param("tickets", int, 3, max=5),))
+'''
+
+
+@pytest.mark.parametrize("param, text, value", [
+    (Param("quantum", int), "4", 4),
+    (Param("penalty", float), "2.5", 2.5),
+    (Param("fast", bool), " Yes", True),
+    (Param("fast", bool), "off", False),
+    (Param("mode", str, choices=("a", "b")), "b", "b"),
+])
+def test_text_values_are_coerced(param, text, value):
+    assert param.coerce(text) == value and type(param.coerce(text)) is type(value)
+
+
+@pytest.mark.parametrize("param, text", [
+    (Param("quantum", int), "2.5"),
+    (Param("quantum", int), None),
+    (Param("fast", bool), "maybe"),
+    (Param("quantum", int, min=1), "0"),
+    (Param("penalty", float, max=1), "1.5"),
+    (Param("mode", str, choices=("a", "b")), "c"),
+])
+def test_bad_values_raise_value_error(param, text):
+    with pytest.raises(ValueError, match=param.name):
+        param.coerce(text)
+
+
+def test_create_and_from_config_coerce_declared_params():
+    spec = REGISTRY["RoundRobin"]
+    rr = spec.create(quantum="5", fast=False)
+    assert isinstance(rr, RoundRobin) and (rr.quantum, rr.fast) == (5, False)
+    # shared control values: undeclared ones are ignored
+    rr = spec.from_config({"quantum": "3", "switch_penalty": "9"})
+    assert rr.quantum == 3
+    with pytest.raises(ValueError):
+        spec.from_config({"quantum": "0"})
+    energy = REGISTRY.create("EnergyAware", switch_penalty="0.5")
+    assert energy.switch_penalty == 0.5
+    assert spec.defaults() == {"quantum": 2}
+
+
+def test_unknown_and_duplicate_names():
+    with pytest.raises(KeyError, match="RoundRobin"):
+        REGISTRY["Nope"]
+    with pytest.raises(ValueError, match="already registered"):
+        REGISTRY.register(SchedulerSpec("FCFS", "schedulers.fcfs:FCFS"))
+
+
+@pytest.fixture
+def plugin(tmp_path, monkeypatch):
+    (tmp_path / "lottery_plugin.py").write_text(PLUGIN)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "lottery_plugin", raising=False)
+    points = [EntryPoint("Lottery", "lottery_plugin:Lottery", registry.ENTRY_POINT_GROUP),
+              EntryPoint("Stride", "lottery_plugin:SPEC", registry.ENTRY_POINT_GROUP),
+              EntryPoint("FCFS", "lottery_plugin:Lottery", registry.ENTRY_POINT_GROUP)]
+    monkeypatch.setattr(registry, "entry_points",
+                        lambda group: points if group == registry.ENTRY_POINT_GROUP else [])
+    reg = SchedulerRegistry()
+    reg.register(SchedulerSpec("FCFS", "schedulers.fcfs:FCFS"))
+    yield reg
+    sys.modules.pop("lottery_plugin", None)
+
+
+def test_entry_points_are_listed_without_importing_them(plugin):
+    assert list(plugin) == ["FCFS", "Lottery", "Stride"]
+    assert "lottery_plugin" not in sys.modules
+    # built-in names take precedence over plugins
+    assert plugin["FCFS"].target == "schedulers.fcfs:FCFS"
+
+
+def test_entry_point_classes_and_specs_supply_their_params(plugin):
+    lottery = plugin.create("Lottery", tickets="7")
+    assert type(lottery).__name__ == "Lottery" and lottery.tickets == 7
+    assert plugin["Lottery"].defaults() == {"tickets": 10}
+    with pytest.raises(ValueError):
+        plugin.create("Lottery", tickets="0")
+
+    stride = plugin["Stride"]
+    assert stride.create(tickets="4").tickets == 4
+    assert stride.defaults() == {"tickets": 3}
+    with pytest.raises(ValueError):
+        stride.create(tickets="6")
@@ -0,0 +1,97 @@
+# tests/test_replication.py
+import csv
+import math
+import random
+import statistics
+import pytest
+from core.simulation_engine import SimulationEngine
+from evaluation.energy_model import DEFAULT_ENERGY_PARAMS
+from evaluation.replication import RunningStats, WorkloadSpec, replicate, t_quantile
+from evaluation.sweep import SCHEDULERS, SweepPoint, Uniform
+
+SMALL = WorkloadSpec(tasks=12, arrival=Uniform(0, 20), burst=Uniform(1, 10))
+
+
+@pytest.mark.parametrize("df, quantile", [
+    # two-sided 95% critical values from standard t tables
+    (1, 12.7062), (2, 4.3027), (3, 3.1824), (5, 2.5706), (10, 2.2281), (29, 2.0452), (30, 2.0423),
+    (31, 2.0395), (100, 1.9840), (1000, 1.9623),
+])
+def test_t_quantiles_match_tables(df, quantile):
+    assert t_quantile(0.975, df) == pytest.approx(quantile, abs=1e-4)
+
+
+def test_t_quantiles_approach_the_normal():
+    assert t_quantile(0.995, 4) == pytest.approx(4.6041, abs=1e-4)
+    assert t_quantile(0.9, 10 ** 6) == pytest.approx(statistics.NormalDist().inv_cdf(0.9), abs=1e-5)
+
+
+def test_running_stats_match_two_pass_formulas():
+    rng = random.Random(0)
+    values = [rng.uniform(1e6, 1e6 + 10) for _ in range(500)]
+    stats = RunningStats()
+    assert (stats.variance, stats.half_width(0.95)) == (0.0, math.inf)
+    for x in values:
+        stats.add(x)
+    assert stats.mean == pytest.approx(statistics.fmean(values), rel=1e-12)
+    assert stats.variance == pytest.approx(statistics.variance(values), rel=1e-9)
+    assert stats.half_width(0.95) == pytest.approx(
+        t_quantile(0.975, 499) * statistics.stdev(values) / math.sqrt(500), rel=1e-9)
+
+
+def test_estimates_are_the_mean_and_interval_over_seeded_workloads():
+    results = replicate(["SRTF", "FCFS"], SMALL, max_replications=8, batch_size=3, seed=5, parallel=False)
+    seeds = random.Random(5)
+    waits = {"SRTF": [], "FCFS": []}
+    for _ in range(8):
+        table = SMALL.generate(seeds.getrandbits(63))
+        for name in waits:
+            waits[name].append(SimulationEngine(SCHEDULERS[name]()).run(table.reset()).metrics["avg_wait"])
+    assert results.replications == 8 and not results.converged
+    for i, name in enumerate(waits):
+        estimate = results[i]["avg_wait"]
+        assert estimate.mean == pytest.approx(statistics.fmean(waits[name]))
+        assert estimate.half_width == pytest.approx(
+            t_quantile(0.975, 7) * statistics.stdev(waits[name]) / math.sqrt(8))
+        assert estimate.low < estimate.mean < estimate.high
+
+
+def test_runs_are_reproducible_and_independent_of_the_pool():
+    kwargs = dict(spec=SMALL, max_replications=12, batch_size=4, seed=3)
+    serial = replicate(["RoundRobin", "SJF"], parallel=False, **kwargs)
+    again = replicate(["RoundRobin", "SJF"], parallel=False, **kwargs)
+    pooled = replicate(["RoundRobin", "SJF"], max_workers=2, **kwargs)
+    assert serial.estimates == again.estimates == pooled.estimates
+    assert serial.tail_metrics(0) == pooled.tail_metrics(0)
+
+
+def test_stops_early_once_every_interval_is_narrow_enough():
+    loose = replicate(["FCFS", "SRTF"], SMALL, target_width=0.5, min_replications=6, batch_size=3,
+                      max_replications=300, parallel=False)
+    assert loose.converged and loose.replications in (6, 9, 12)
+    for per_point in loose.estimates:
+        for e in per_point.values():
+            assert e.half_width <= 0.5 * (abs(e.mean) or 1)
+
+    tight = replicate(["FCFS"], SMALL, target_width=1e-6, batch_size=5, max_replications=20, parallel=False)
+    assert not tight.converged and tight.replications == 20
+
+
+def test_points_share_workloads_and_simulations():
+    fast = SweepPoint("RoundRobin", (("quantum", 2),), DEFAULT_ENERGY_PARAMS)
+    costly = fast._replace(energy=DEFAULT_ENERGY_PARAMS._replace(beta=DEFAULT_ENERGY_PARAMS.beta * 10))
+    results = replicate([fast, costly, "RoundRobin"], SMALL, max_replications=6, parallel=False)
+    # common random numbers: the same schedule, rescored with other weights
+    assert results[0]["avg_wait"] == results[1]["avg_wait"] == results[2]["avg_wait"]
+    assert results[1]["energy"].mean > results[0]["energy"].mean
+
+
+def test_csv_has_a_row_per_point_and_metric(tmp_path):
+    results = replicate(["FCFS", "SJF"], SMALL, max_replications=4, parallel=False)
+    path = tmp_path / "ci.csv"
+    results.write_csv(str(path))
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 2 * 4 and {row["replications"] for row in rows} == {"4"}
+    first = rows[0]
+    assert float(first["low"]) == pytest.approx(float(first["mean"]) - float(first["half_width"]))
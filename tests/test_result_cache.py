@@ -0,0 +1,88 @@
+# tests/test_result_cache.py
+import os
+from core.result_cache import ResultCache, workload_fingerprint
+from core.simulation_engine import SimulationEngine
+from core.task import Task
+from core.task_table import TaskTable
+from evaluation.energy_model import EnergyParams
+from evaluation.sweep import SCHEDULERS
+from schedulers.rr import RoundRobin
+
+WORKLOAD = [Task(f"P{i}", 2 * i, 1 + i % 4, i % 3) for i in range(20)]
+
+
+def run(scheduler, tasks=WORKLOAD):
+    return SimulationEngine(scheduler).run(tasks)
+
+
+def test_fingerprint_covers_every_input_column_and_splits_pids_unambiguously():
+    table = TaskTable.from_tasks(WORKLOAD)
+    assert workload_fingerprint(table) == workload_fingerprint(TaskTable.from_tasks(WORKLOAD))
+    for changed in ([Task("P0", 1, 1, 0)], [Task("P0", 0, 2, 0)], [Task("P0", 0, 1, 1)], [Task("Q0", 0, 1, 0)]):
+        assert workload_fingerprint(TaskTable.from_tasks(changed + WORKLOAD[1:])) != workload_fingerprint(table)
+    joined = TaskTable.from_columns(["a\0", "b"], [0, 0], [1, 1])
+    split = TaskTable.from_columns(["a", "\0b"], [0, 0], [1, 1])
+    assert workload_fingerprint(joined) != workload_fingerprint(split)
+
+
+def test_key_depends_on_scheduler_parameters():
+    assert ResultCache.key(WORKLOAD, RoundRobin(2)) != ResultCache.key(WORKLOAD, RoundRobin(3))
+    fingerprint = workload_fingerprint(TaskTable.from_tasks(WORKLOAD))
+    assert ResultCache.key(None, RoundRobin(2), fingerprint) == ResultCache.key(WORKLOAD, RoundRobin(2))
+
+
+def test_memory_tier_is_lru():
+    cache = ResultCache(max_entries=2)
+    schedulers = [RoundRobin(q) for q in (1, 2, 3)]
+    for s in schedulers[:2]:
+        cache.put(WORKLOAD, s, run(s))
+    assert cache.get(WORKLOAD, schedulers[0]) is not None  # now most recently used
+    cache.put(WORKLOAD, schedulers[2], run(schedulers[2]))
+    assert cache.get(WORKLOAD, schedulers[1]) is None
+    assert cache.get(WORKLOAD, schedulers[0]) is not None
+    assert cache.stats() == {"memory_hits": 2, "disk_hits": 0, "misses": 1, "hit_rate": 2 / 3,
+                             "memory_entries": 2}
+
+
+def test_get_returns_an_independent_copy_rescored_for_energy():
+    cache = ResultCache()
+    s = SCHEDULERS["SRTF"]()
+    result = run(s)
+    cache.put(WORKLOAD, s, result)
+    first = cache.get(WORKLOAD, s)
+    first.timeline.clear()
+    first.metrics.clear()
+    second = cache.get(WORKLOAD, s)
+    assert second.timeline == result.timeline and second.metrics == result.metrics
+    heavy = cache.get(WORKLOAD, s, EnergyParams(alpha=10.0, beta=1.0, gamma=1.0))
+    assert heavy.energy != result.energy and heavy.metrics == result.metrics
+
+
+def test_disk_tier_survives_a_new_cache_and_skips_corrupt_entries(tmp_path):
+    s = SCHEDULERS["Priority"]()
+    result = run(s)
+    ResultCache(directory=str(tmp_path)).put(WORKLOAD, s, result)
+    cache = ResultCache(directory=str(tmp_path))
+    hit = cache.get(WORKLOAD, s)
+    assert list(hit.timeline) == list(result.timeline) and hit.metrics == result.metrics
+    assert cache.stats()["disk_hits"] == 1
+
+    (entry,) = os.listdir(tmp_path)
+    (tmp_path / entry).write_bytes(b"not a pickle")
+    assert ResultCache(directory=str(tmp_path)).get(WORKLOAD, s) is None
+
+
+def test_disk_tier_is_trimmed_to_its_budget(tmp_path):
+    cache = ResultCache(directory=str(tmp_path), max_disk_bytes=1)
+    for q in (1, 2, 3):
+        cache.put(WORKLOAD, RoundRobin(q), run(RoundRobin(q)))
+    assert len(os.listdir(tmp_path)) <= 1
+
+
+def test_engine_serves_repeated_runs_from_the_cache():
+    cache = ResultCache()
+    engine = SimulationEngine(SCHEDULERS["SJF"](), cache=cache)
+    first = engine.run(WORKLOAD)
+    second = engine.run(TaskTable.from_tasks(WORKLOAD))
+    assert second is not first and second.metrics == first.metrics
+    assert (cache.misses, cache.memory_hits) == (1, 1)
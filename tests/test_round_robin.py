@@ -0,0 +1,47 @@
+# tests/test_round_robin.py
+import pytest
+from conftest import random_tasks
+from core.task import Task
+from core.timeline import Timeline
+from schedulers.rr import RoundRobin
+
+
+@pytest.mark.parametrize("quantum", [1, 2, 7])
+@pytest.mark.parametrize("seed", range(10))
+def test_fast_forward_gives_the_per_quantum_schedule(seed, quantum):
+    # long bursts with few arrivals, so most rounds are skipped
+    tasks = random_tasks(seed, n=12, horizon=400, max_burst=300)
+    fast = RoundRobin(quantum=quantum).run(tasks)
+    slow = RoundRobin(quantum=quantum, fast=False).run(tasks)
+    assert list(fast.timeline) == list(slow.timeline)
+    assert fast.metrics == slow.metrics
+    assert (fast.context_switches, fast.idle_cycles) == (slow.context_switches, slow.idle_cycles)
+
+
+def test_a_lone_task_is_skipped_to_its_end():
+    # one slice per quantum would be a billion iterations
+    result = RoundRobin(quantum=1, compress=True).run([Task("A", 0, 10 ** 9), Task("B", 10 ** 9 + 5, 3)])
+    assert list(result.timeline) == [(0, 10 ** 9, "A"), (10 ** 9, 10 ** 9 + 5, "IDLE"),
+                                     (10 ** 9 + 5, 10 ** 9 + 8, "B")]
+    assert result.context_switches == 2
+
+
+def test_rounds_stop_at_the_next_arrival():
+    tasks = [Task("A", 0, 100), Task("B", 0, 100), Task("C", 51, 1)]
+    result = RoundRobin(quantum=5).run(tasks)
+    # C arrives during A's quantum at 50..55 and runs right after B's next one
+    timeline = list(result.timeline)
+    c = next(i for i, entry in enumerate(timeline) if entry[2] == "C")
+    assert timeline[c - 1] == (55, 60, "B") and timeline[c][0] == 60
+    assert list(RoundRobin(quantum=5, fast=False).run(tasks).timeline) == timeline
+
+
+@pytest.mark.parametrize("fast", [False, True])
+def test_compress_merges_repeated_slices(fast):
+    tasks = [Task("A", 0, 9), Task("B", 20, 4)]
+    plain = RoundRobin(quantum=2, fast=fast).run(tasks)
+    compressed = RoundRobin(quantum=2, fast=fast, compress=True).run(tasks)
+    assert isinstance(compressed.timeline, Timeline)
+    assert list(compressed.timeline) == [(0, 9, "A"), (9, 20, "IDLE"), (20, 24, "B")]
+    assert list(Timeline.from_entries(plain.timeline)) == list(compressed.timeline)
+    assert compressed.metrics == plain.metrics
@@ -0,0 +1,43 @@
+# tests/test_smp.py
+import pytest
+from core.smp import SMPEngine, PullMigration, PushMigration, WorkStealing
+from core.simulation_engine import SimulationEngine
+from core.task import Task
+from core.timeline import Timeline
+from evaluation.sweep import SCHEDULERS
+
+SCHEDULER_NAMES = list(SCHEDULERS)
+
+
+@pytest.mark.parametrize("name", SCHEDULER_NAMES)
+def test_one_cpu_matches_single_cpu_scheduler(tasks, name):
+    scheduler = SCHEDULERS[name]()
+    single = SimulationEngine(scheduler).run(tasks)
+    smp = SMPEngine(scheduler, cpus=1).run(tasks)
+
+    assert list(Timeline.from_entries(smp.timeline)) == list(Timeline.from_entries(single.timeline))
+    assert {k: smp.metrics[k] for k in single.metrics} == single.metrics
+    assert (smp.context_switches, smp.idle_cycles, smp.energy) == \
+           (single.context_switches, single.idle_cycles, single.energy)
+    assert smp.migrations == 0
+
+
+@pytest.mark.parametrize("balancer", [None, PushMigration(5), PullMigration(), WorkStealing(3)],
+                         ids=["place", "push", "pull", "steal"])
+@pytest.mark.parametrize("name", SCHEDULER_NAMES)
+def test_every_cpu_runs_one_task_at_a_time(tasks, name, balancer):
+    result = SMPEngine(SCHEDULERS[name](), cpus=3, balancer=balancer).run(tasks)
+    assert sum(end - start for start, end, pid in result.timeline if pid != "IDLE") == \
+           sum(t.burst for t in tasks)
+    for timeline in result.cpu_timelines:
+        assert all(a[1] <= b[0] for a, b in zip(timeline, timeline[1:]))
+
+
+@pytest.mark.parametrize("balancer", [PushMigration(5), WorkStealing(3)], ids=["push", "steal"])
+def test_repeated_runs_give_the_same_schedule(balancer):
+    engine = SMPEngine(SCHEDULERS["RoundRobin"](), cpus=3, balancer=balancer)
+    tasks = [Task(f"P{i}", i // 3, 1 + 7 * i % 11, 0) for i in range(300)]
+    first, second = engine.run(tasks), engine.run(tasks)
+    assert first.migrations
+    assert second.cpu_timelines == first.cpu_timelines
+    assert second.migrations == first.migrations
@@ -0,0 +1,42 @@
+# tests/test_srtf.py
+from core.task import Task
+from core.task_table import TaskTable
+from schedulers.srtf import SRTF
+
+
+def run(tasks):
+    table = TaskTable.from_tasks(tasks)
+    return SRTF().run(table), table
+
+
+def test_only_strictly_shorter_arrivals_preempt():
+    # at 2, B (3) is shorter than A's 4 left and preempts it; at 4, C (1) ties with B's 1 left
+    result, table = run([Task("A", 0, 6), Task("B", 2, 3), Task("C", 4, 1)])
+    assert list(result.timeline) == [(0, 2, "A"), (2, 5, "B"), (5, 6, "C"), (6, 10, "A")]
+    assert [r.completion_time for r in table] == [10, 5, 6]
+
+
+def test_equal_remaining_does_not_preempt():
+    result, table = run([Task("A", 0, 5), Task("B", 2, 3), Task("C", 4, 1)])
+    assert list(result.timeline) == [(0, 5, "A"), (5, 6, "C"), (6, 9, "B")]
+    assert result.context_switches == 3
+
+
+def test_equal_remaining_in_the_queue_runs_in_queue_order():
+    result, _ = run([Task("A", 0, 1), Task("B", 0, 4), Task("C", 0, 4)])
+    assert [pid for _, _, pid in result.timeline] == ["A", "B", "C"]
+
+
+def test_cost_does_not_depend_on_burst_length():
+    tasks = [Task(f"P{i}", 3 * i, 1 + 5 * i % 7) for i in range(300)]
+    scale = 10 ** 6
+    short, _ = run(tasks)
+    long, _ = run([Task(t.pid, t.arrival * scale, t.burst * scale) for t in tasks])
+    # event-driven: the same slices, stretched, and at most one extra slice per preemption
+    assert [(s * scale, e * scale, pid) for s, e, pid in short.timeline] == list(long.timeline)
+    assert len(long.timeline) <= 2 * len(tasks)
+
+
+def test_a_task_running_across_arrivals_is_one_slice():
+    result, _ = run([Task("A", 0, 10)] + [Task(f"B{i}", i + 1, 20) for i in range(5)])
+    assert list(result.timeline)[0] == (0, 10, "A")
@@ -0,0 +1,38 @@
+# tests/test_streaming.py
+import pytest
+from core.simulation_engine import SimulationEngine
+from core.streaming import StreamingEngine
+from evaluation.sweep import SCHEDULERS
+
+SCHEDULER_NAMES = list(SCHEDULERS)
+
+
+@pytest.mark.parametrize("name", SCHEDULER_NAMES)
+def test_stream_matches_batch(tasks, name):
+    scheduler = SCHEDULERS[name]()
+    batch = SimulationEngine(scheduler).run(tasks)
+    segments, completions = [], []
+    stream = StreamingEngine(scheduler).run(tasks, segments.append, completions.append)
+
+    assert [tuple(seg) for seg in segments] == list(batch.timeline)
+    assert stream.metrics == batch.metrics
+    assert (stream.context_switches, stream.idle_cycles, stream.energy) == \
+           (batch.context_switches, batch.idle_cycles, batch.energy)
+    finished = {c.pid: (c.start_time, c.completion_time) for c in completions}
+    assert len(finished) == len(tasks)
+    start_time, completion_time = {}, {}
+    for start, end, pid in batch.timeline:
+        start_time.setdefault(pid, start)
+        completion_time[pid] = end
+    assert finished == {pid: (start_time[pid], completion_time[pid]) for pid in finished}
+
+
+@pytest.mark.parametrize("name", SCHEDULER_NAMES)
+def test_stream_leaves_its_input_untouched(tasks, name):
+    engine = StreamingEngine(SCHEDULERS[name]())
+    first = engine.run(tasks)
+    assert all(t.remaining == t.burst and t.start_time is None and t.completion_time is None for t in tasks)
+    # the same Task list streamed again, without cloning, gives the same run
+    second = StreamingEngine(SCHEDULERS[name]()).run(tasks)
+    assert second.metrics == first.metrics
+    assert second.context_switches == first.context_switches
@@ -0,0 +1,76 @@
+# tests/test_sweep.py
+import csv
+import itertools
+import random
+import pytest
+from core.simulation_engine import SimulationEngine
+from evaluation.energy_model import DEFAULT_ENERGY_PARAMS, EnergyParams
+from evaluation.metrics import rescore_energy
+from evaluation.sweep import ParameterSweep, SearchSpace, Uniform, grid, pareto_front, random_search
+from schedulers.rr import RoundRobin
+
+
+def brute_force_front(rows, objectives):
+    def dominates(a, b):
+        va, vb = [a[o] for o in objectives], [b[o] for o in objectives]
+        return all(x <= y for x, y in zip(va, vb)) and va != vb
+    return [r for r in rows if not any(dominates(o, r) for o in rows)]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_pareto_front_matches_brute_force(seed):
+    rng = random.Random(seed)
+    rows = [{"id": i, "energy": rng.randint(0, 9), "avg_wait": rng.randint(0, 9), "x": rng.random()}
+            for i in range(40)]
+    for objectives in (("energy", "avg_wait"), ("energy", "avg_wait", "x")):
+        front = pareto_front(rows, objectives)
+        assert sorted(r["id"] for r in front) == sorted(r["id"] for r in brute_force_front(rows, objectives))
+
+
+def test_grid_is_the_cartesian_product_with_default_weights():
+    space = SearchSpace("RoundRobin", {"quantum": [1, 2, 4]}, {"beta": [0.1, 1.0]})
+    points = list(grid([space, SearchSpace("SJF")]))
+    assert len(points) == 3 * 2 + 1
+    assert {(dict(p.params)["quantum"], p.energy.beta) for p in points[:6]} == \
+           set(itertools.product([1, 2, 4], [0.1, 1.0]))
+    assert all(p.energy.alpha == DEFAULT_ENERGY_PARAMS.alpha for p in points)
+    assert points[-1].scheduler == "SJF" and points[-1].params == ()
+    with pytest.raises(ValueError):
+        list(grid([SearchSpace("RoundRobin", {"quantum": Uniform(1, 4)})]))
+
+
+def test_random_search_is_seeded_and_stays_in_its_domains():
+    spaces = [SearchSpace("RoundRobin", {"quantum": Uniform(1, 8)}, {"gamma": Uniform(0.0, 1.0)}),
+              SearchSpace("SRTF", energy={"beta": [0.5, 2.0]})]
+    points = list(random_search(spaces, 50, seed=3))
+    assert points == list(random_search(spaces, 50, seed=3))
+    assert {p.scheduler for p in points} == {"RoundRobin", "SRTF"}
+    for p in points:
+        if p.scheduler == "RoundRobin":
+            q = dict(p.params)["quantum"]
+            assert isinstance(q, int) and 1 <= q <= 8 and 0.0 <= p.energy.gamma <= 1.0
+        else:
+            assert p.energy.beta in (0.5, 2.0)
+
+
+def test_sweep_simulates_each_config_once_and_rescores_energy(tasks, tmp_path):
+    space = SearchSpace("RoundRobin", {"quantum": [1, 3]}, {"alpha": [1.0, 2.0], "beta": [0.0, 5.0]})
+    sweep = ParameterSweep(tasks, parallel=False)
+    results = sweep.run(grid([space]))
+    assert len(results) == 8 and sweep.simulations == 2
+    sweep.run(grid([space]))
+    assert sweep.simulations == 2
+
+    for row in results.rows:
+        quantum = int(row["params"].split("=")[1])
+        direct = SimulationEngine(RoundRobin(quantum)).run(tasks)
+        weights = EnergyParams(row["alpha"], row["beta"], row["gamma"])
+        assert row["energy"] == rescore_energy(direct, weights)
+        assert row["avg_wait"] == direct.metrics["avg_wait"]
+
+    path = tmp_path / "sweep.csv"
+    results.write_csv(str(path))
+    with open(path, newline="") as f:
+        assert len(list(csv.DictReader(f))) == 8
+    assert results.pareto_front() == pareto_front(results.rows, ("energy", "avg_wait"))
+    assert results.to_columns()["scheduler"] == ["RoundRobin"] * 8
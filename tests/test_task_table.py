@@ -0,0 +1,64 @@
+# tests/test_task_table.py
+import pytest
+from core.task import Task
+from core.task_table import NO_TIME, TaskTable, as_task_table
+from evaluation.metrics import evaluate_simulation
+
+TASKS = [Task("A", 0, 3, 2), Task("B", 1, 2, 1), Task("C", 1, 4, 3)]
+
+
+def test_columns_and_rows_mirror_the_tasks():
+    table = TaskTable.from_tasks(TASKS)
+    assert len(table) == 3 and table.pid == ["A", "B", "C"]
+    assert [(r.pid, r.arrival, r.burst, r.priority) for r in table] == \
+           [(t.pid, t.arrival, t.burst, t.priority) for t in TASKS]
+    assert table[-1].pid == "C"
+    with pytest.raises(IndexError):
+        table[3]
+    assert table.to_tasks() == [Task(t.pid, t.arrival, t.burst, t.priority) for t in TASKS]
+    assert as_task_table(table) is table
+
+
+def test_rows_write_through_to_the_simulation_columns():
+    table = TaskTable.from_tasks(TASKS)
+    row = table[1]
+    assert (row.remaining, row.start_time, row.completion_time) == (2, None, None)
+    row.remaining, row.start_time, row.completion_time = 1, 4, 6
+    assert (table.remaining[1], table.start_time[1], table.completion_time[1]) == (1, 4, 6)
+    row.start_time = None
+    assert table.start_time[1] == NO_TIME and row.start_time is None
+    assert row.clone() == Task("B", 1, 2, 1)
+
+
+def test_reset_shares_inputs_and_starts_simulation_columns_afresh():
+    table = TaskTable.from_tasks(TASKS)
+    table.remaining[0] = 0
+    table[0].start_time = 5
+    fresh = table.reset()
+    assert fresh.pid is table.pid and fresh.arrival is table.arrival and fresh.burst is table.burst
+    assert list(fresh.remaining) == [3, 2, 4]
+    assert [r.start_time for r in fresh] == [None, None, None]
+
+
+def test_mismatched_columns_are_rejected_and_priority_defaults_to_zero():
+    with pytest.raises(ValueError):
+        TaskTable.from_columns(["A", "B"], [0], [1, 2])
+    assert list(TaskTable.from_columns(["A"], [0], [1]).priority) == [0]
+
+
+def test_arrival_order_is_stable_with_optional_pid_tie_break():
+    table = TaskTable.from_columns(["Z", "Y", "X"], [5, 1, 1], [1, 1, 1])
+    assert table.arrival_order() == [1, 2, 0]
+    assert table.arrival_order(by_pid=True) == [2, 1, 0]
+
+
+def test_negative_times_are_never_mistaken_for_unset():
+    # a plugin scheduler (or a clock that starts before 0) may well run a task at -1
+    table = TaskTable.from_tasks([Task("A", -3, 2, 0), Task("B", -2, 1, 0)])
+    table[0].start_time, table[0].completion_time = -1, 1
+    table[1].start_time, table[1].completion_time = 1, 2
+    assert (table[0].start_time, table[0].completion_time) == (-1, 1)
+    result = evaluate_simulation(table, [(-1, 1, "A"), (1, 2, "B")], 2, 0, "plugin")
+    assert result.metrics["avg_wait"] == (2 + 3) / 2
+    assert result.metrics["response_max"] == 3
+    assert result.metrics["avg_turnaround"] == (4 + 4) / 2
@@ -0,0 +1,80 @@
+# tests/test_timeline.py
+import random
+import pytest
+from core.timeline import Timeline, as_timeline
+from schedulers.rr import RoundRobin
+
+
+def random_entries(seed: int):
+    """Slices in start order with idle slices, same-pid runs and uncovered gaps."""
+    rng = random.Random(seed)
+    entries, t = [], rng.randint(0, 5)
+    for _ in range(rng.randint(0, 40)):
+        t += rng.choice([0, 0, 0, 2])
+        end = t + rng.randint(1, 6)
+        entries.append((t, end, rng.choice(["A", "B", "C", "IDLE"])))
+        t = end
+    return entries
+
+
+def merged(entries):
+    out = []
+    for s, e, pid in entries:
+        if out and out[-1][1] == s and out[-1][2] == pid:
+            out[-1] = (out[-1][0], e, pid)
+        else:
+            out.append((s, e, pid))
+    return out
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_queries_match_a_linear_scan(seed):
+    entries = merged(random_entries(seed))
+    tl = Timeline.from_entries(entries)
+    assert list(tl) == entries
+    horizon = entries[-1][1] + 3 if entries else 5
+    for t in range(-2, horizon):
+        covering = [i for i, (s, e, _) in enumerate(entries) if s <= t < e]
+        assert tl.at(t) == (covering[0] if covering else -1)
+        assert tl.pid_at(t) == (entries[covering[0]][2] if covering else None)
+    for t0 in range(-1, horizon, 3):
+        for t1 in range(t0, horizon + 1, 2):
+            overlapping = [x for x in entries if x[0] < t1 and x[1] > t0]
+            assert list(tl.slices(t0, t1)) == overlapping
+            i, j = tl.range(t0, t1)
+            assert tl[i:j] == overlapping
+            assert tl.busy_time(t0, t1) == sum(min(e, t1) - max(s, t0) for s, e, pid in overlapping
+                                               if pid != "IDLE")
+    assert tl.busy_time() == sum(e - s for s, e, pid in entries if pid != "IDLE")
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_append_merges_only_contiguous_runs_of_one_pid(seed):
+    entries = random_entries(seed)
+    assert list(Timeline.from_entries(entries)) == merged(entries)
+    assert list(Timeline.from_entries(entries, merge=False)) == entries
+
+
+def test_pids_are_interned_and_idle_is_not():
+    tl = Timeline.from_entries([(0, 1, "A"), (1, 2, "IDLE"), (2, 3, "B"), (3, 4, "A")])
+    assert tl.pids == ["A", "B"]
+    assert list(tl.pid_index) == [0, -1, 1, 0]
+    assert tl == [(0, 1, "A"), (1, 2, "IDLE"), (2, 3, "B"), (3, 4, "A")]
+
+
+def test_copies_are_independent():
+    tl = Timeline.from_entries([(0, 2, "A"), (2, 5, "B")])
+    copy = tl.copy()
+    copy.append(5, 6, "B")
+    copy.append(6, 7, "C")
+    assert list(tl) == [(0, 2, "A"), (2, 5, "B")] and tl.pids == ["A", "B"]
+    assert list(copy) == [(0, 2, "A"), (2, 6, "B"), (6, 7, "C")]
+
+
+def test_compressed_scheduler_output_matches_merged_tuples(tasks):
+    plain = RoundRobin(quantum=1).run(tasks).timeline
+    compressed = RoundRobin(quantum=1, compress=True).run(tasks).timeline
+    assert isinstance(compressed, Timeline)
+    assert list(compressed) == merged(plain)
+    assert as_timeline(compressed) is compressed
+    assert list(as_timeline(plain)) == list(compressed)
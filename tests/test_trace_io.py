@@ -0,0 +1,104 @@
+# tests/test_trace_io.py
+import io
+import struct
+import pytest
+from core.simulation_engine import SimulationEngine
+from core.task import Task
+from core.task_table import TaskTable
+from core.trace_io import (HEADER, TraceFile, convert_csv, open_result, open_tasks, read_csv_tasks,
+                           read_jsonl_tasks, write_result, write_tasks)
+from evaluation.sweep import SCHEDULERS
+from schedulers.rr import RoundRobin
+
+
+def columns(table):
+    return list(table.pid), list(table.arrival), list(table.burst), list(table.priority)
+
+
+def test_task_tables_round_trip(tmp_path, tasks):
+    # repeated and non-ASCII pids are interned once and decoded back
+    table = TaskTable.from_tasks(tasks + [Task("P0", 60, 3, 1), Task("é-ß", 61, 2, 0)])
+    path = str(tmp_path / "tasks.trace")
+    write_tasks(path, table)
+    mapped = open_tasks(path)
+    assert columns(mapped) == columns(table)
+    assert len(TraceFile(path).pids) == len(set(table.pid))
+    assert SimulationEngine(SCHEDULERS["SRTF"]()).run(mapped).metrics == \
+           SimulationEngine(SCHEDULERS["SRTF"]()).run(table).metrics
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_results_round_trip(tmp_path, tasks, compress):
+    result = RoundRobin(quantum=2, compress=compress).run(tasks)
+    result.metrics = {"avg": 1.5}
+    path = str(tmp_path / "result.trace")
+    write_result(path, result)
+    mapped = open_result(path)
+    assert list(mapped.timeline) == list(result.timeline)
+    assert [mapped.timeline[i] for i in range(len(mapped.timeline))] == list(result.timeline)
+    assert (mapped.context_switches, mapped.idle_cycles, mapped.metrics, mapped.energy) == \
+           (result.context_switches, result.idle_cycles, result.metrics, result.energy)
+
+
+def test_columns_map_with_numpy(tmp_path, tasks):
+    np = pytest.importorskip("numpy")
+    table = TaskTable.from_tasks(tasks)
+    path = str(tmp_path / "tasks.trace")
+    write_tasks(path, table)
+    trace = TraceFile(path)
+    for name, offset in trace.column_offsets().items():
+        mapped = np.memmap(path, "<i8", "r", offset, (trace.nrows,))
+        assert mapped.tolist() == trace.numpy_columns()[name].tolist()
+    assert trace.numpy_columns()["burst"].tolist() == list(table.burst)
+
+
+def test_text_readers(tmp_path):
+    text = "pid,arrival,burst,priority\nA,0,5,2\nB,3,1,\n"
+    expected = (["A", "B"], [0, 3], [5, 1], [2, 0])
+    assert columns(read_csv_tasks(io.StringIO(text))) == expected
+    lines = '{"pid": "A", "arrival": 0, "burst": 5, "priority": 2}\n\n{"pid": "B", "arrival": 3, "burst": 1}\n'
+    assert columns(read_jsonl_tasks(io.StringIO(lines))) == expected
+
+    src, dst = tmp_path / "tasks.csv", str(tmp_path / "tasks.trace")
+    src.write_text(text)
+    convert_csv(str(src), dst)
+    assert columns(open_tasks(dst)) == expected
+
+
+def test_wrong_kind_is_rejected(tmp_path, tasks):
+    table = TaskTable.from_tasks(tasks)
+    path = str(tmp_path / "tasks.trace")
+    write_tasks(path, table)
+    with pytest.raises(ValueError, match="timeline"):
+        open_result(path)
+    write_result(path, RoundRobin().run(table))
+    with pytest.raises(ValueError, match="task table"):
+        open_tasks(path)
+
+
+@pytest.fixture
+def trace_bytes(tmp_path):
+    path = tmp_path / "tasks.trace"
+    write_tasks(str(path), TaskTable.from_tasks([Task(f"P{i}", i, i + 1, 0) for i in range(10)]))
+    return path.read_bytes()
+
+
+@pytest.mark.parametrize("size", [0, 10, HEADER.size - 1, HEADER.size, -8, -1])
+def test_truncated_files_are_rejected(tmp_path, trace_bytes, size):
+    path = tmp_path / "short.trace"
+    path.write_bytes(trace_bytes[:size])
+    with pytest.raises(ValueError):
+        open_tasks(str(path))
+
+
+def test_corrupt_headers_are_rejected(tmp_path, trace_bytes):
+    path = tmp_path / "bad.trace"
+    path.write_bytes(b"NOTTRACE" + trace_bytes[8:])
+    with pytest.raises(ValueError, match="not a trace file"):
+        open_tasks(str(path))
+    path.write_bytes(trace_bytes[:8] + struct.pack("<H", 99) + trace_bytes[10:])
+    with pytest.raises(ValueError, match="version"):
+        open_tasks(str(path))
+    path.write_bytes(trace_bytes[:12] + struct.pack("<I", 7) + trace_bytes[16:])
+    with pytest.raises(ValueError, match="columns"):
+        open_tasks(str(path))
@@ -0,0 +1,52 @@
+# tests/test_workloads.py
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from benchmarks.workloads import GENERATORS
+from core.workloads import PRESETS, Bimodal, Exponential, Pareto, Poisson, Replay, Workload
+from evaluation.sweep import SCHEDULERS
+
+
+def columns(table):
+    return list(table.pid), list(table.arrival), list(table.burst), list(table.priority)
+
+
+@pytest.mark.parametrize("name", list(PRESETS))
+def test_presets_are_seeded_sorted_and_positive(name):
+    workload = PRESETS[name]
+    table = workload.generate(seed=7, tasks=2000)
+    assert columns(table) == columns(workload.generate(seed=7, tasks=2000))
+    assert columns(table) != columns(workload.generate(seed=8, tasks=2000))
+    assert len(table) == 2000 and table.pid[0] == "P1"
+    arrival = list(table.arrival)
+    assert arrival == sorted(arrival) and arrival[0] >= 0
+    assert min(table.burst) >= 1
+
+
+def test_burst_caps_and_shapes():
+    rng = np.random.default_rng(0)
+    assert Pareto(1.1, cap=50).sample(rng, 10_000).max() <= 50
+    assert Exponential(5.0).sample(rng, 10_000).min() >= 1
+    bursts = Bimodal((1, 5), (50, 200), 0.1).sample(rng, 10_000)
+    assert set(np.unique(bursts)) <= set(range(1, 6)) | set(range(50, 201))
+    assert 0.07 < (bursts >= 50).mean() < 0.13
+
+
+def test_replay_scales_the_trace():
+    trace = Workload(Poisson(0.5), Exponential(4.0)).generate(seed=1, tasks=500)
+    fast = Replay(trace, speed=2.0, burst_scale=3.0).generate(seed=0)
+    assert list(fast.burst) == [3 * b for b in trace.burst]
+    span = trace.arrival[-1] - trace.arrival[0]
+    assert abs((fast.arrival[-1] - fast.arrival[0]) - span / 2) <= 1
+    longer = Replay(trace, bootstrap=True).generate(seed=0, tasks=2000)
+    assert len(longer) == 2000 and set(longer.burst) <= set(trace.burst)
+
+
+@pytest.mark.parametrize("dist", list(GENERATORS))
+def test_benchmark_generators_hold_their_load(dist):
+    table = GENERATORS[dist](20_000, seed=1, load=0.9)
+    res = SCHEDULERS["FCFS"]().run(table)
+    span = max(table.completion_time) - min(table.arrival)
+    assert 0.75 < sum(table.burst) / span < 1.0
+    assert res.idle_cycles > 0
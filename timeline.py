@@ -0,0 +1,140 @@
+# core/timeline.py
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from core.simulation_result import TimelineEntry
+
+# pid_index value used for IDLE slices
+IDLE_INDEX = -1
+
+
+class Timeline(Sequence[TimelineEntry]):
+    """
+    Run-length-compressed timeline stored as columns: int64 start/end and an
+    int32 pid_index into the interned `pids` table (IDLE_INDEX for idle).
+
+    append() extends the previous slice instead of adding one when the same
+    pid continues without a gap, so per-quantum or per-arrival slices of one
+    running task cost a single row. Slices are in start order, which makes
+    at(t) and range(t0, t1) binary searches. It still behaves as a sequence
+    of (start, end, pid) tuples for existing callers; column-aware code
+    (metrics, Gantt canvas, trace export) reads start/end/pid_index directly.
+    """
+    __slots__ = ("start", "end", "pid_index", "pids", "merge", "_index")
+
+    def __init__(self, merge: bool = True):
+        self.start = array("q")
+        self.end = array("q")
+        self.pid_index = array("i")
+        self.pids: List[str] = []
+        self.merge = merge
+        self._index: Dict[str, int] = {}
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[TimelineEntry], merge: bool = True) -> "Timeline":
+        tl = cls(merge)
+        tl.extend(entries)
+        return tl
+
+    def intern(self, pid: str) -> int:
+        if pid == "IDLE":
+            return IDLE_INDEX
+        k = self._index.get(pid)
+        if k is None:
+            k = self._index[pid] = len(self.pids)
+            self.pids.append(pid)
+        return k
+
+    def name(self, k: int) -> str:
+        return "IDLE" if k == IDLE_INDEX else self.pids[k]
+
+    def append(self, start: int, end: int, pid: str):
+        k = self.intern(pid)
+        if self.merge and self.end and self.end[-1] == start and self.pid_index[-1] == k:
+            self.end[-1] = end
+        else:
+            self.start.append(start)
+            self.end.append(end)
+            self.pid_index.append(k)
+
+    def extend(self, entries: Iterable[TimelineEntry]):
+        append = self.append
+        for s, e, pid in entries:
+            append(s, e, pid)
+
+    def copy(self) -> "Timeline":
+        """An independent copy (column copies, no per-slice work)."""
+        tl = Timeline(self.merge)
+        tl.start, tl.end, tl.pid_index = array("q", self.start), array("q", self.end), array("i", self.pid_index)
+        tl.pids = list(self.pids)
+        tl._index = dict(self._index)
+        return tl
+
+    # ---- sequence protocol ----
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        return self.start[i], self.end[i], self.name(self.pid_index[i])
+
+    def __iter__(self) -> Iterator[TimelineEntry]:
+        names = self.pids
+        for s, e, k in zip(self.start, self.end, self.pid_index):
+            yield s, e, "IDLE" if k == IDLE_INDEX else names[k]
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(a == tuple(b) for a, b in zip(self, other))
+
+    def __repr__(self):
+        return f"Timeline({len(self)} slices, {len(self.pids)} pids)"
+
+    # ---- queries ----
+
+    def at(self, t: int) -> int:
+        """Index of the slice running at time t, or -1 if none covers t."""
+        i = bisect_right(self.start, t) - 1
+        return i if i >= 0 and t < self.end[i] else -1
+
+    def pid_at(self, t: int) -> Optional[str]:
+        """Pid running at time t ("IDLE" for idle slices), or None outside the timeline."""
+        i = self.at(t)
+        return None if i < 0 else self.name(self.pid_index[i])
+
+    def range(self, t0: int, t1: int) -> Tuple[int, int]:
+        """Index bounds [i, j) of the slices overlapping [t0, t1)."""
+        i = bisect_right(self.start, t0) - 1
+        if i < 0 or self.end[i] <= t0:
+            i += 1
+        j = bisect_left(self.start, t1)
+        return i, max(i, j)
+
+    def slices(self, t0: int, t1: int) -> Iterator[TimelineEntry]:
+        """(start, end, pid) of each slice overlapping [t0, t1), unclipped."""
+        i, j = self.range(t0, t1)
+        for k in range(i, j):
+            yield self[k]
+
+    def busy_time(self, t0: Optional[int] = None, t1: Optional[int] = None) -> int:
+        """Non-idle time, optionally clipped to [t0, t1)."""
+        if not self.start:
+            return 0
+        if t0 is None and t1 is None:
+            return sum(e - s for s, e, k in zip(self.start, self.end, self.pid_index) if k != IDLE_INDEX)
+        lo = self.start[0] if t0 is None else t0
+        hi = self.end[-1] if t1 is None else t1
+        i, j = self.range(lo, hi)
+        total = 0
+        for k in range(i, j):
+            if self.pid_index[k] != IDLE_INDEX:
+                total += min(self.end[k], hi) - max(self.start[k], lo)
+        return total
+
+
+def as_timeline(timeline: Sequence[TimelineEntry]) -> Timeline:
+    """The given Timeline, or a merged Timeline built from (start, end, pid) tuples."""
+    return timeline if isinstance(timeline, Timeline) else Timeline.from_entries(timeline)
@@ -0,0 +1,290 @@
+# core/trace_io.py
+"""
+Compact binary trace format for workloads and simulation timelines.
+
+Layout (all integers little-endian):
+
+    header        HEADER struct (magic, version, kind, column count, row count,
+                  pid count and section offsets)
+    pid offsets   int64[pid_count + 1] byte offsets into the pid blob
+    pid blob      UTF-8 pid names, concatenated
+    columns       int64[rows] per column, 8-byte aligned, back to back
+    meta          optional JSON (SimulationResult counters/metrics)
+
+Task files hold the columns pid_index, arrival, burst, priority; timeline
+files hold start, end, pid_index (IDLE_INDEX for idle slices). Columns sit
+at fixed offsets, so they can be mapped with mmap or numpy.memmap without
+copying. column_offsets() gives the offsets.
+"""
+import csv
+import io
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+from core.task_table import TaskTable
+from core.simulation_result import SimulationResult, TimelineEntry
+from core.timeline import IDLE_INDEX, Timeline
+
+MAGIC = b"CPUTRACE"
+VERSION = 1
+KIND_TASKS = 1
+KIND_TIMELINE = 2
+
+TASK_COLUMNS = ("pid_index", "arrival", "burst", "priority")
+TIMELINE_COLUMNS = ("start", "end", "pid_index")
+
+# magic, version, kind, ncols, nrows, npids, pid_offsets_off, pid_blob_off,
+# pid_blob_len, data_off, meta_off, meta_len
+HEADER = struct.Struct("<8sHHIQQQQQQQQ")
+_ITEM = 8
+
+
+def _align(n: int) -> int:
+    return (n + _ITEM - 1) & ~(_ITEM - 1)
+
+
+def _le_bytes(col: array) -> bytes:
+    if sys.byteorder != "little":
+        col = array("q", col)
+        col.byteswap()
+    return col.tobytes()
+
+
+def _write(path: str, kind: int, columns: Sequence[array], names: Sequence[str], meta: Optional[dict] = None):
+    nrows = len(columns[0]) if columns else 0
+    blobs = [n.encode("utf-8") for n in names]
+    offsets = array("q", [0])
+    for b in blobs:
+        offsets.append(offsets[-1] + len(b))
+    pid_offsets_off = _align(HEADER.size)
+    pid_blob_off = pid_offsets_off + len(offsets) * _ITEM
+    pid_blob_len = offsets[-1]
+    data_off = _align(pid_blob_off + pid_blob_len)
+    meta_bytes = json.dumps(meta).encode("utf-8") if meta is not None else b""
+    meta_off = data_off + len(columns) * nrows * _ITEM
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, kind, len(columns), nrows, len(names), pid_offsets_off,
+                            pid_blob_off, pid_blob_len, data_off, meta_off, len(meta_bytes)))
+        f.write(b"\0" * (pid_offsets_off - HEADER.size))
+        f.write(_le_bytes(offsets))
+        for b in blobs:
+            f.write(b)
+        f.write(b"\0" * (data_off - pid_blob_off - pid_blob_len))
+        for col in columns:
+            f.write(_le_bytes(col if isinstance(col, array) else array("q", col)))
+        f.write(meta_bytes)
+
+
+class PidTable(Sequence[str]):
+    """Interned pid names decoded on access from a mapped blob."""
+    def __init__(self, offsets: memoryview, blob: memoryview):
+        self._offsets = offsets
+        self._blob = blob
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, k: int) -> str:
+        if k < 0:
+            k += len(self)
+        return str(self._blob[self._offsets[k]:self._offsets[k + 1]], "utf-8")
+
+    def names(self) -> List[str]:
+        return [self[k] for k in range(len(self))]
+
+
+class PidColumn(Sequence[str]):
+    """Per-row pid view: pid_index column resolved through a PidTable."""
+    def __init__(self, pid_index: memoryview, table: PidTable):
+        self._index = pid_index
+        self._table = table
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __getitem__(self, i: int) -> str:
+        return self._table[self._index[i]]
+
+    def __iter__(self) -> Iterator[str]:
+        table = self._table
+        for k in self._index:
+            yield table[k]
+
+
+class MappedTimeline(Sequence[TimelineEntry]):
+    """Read-only timeline backed by mapped start/end/pid_index columns."""
+    def __init__(self, start: memoryview, end: memoryview, pid_index: memoryview, pids: PidTable):
+        self.start = start
+        self.end = end
+        self.pid_index = pid_index
+        self.pids = pids
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    def __getitem__(self, i: int) -> TimelineEntry:
+        k = self.pid_index[i]
+        return self.start[i], self.end[i], "IDLE" if k == IDLE_INDEX else self.pids[k]
+
+    def __iter__(self) -> Iterator[TimelineEntry]:
+        names = self.pids.names()
+        for s, e, k in zip(self.start, self.end, self.pid_index):
+            yield s, e, "IDLE" if k == IDLE_INDEX else names[k]
+
+
+class TraceFile:
+    """
+    A mapped trace file. Columns are memoryviews into the read-only mapping;
+    pages are shared between every process that opens the same file.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < HEADER.size:
+                raise ValueError(f"{path} is not a trace file")
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        buf = memoryview(self._mm)
+        (magic, version, self.kind, ncols, self.nrows, npids, pid_offsets_off, pid_blob_off,
+         pid_blob_len, self.data_off, meta_off, meta_len) = HEADER.unpack_from(buf, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a trace file")
+        if version != VERSION:
+            raise ValueError(f"{path}: unsupported trace version {version}")
+        self.column_names = TASK_COLUMNS if self.kind == KIND_TASKS else TIMELINE_COLUMNS
+        if ncols != len(self.column_names):
+            raise ValueError(f"{path}: expected {len(self.column_names)} columns, found {ncols}")
+        size = max(pid_offsets_off + (npids + 1) * _ITEM, pid_blob_off + pid_blob_len,
+                   self.data_off + ncols * self.nrows * _ITEM, meta_off + meta_len)
+        if size > len(buf):
+            raise ValueError(f"{path}: truncated trace, {len(buf)} of {size} bytes")
+        self.pids = PidTable(self._column(buf, pid_offsets_off, npids + 1),
+                             buf[pid_blob_off:pid_blob_off + pid_blob_len])
+        self.columns: Dict[str, memoryview] = {
+            name: self._column(buf, self.data_off + k * self.nrows * _ITEM, self.nrows)
+            for k, name in enumerate(self.column_names)
+        }
+        self.meta = json.loads(bytes(buf[meta_off:meta_off + meta_len])) if meta_len else None
+
+    @staticmethod
+    def _column(buf: memoryview, offset: int, count: int):
+        view = buf[offset:offset + count * _ITEM].cast("q")
+        if sys.byteorder != "little":
+            col = array("q", view.tobytes())
+            col.byteswap()
+            return col
+        return view
+
+    def column_offsets(self) -> Dict[str, int]:
+        """Byte offset of each column, e.g. for numpy.memmap(path, '<i8', 'r', offset, (nrows,))."""
+        return {name: self.data_off + k * self.nrows * _ITEM for k, name in enumerate(self.column_names)}
+
+    def numpy_columns(self):
+        """Zero-copy NumPy views of the columns (requires NumPy)."""
+        import numpy as np
+        return {name: np.frombuffer(col, dtype="<i8") for name, col in self.columns.items()}
+
+
+# ---- task tables ----
+
+def write_tasks(path: str, table: TaskTable):
+    """Write a TaskTable; repeated pids are interned once."""
+    index: Dict[str, int] = {}
+    pid_index = array("q")
+    for pid in table.pid:
+        k = index.get(pid)
+        if k is None:
+            k = index[pid] = len(index)
+        pid_index.append(k)
+    _write(path, KIND_TASKS, [pid_index, table.arrival, table.burst, table.priority], list(index))
+
+def open_tasks(path: str) -> TaskTable:
+    """Map a task file as a TaskTable without copying its columns."""
+    trace = TraceFile(path)
+    if trace.kind != KIND_TASKS:
+        raise ValueError(f"{path} does not contain a task table")
+    cols = trace.columns
+    return TaskTable(PidColumn(cols["pid_index"], trace.pids), cols["arrival"], cols["burst"], cols["priority"])
+
+
+# ---- simulation results ----
+
+def write_result(path: str, result: SimulationResult):
+    """Write a SimulationResult's timeline as columns plus its counters as metadata."""
+    timeline = result.timeline
+    if isinstance(timeline, Timeline):
+        # already columnar with the same IDLE_INDEX convention
+        start, end, pid_index, names = timeline.start, timeline.end, array("q", timeline.pid_index), timeline.pids
+    else:
+        index: Dict[str, int] = {}
+        start, end, pid_index = array("q"), array("q"), array("q")
+        for s, e, pid in timeline:
+            if pid == "IDLE":
+                k = IDLE_INDEX
+            else:
+                k = index.get(pid)
+                if k is None:
+                    k = index[pid] = len(index)
+            start.append(s)
+            end.append(e)
+            pid_index.append(k)
+        names = list(index)
+    meta = {"context_switches": result.context_switches, "idle_cycles": result.idle_cycles,
+            "metrics": result.metrics, "energy": result.energy}
+    _write(path, KIND_TIMELINE, [start, end, pid_index], names, meta)
+
+def open_result(path: str) -> SimulationResult:
+    """Map a result file; the timeline is a lazy, read-only MappedTimeline."""
+    trace = TraceFile(path)
+    if trace.kind != KIND_TIMELINE:
+        raise ValueError(f"{path} does not contain a timeline")
+    cols = trace.columns
+    meta = trace.meta or {}
+    return SimulationResult(
+        timeline=MappedTimeline(cols["start"], cols["end"], cols["pid_index"], trace.pids),
+        context_switches=meta.get("context_switches", 0),
+        idle_cycles=meta.get("idle_cycles", 0),
+        metrics=meta.get("metrics", {}),
+        energy=meta.get("energy", 0.0),
+    )
+
+
+# ---- text converters ----
+
+def _rows_to_table(rows: Iterable[dict]) -> TaskTable:
+    pid: List[str] = []
+    arrival, burst, priority = array("q"), array("q"), array("q")
+    for r in rows:
+        pid.append(str(r["pid"]))
+        arrival.append(int(r["arrival"]))
+        burst.append(int(r["burst"]))
+        priority.append(int(r.get("priority") or 0))
+    return TaskTable(pid, arrival, burst, priority)
+
+def read_csv_tasks(source) -> TaskTable:
+    """Read pid,arrival,burst[,priority] rows (with a header) from a path or text stream."""
+    if isinstance(source, io.TextIOBase):
+        return _rows_to_table(csv.DictReader(source))
+    with open(source, newline="") as f:
+        return _rows_to_table(csv.DictReader(f))
+
+def read_jsonl_tasks(source) -> TaskTable:
+    """Read one {"pid", "arrival", "burst", "priority"} object per line."""
+    def rows(f):
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+    if isinstance(source, io.TextIOBase):
+        return _rows_to_table(rows(source))
+    with open(source) as f:
+        return _rows_to_table(rows(f))
+
+def convert_csv(src: str, dst: str):
+    write_tasks(dst, read_csv_tasks(src))
+
+def convert_jsonl(src: str, dst: str):
+    write_tasks(dst, read_jsonl_tasks(src))
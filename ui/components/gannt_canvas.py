@@ -1,15 +1,53 @@
 # ui/components/gantt_canvas.py
 import tkinter as tk
-from typing import List, Tuple
+from typing import List, Optional, Sequence, Tuple
 from ui.theme import colors
+from ui.components.gantt_lod import LaneIndex, RowIndex, Viewport, grid_ticks
+from core.timeline import IDLE_INDEX
 
 # timeline entry: (start_time, end_time, pid)
 TimelineEntry = Tuple[int, int, str]
 
+LABEL_FONT = ("Segoe UI", 9, "bold")
+TICK_FONT = ("Segoe UI", 8)
+GRID_COLOR = "#2F3440"
+
+
+class _ItemPool:
+    """Canvas items of one kind, reused across redraws instead of deleted and re-created."""
+    def __init__(self, canvas: tk.Canvas, create):
+        self.canvas = canvas
+        self.create = create
+        self.items: List[int] = []
+        self.used = 0
+        self._shown = 0
+
+    def take(self) -> int:
+        if self.used == len(self.items):
+            self.items.append(self.create())
+        item = self.items[self.used]
+        self.used += 1
+        return item
+
+    def finish(self):
+        """Hide the items this redraw did not use."""
+        for item in self.items[self.used:self._shown]:
+            self.canvas.itemconfigure(item, state="hidden")
+        self._shown = self.used
+        self.used = 0
+
+
 class GanttCanvas(tk.Canvas):
     """
     Draws a Gantt-style timeline.
     Call draw_timeline(timeline, color_map) to render.
+
+    Only the visible time window is drawn. Slices narrower than a pixel are
+    merged into per-pixel-column summary bars, grid ticks are thinned to the
+    zoom level and canvas items are reused, so a redraw costs about the same
+    for ten slices as for ten million. Mouse wheel zooms around the cursor,
+    dragging pans; zoom_in/zoom_out/fit are available for buttons.
+    Canvases joined with link_views() share one Viewport and zoom together.
     """
     def __init__(self, parent, height=300, **kwargs):
         super().__init__(parent, bg=colors.PANEL_BG, highlightthickness=0, **kwargs)
@@ -18,73 +56,231 @@ class GanttCanvas(tk.Canvas):
         self.padding = 12
         self.bar_height = 28
         self.row_gap = 8
-        self.bind("<Configure>", lambda e: self.redraw())
+        self.axis_height = 16
 
-        self._timeline = []
+        self._rows: Optional[RowIndex] = None
         self._color_map = {}
-        self._pid_rows = {}  # pid -> row index
-        self._max_time = 0
+        self.viewport = Viewport()
+        self._peers: List["GanttCanvas"] = [self]  # canvases sharing self.viewport
+        self._y_offset = 0  # vertical pan, pixels
+        self._redraw_pending = None
+        self._drag: Optional[Tuple[int, int]] = None
+
+        self._bars = _ItemPool(self, lambda: self.create_rectangle(0, 0, 0, 0, outline="", width=0))
+        self._labels = _ItemPool(self, lambda: self.create_text(0, 0, fill=colors.TEXT_PRIMARY, font=LABEL_FONT,
+                                                                tags="label"))
+        self._grid = _ItemPool(self, lambda: self.create_line(0, 0, 0, 0, fill=GRID_COLOR, dash=(2, 2),
+                                                              tags="grid"))
+        self._ticks = _ItemPool(self, lambda: self.create_text(0, 0, fill=colors.TEXT_MUTED, font=TICK_FONT,
+                                                               anchor="s"))
+        self._placeholder = self.create_text(0, 0, text="Gantt chart will appear here",
+                                             fill=colors.TEXT_MUTED, font=("Segoe UI", 12, "italic"))
+
+        self.bind("<Configure>", lambda e: self.schedule_redraw())
+        self.bind("<MouseWheel>", self._on_wheel)
+        self.bind("<Button-4>", lambda e: self._zoom_at(e.x, 1.25))
+        self.bind("<Button-5>", lambda e: self._zoom_at(e.x, 0.8))
+        self.bind("<ButtonPress-1>", self._on_press)
+        self.bind("<B1-Motion>", self._on_drag)
+        self.bind("<Double-Button-1>", lambda e: self.fit())
 
     def clear(self):
-        self.delete("all")
-        self._timeline = []
-        self._pid_rows = {}
-        self._max_time = 0
+        self._rows = None
+        self._y_offset = 0
+        self.viewport.fit(1)
+        self.schedule_redraw()
 
     def draw_timeline(self, timeline: List[TimelineEntry], color_map: dict):
         """
-        timeline: list of (start, end, pid).
+        timeline: list of (start, end, pid) or a core.timeline.Timeline.
         color_map: pid -> color
         """
-        self.clear()
-        self._timeline = timeline
+        self._rows = RowIndex(timeline) if len(timeline) else None
+        self._color_map = color_map
+        self.fit()
+
+    def append_segments(self, segments: List[TimelineEntry], color_map: dict):
+        """
+        Add streamed slices of a running simulation. While the view shows the
+        whole timeline so far it keeps fitting it; a zoomed view stays put.
+        """
+        following = self._rows is None or (self.viewport.t0 == 0 and self.viewport.t1 >= self._rows.max_time)
+        if self._rows is None:
+            self._rows = RowIndex()
+            self._y_offset = 0
         self._color_map = color_map
-        # compute pids and max time
-        pids = [pid for _, _, pid in timeline if pid != "IDLE"]
-        unique_pids = sorted(list(dict.fromkeys(pids)))  # preserve order
-        for i, pid in enumerate(unique_pids):
-            self._pid_rows[pid] = i
-        self._max_time = max((e for _, e, _ in timeline), default=0)
-        self.redraw()
+        self._rows.extend(segments)
+        if following:
+            self.fit()
+        else:
+            self.viewport.max_time = max(self.viewport.max_time, float(self._rows.max_time))
+            self.schedule_redraw()
+
+    # ---- zoom and pan ----
+
+    def _drawing_width(self) -> int:
+        return max(self.winfo_width(), 200) - 2 * self.padding
+
+    def _max_time(self) -> int:
+        return self._rows.max_time if self._rows is not None else 0
+
+    def _content_height(self) -> int:
+        rows = len(self._rows.row_keys) + 1 if self._rows is not None else 0
+        return self.padding + rows * (self.bar_height + self.row_gap) + self.axis_height
+
+    def _view_changed(self):
+        for canvas in self._peers:
+            canvas.schedule_redraw()
+
+    def _zoom_at(self, x: float, factor: float):
+        if self._rows is None:
+            return
+        anchor = self.viewport.time_at(x - self.padding, self._drawing_width())
+        self.viewport.zoom(factor, anchor)
+        self._view_changed()
+
+    def zoom_in(self):
+        self._zoom_at(self.padding + self._drawing_width() / 2, 2.0)
+
+    def zoom_out(self):
+        self._zoom_at(self.padding + self._drawing_width() / 2, 0.5)
+
+    def fit(self):
+        """Show the whole timeline (the longest one among linked canvases)."""
+        self.viewport.fit(max(c._max_time() for c in self._peers) or 1)
+        self._y_offset = 0
+        self._view_changed()
+
+    def _on_wheel(self, event):
+        self._zoom_at(event.x, 1.25 if event.delta > 0 else 0.8)
+
+    def _on_press(self, event):
+        self._drag = (event.x, event.y)
+
+    def _on_drag(self, event):
+        if self._drag is None or self._rows is None:
+            return
+        dx, dy = event.x - self._drag[0], event.y - self._drag[1]
+        self._drag = (event.x, event.y)
+        self.viewport.pan(-dx / self.viewport.scale(self._drawing_width()))
+        limit = max(0, self._content_height() - self.winfo_height())
+        self._y_offset = min(max(0, self._y_offset - dy), limit)
+        self._view_changed()
+
+    # ---- rendering ----
+
+    def schedule_redraw(self):
+        """Coalesce bursts of resize/zoom events into one redraw when Tk is idle."""
+        if self._redraw_pending is None:
+            self._redraw_pending = self.after_idle(self.redraw)
 
     def redraw(self):
-        self.delete("all")
-        if not self._timeline:
+        self._redraw_pending = None
+        w = max(self.winfo_width(), 200)
+        h = max(self.winfo_height(), self.height)
+        if self._rows is None:
             # draw placeholder text
-            w = self.winfo_width()
-            h = self.winfo_height()
-            self.create_text(w//2, h//2, text="Gantt chart will appear here",
-                             fill=colors.TEXT_MUTED, font=("Segoe UI", 12, "italic"))
+            self.coords(self._placeholder, w // 2, h // 2)
+            self.itemconfigure(self._placeholder, state="normal")
+            for pool in (self._bars, self._labels, self._grid, self._ticks):
+                pool.finish()
             return
+        self.itemconfigure(self._placeholder, state="hidden")
 
-        # drawing area
-        w = max(self.winfo_width(), 200)
         left = self.padding
-        right = w - self.padding
-        usable_w = max(1, right - left)
-        scale = usable_w / max(1, self._max_time)
-
-        # draw time grid (subtle)
-        for t in range(0, int(self._max_time) + 1):
-            x = left + t * scale
-            self.create_line(x, 0, x, self.height, fill="#2F3440", dash=(2, 2))
-
-        # draw bars
-        for start, end, pid in self._timeline:
-            if pid == "IDLE":
-                color = colors.IDLE_COLOR
-                row = -1  # idle row at top
+        usable_w = w - 2 * self.padding
+        vp = self.viewport
+        t0, t1 = vp.t0, vp.t1
+        scale = vp.scale(usable_w)
+
+        # time grid, thinned to at least 60px between lines
+        _, ticks = grid_ticks(t0, t1, usable_w)
+        for t in ticks:
+            x = left + (t - t0) * scale
+            line = self._grid.take()
+            self.coords(line, x, 0, x, h - self.axis_height)
+            self.itemconfigure(line, state="normal")
+            tick = self._ticks.take()
+            self.coords(tick, x, h - 2)
+            self.itemconfigure(tick, text=f"{t:g}", state="normal")
+
+        self._draw_bars(left, t0, t1, scale, h)
+
+        for pool in (self._bars, self._labels, self._grid, self._ticks):
+            pool.finish()
+        # pooled items keep their creation order; restore grid < bars < labels
+        self.tag_lower("grid")
+        self.tag_raise("label")
+
+    def _bar(self, x1: float, y_top: float, x2: float, y_bottom: float, color: str, label: Optional[str]):
+        item = self._bars.take()
+        self.coords(item, x1, y_top, x2, y_bottom)
+        self.itemconfigure(item, fill=color, state="normal")
+        # text label only on bars wide enough to hold it
+        if label is not None and x2 - x1 >= 7 * len(label) + 6:
+            text = self._labels.take()
+            self.coords(text, (x1 + x2) / 2, (y_top + y_bottom) / 2)
+            self.itemconfigure(text, text=label, state="normal")
+
+    def _draw_bars(self, left: float, t0: float, t1: float, scale: float, h: int):
+        # bars: idle row at top, then one row per pid; rows outside the canvas are skipped
+        row_keys = self._rows.row_keys
+        row_step = self.bar_height + self.row_gap
+        first_pos = max(0, (self._y_offset - self.padding) // row_step - 1)
+        for pos in range(first_pos, len(row_keys) + 1):
+            y_top = self.padding + pos * row_step - self._y_offset
+            if y_top > h - self.axis_height:
+                break
+            y_bottom = y_top + self.bar_height
+            if y_bottom < 0:
+                continue
+            key = IDLE_INDEX if pos == 0 else row_keys[pos - 1]
+            if key == IDLE_INDEX:
+                pid, color = "IDLE", colors.IDLE_COLOR
             else:
+                pid = self._rows.timeline.pids[key]
                 color = self._color_map.get(pid, colors.ACCENT_PALETTE[0])
-                row = self._pid_rows.get(pid, 0)
+            for x1, x2, first, last in self._rows.bars(key, t0, t1, scale):
+                exact = key != IDLE_INDEX and first == last
+                self._bar(left + x1, y_top, left + x2, y_bottom, color, pid if exact else None)
 
-            y_top = self.padding + (row + 1) * (self.bar_height + self.row_gap)
-            y_bottom = y_top + self.bar_height
-            x1 = left + start * scale
-            x2 = left + end * scale
-            # subtle rounded-like rectangle (create_rectangle + small oval ends)
-            self.create_rectangle(x1, y_top, x2, y_bottom, fill=color, outline="", width=0)
-            # text label
-            if pid != "IDLE":
-                self.create_text((x1 + x2) / 2, (y_top + y_bottom) / 2, text=pid,
-                                 fill=colors.TEXT_PRIMARY, font=("Segoe UI", 9, "bold"))
+
+class GanttLane(GanttCanvas):
+    """
+    One-row Gantt for stacked comparisons: every pid runs on a single lane,
+    coloured per pid, with the scheduler's name as a caption. Summary bars
+    that aggregate several slices take the first slice's colour.
+    """
+    def __init__(self, parent, title: str, height=64, **kwargs):
+        super().__init__(parent, height=height, **kwargs)
+        self.padding = 8
+        self.bar_height = 22
+        self.axis_height = 14
+        self.create_text(self.padding, 2, text=title, anchor="nw", fill=colors.TEXT_MUTED, font=TICK_FONT)
+        self.itemconfigure(self._placeholder, text=f"{title}: waiting…", font=TICK_FONT)
+
+    def draw_timeline(self, timeline: List[TimelineEntry], color_map: dict):
+        self._rows = LaneIndex(timeline) if len(timeline) else None
+        self._color_map = color_map
+        self.fit()
+
+    def _content_height(self) -> int:
+        return 0
+
+    def _draw_bars(self, left: float, t0: float, t1: float, scale: float, h: int):
+        y_top = self.padding + 10
+        y_bottom = y_top + self.bar_height
+        lane = self._rows
+        for x1, x2, first, last in lane.bars(t0, t1, scale):
+            pid = lane.pid(first)
+            color = self._color_map.get(pid, colors.ACCENT_PALETTE[0])
+            self._bar(left + x1, y_top, left + x2, y_bottom, color, pid if first == last else None)
+
+
+def link_views(canvases: Sequence[GanttCanvas]):
+    """Share one Viewport between canvases so their zoom and pan stay synchronized."""
+    viewport = Viewport()
+    peers = list(canvases)
+    for canvas in peers:
+        canvas.viewport = viewport
+        canvas._peers = peers
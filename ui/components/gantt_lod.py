@@ -0,0 +1,177 @@
+# ui/components/gantt_lod.py
+"""
+Tk-free layout for the Gantt canvas: the visible time window, per-row
+slice indexes, thinned grid ticks and per-pixel aggregation of slices.
+
+Everything here is bounded by the canvas width: a row's visible bars are
+found by bisection and runs of slices that share a pixel column
+are merged into one summary bar, so zoomed-out views of millions of slices
+still yield at most one bar per pixel column per row.
+"""
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+from core.timeline import IDLE_INDEX, Timeline, as_timeline
+from core.simulation_result import TimelineEntry
+
+# (x1, x2, first slice, last slice); first == last means an exact, unaggregated bar
+Bar = Tuple[float, float, int, int]
+
+
+class Viewport:
+    """Visible time window [t0, t1) within [0, max_time], with zoom and pan."""
+    MIN_SPAN = 1.0
+
+    def __init__(self, max_time: float = 1.0):
+        self.fit(max_time)
+
+    def fit(self, max_time: float):
+        self.max_time = max(1.0, float(max_time))
+        self.t0, self.t1 = 0.0, self.max_time
+
+    @property
+    def span(self) -> float:
+        return self.t1 - self.t0
+
+    def scale(self, width: float) -> float:
+        """Pixels per time unit for a drawing area `width` pixels wide."""
+        return max(1.0, width) / self.span
+
+    def time_at(self, x: float, width: float) -> float:
+        return self.t0 + x / self.scale(width)
+
+    def zoom(self, factor: float, anchor: float):
+        """Zoom in (factor > 1) or out around time `anchor`, which stays put on screen."""
+        span = min(self.max_time, max(self.MIN_SPAN, self.span / factor))
+        frac = (anchor - self.t0) / self.span if self.span else 0.0
+        self._place(anchor - frac * span, span)
+
+    def pan(self, dt: float):
+        self._place(self.t0 + dt, self.span)
+
+    def _place(self, t0: float, span: float):
+        t0 = min(max(0.0, t0), self.max_time - span)
+        self.t0, self.t1 = t0, t0 + span
+
+
+def grid_ticks(t0: float, t1: float, width: float, min_px: float = 60.0) -> Tuple[float, List[float]]:
+    """
+    (step, tick times) for grid lines at least `min_px` apart, with the step
+    rounded to 1, 2 or 5 times a power of ten (and never below one time unit).
+    """
+    span = t1 - t0
+    if span <= 0 or width <= 0:
+        return 1.0, []
+    raw = max(1.0, span * min_px / width)
+    mag = 10 ** math.floor(math.log10(raw))
+    step = next(m * mag for m in (1, 2, 5, 10) if m * mag >= raw)
+    first = math.ceil(t0 / step) * step
+    count = int((t1 - first) // step) + 1
+    return step, [first + k * step for k in range(max(0, count))]
+
+
+class RowIndex:
+    """
+    Per-row start/end columns (one row per pid, plus IDLE), built once per
+    timeline and extended as streamed segments arrive. Within a row slices
+    are disjoint and in start order, so ends are sorted too and both
+    columns can be bisected.
+    """
+    def __init__(self, timeline: Sequence[TimelineEntry] = ()):
+        tl = as_timeline(timeline)
+        self.timeline: Timeline = tl
+        self.pids: List[str] = sorted(tl.pids)
+        self.max_time = max(tl.end, default=0)
+        self.starts: Dict[int, array] = {}
+        self.ends: Dict[int, array] = {}
+        for s, e, k in zip(tl.start, tl.end, tl.pid_index):
+            self._add(k, s, e)
+        # pid index of each display row (sorted pid order)
+        index = {pid: k for k, pid in enumerate(tl.pids)}
+        self.row_keys: List[int] = [index[pid] for pid in self.pids]
+
+    def _add(self, k: int, s: int, e: int):
+        starts = self.starts.get(k)
+        if starts is None:
+            starts = self.starts[k] = array("q")
+            self.ends[k] = array("q")
+        ends = self.ends[k]
+        if ends and ends[-1] == s:
+            ends[-1] = e
+        else:
+            starts.append(s)
+            ends.append(e)
+
+    def extend(self, entries: Iterable[TimelineEntry]):
+        """Append streamed (start, end, pid) slices in time order."""
+        tl = self.timeline
+        for s, e, pid in entries:
+            known = len(tl.pids)
+            tl.append(s, e, pid)
+            k = tl.intern(pid)
+            if len(tl.pids) > known:
+                pos = bisect_left(self.pids, pid)
+                self.pids.insert(pos, pid)
+                self.row_keys.insert(pos, k)
+            self._add(k, s, e)
+            if e > self.max_time:
+                self.max_time = e
+
+    def has_idle(self) -> bool:
+        return IDLE_INDEX in self.starts
+
+    def bars(self, key: int, t0: float, t1: float, scale: float) -> Iterator[Bar]:
+        """Bars for row `key` in [t0, t1); see pixel_bars."""
+        starts = self.starts.get(key)
+        if not starts:
+            return iter(())
+        return pixel_bars(starts, self.ends[key], t0, t1, scale)
+
+
+class LaneIndex:
+    """
+    Every busy slice of a timeline in a single lane, with its pid index, for
+    compact one-row-per-scheduler views. Idle slices are left out.
+    """
+    def __init__(self, timeline: Sequence[TimelineEntry] = ()):
+        tl = as_timeline(timeline)
+        self.timeline: Timeline = tl
+        self.max_time = max(tl.end, default=0)
+        self.starts, self.ends, self.keys = array("q"), array("q"), array("i")
+        for s, e, k in zip(tl.start, tl.end, tl.pid_index):
+            if k != IDLE_INDEX:
+                self.starts.append(s)
+                self.ends.append(e)
+                self.keys.append(k)
+
+    def bars(self, t0: float, t1: float, scale: float) -> Iterator[Bar]:
+        return pixel_bars(self.starts, self.ends, t0, t1, scale)
+
+    def pid(self, i: int) -> str:
+        return self.timeline.pids[self.keys[i]]
+
+
+def pixel_bars(starts: Sequence[int], ends: Sequence[int], t0: float, t1: float, scale: float) -> Iterator[Bar]:
+    """
+    Bars for disjoint, start-ordered slices in [t0, t1), in pixels from t0.
+    Slices that share a pixel column are merged, so each call costs
+    O(visible pixels * log n) however many slices there are.
+    """
+    n = len(starts)
+    k = bisect_right(ends, t0)  # first slice ending after t0
+    while k < n and starts[k] < t1:
+        first = k
+        x1 = (max(starts[k], t0) - t0) * scale
+        end = ends[k]
+        while True:
+            # every visible slice starting before the next pixel column joins this bar
+            boundary = min(t1, t0 + (math.floor((end - t0) * scale) + 1) / scale)
+            nxt = bisect_left(starts, boundary, k + 1)
+            if nxt - 1 == k:
+                break
+            k = nxt - 1
+            end = ends[k]
+        x2 = max(x1 + 1, (min(end, t1) - t0) * scale)
+        yield x1, x2, first, k
+        k += 1
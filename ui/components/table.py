@@ -0,0 +1,108 @@
+# ui/components/table.py
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, List, Sequence, Tuple
+from ui.theme import colors
+
+ROW_FONT = ("Consolas", 9)
+HEADER_FONT = ("Segoe UI", 9, "bold")
+
+# (heading, width in pixels)
+Column = Tuple[str, int]
+
+
+class VirtualTable(ttk.Frame):
+    """
+    Read-only table over rows that are never materialized up front.
+
+    set_rows(count, row_values) only records how many rows there are;
+    row_values(i) is called for the rows currently on screen, so scrolling
+    through millions of rows formats a screenful at a time. The canvas text
+    items for the visible cells are created once per size and reused.
+    """
+    def __init__(self, parent, columns: Sequence[Column], row_height: int = 18, **kwargs):
+        super().__init__(parent, style="Card.TFrame", **kwargs)
+        self.columns = list(columns)
+        self.row_height = row_height
+        self.count = 0
+        self.first = 0  # index of the top visible row
+        self._row_values: Callable[[int], Sequence[str]] = lambda i: ()
+        self._cells: List[List[int]] = []
+        self._redraw_pending = None
+
+        self.canvas = tk.Canvas(self, bg=colors.CARD_BG, highlightthickness=0, height=8 * row_height)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._yview)
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+
+        x = 4
+        for heading, width in self.columns:
+            self.canvas.create_text(x, row_height // 2, text=heading, anchor="w",
+                                    fill=colors.TEXT_PRIMARY, font=HEADER_FONT)
+            x += width
+
+        self.canvas.bind("<Configure>", lambda e: self.schedule_redraw())
+        self.canvas.bind("<MouseWheel>", lambda e: self._scroll_by(-3 if e.delta > 0 else 3))
+        self.canvas.bind("<Button-4>", lambda e: self._scroll_by(-3))
+        self.canvas.bind("<Button-5>", lambda e: self._scroll_by(3))
+
+    def set_rows(self, count: int, row_values: Callable[[int], Sequence[str]]):
+        """Show `count` rows; row_values(i) gives the cell texts of row i."""
+        self.count = count
+        self._row_values = row_values
+        self.first = 0
+        self.schedule_redraw()
+
+    def see(self, index: int):
+        """Scroll so that row `index` is the top visible row (as far as possible)."""
+        self._scroll_to(index)
+
+    # ---- scrolling ----
+
+    def _visible_rows(self) -> int:
+        return max(1, self.canvas.winfo_height() // self.row_height - 1)  # minus the header
+
+    def _scroll_to(self, first: int):
+        self.first = max(0, min(int(first), self.count - self._visible_rows()))
+        self.schedule_redraw()
+
+    def _scroll_by(self, rows: int):
+        self._scroll_to(self.first + rows)
+
+    def _yview(self, *args):
+        """Scrollbar command: ("moveto", fraction) or ("scroll", n, "units"|"pages")."""
+        if args[0] == "moveto":
+            self._scroll_to(float(args[1]) * self.count)
+        elif args[0] == "scroll":
+            n = int(args[1])
+            self._scroll_by(n * self._visible_rows() if args[2] == "pages" else n)
+
+    # ---- rendering ----
+
+    def schedule_redraw(self):
+        if self._redraw_pending is None:
+            self._redraw_pending = self.after_idle(self.redraw)
+
+    def _ensure_cells(self, rows: int):
+        while len(self._cells) < rows:
+            y = (len(self._cells) + 1) * self.row_height + self.row_height // 2
+            x, row = 4, []
+            for _, width in self.columns:
+                row.append(self.canvas.create_text(x, y, anchor="w", fill=colors.TEXT_MUTED, font=ROW_FONT))
+                x += width
+            self._cells.append(row)
+
+    def redraw(self):
+        self._redraw_pending = None
+        visible = self._visible_rows()
+        self.first = max(0, min(self.first, self.count - visible))
+        self._ensure_cells(visible)
+        for r, row in enumerate(self._cells):
+            i = self.first + r
+            values = self._row_values(i) if r < visible and i < self.count else ()
+            for c, item in enumerate(row):
+                self.canvas.itemconfigure(item, text=values[c] if c < len(values) else "")
+        if self.count:
+            self.scrollbar.set(self.first / self.count, min(1.0, (self.first + visible) / self.count))
+        else:
+            self.scrollbar.set(0.0, 1.0)
@@ -2,26 +2,32 @@
 import tkinter as tk
 from tkinter import ttk
 from ui.theme import colors
-from ui.panels.input_panel import InputPanel
+from ui.panels.input_panel import InputPanel, RACE_ALL
 from ui.panels.chart_panel import ChartPanel
 from ui.panels.metrics_panel import MetricsPanel
-from core.simulation_engine import SimulationEngine
-from schedulers.fcfs import FCFS
-from schedulers.sjf import SJF
-from schedulers.rr import RoundRobin
-from schedulers.priority import PriorityScheduler
+from core.incremental import IncrementalSimulator
+from core.result_cache import ResultCache, scheduler_key, workload_fingerprint
+from core.background import BackgroundRun
+from core.race import RaceRunner
+from core.task_table import TaskTable, Workload, as_task_table
 from evaluation.energy_model import EnergyParams, DEFAULT_ENERGY_PARAMS
-from typing import List
+from evaluation.metrics import rescore_energy
+from core.simulation_engine import SimulationEngine
+from schedulers.registry import REGISTRY
+from dataclasses import replace
+from typing import Optional
 from core.task import Task
 
-from schedulers.energy_aware import EnergyAwareScheduler
+
+# milliseconds between polls of a background run's message queue
+POLL_MS = 50
 
 
-def _make_color_map(tasks: List[Task]) -> dict:
+def _make_color_map(tasks: Workload) -> dict:
     """Create stable mapping from pid to color for Gantt bars."""
     palette = colors.ACCENT_PALETTE
     mapping = {}
-    pids = [t.pid for t in tasks]
+    pids = tasks.pid if isinstance(tasks, TaskTable) else [t.pid for t in tasks]
     unique = list(dict.fromkeys(pids))
     for i, pid in enumerate(unique):
         mapping[pid] = palette[i % len(palette)]
@@ -41,7 +47,8 @@ class MainWindow(tk.Tk):
         top.pack(fill="both", expand=True, padx=10, pady=(10,6))
 
         # left input panel
-        self.input_panel = InputPanel(top, on_run=self.on_run_request, on_load_sample=self.on_load_sample)
+        self.input_panel = InputPanel(top, on_run=self.on_run_request, on_load_sample=self.on_load_sample,
+                                      on_cancel=self.on_cancel_request)
         self.input_panel.pack(side="left", fill="y", padx=(0,8))
 
         # center chart
@@ -56,6 +63,19 @@ class MainWindow(tk.Tk):
         self.status = ttk.Label(self, text="Ready", background=colors.STATUS_BG, foreground=colors.STATUS_TEXT, anchor="w")
         self.status.pack(side="bottom", fill="x")
 
+        # one incremental simulator per scheduler config, so re-running after
+        # a workload edit only re-simulates the affected suffix. A run checks
+        # its simulator out while using it, so a superseded run that is still
+        # finishing in the background never shares one with the next run.
+        self._simulators = {}
+        # finished results by workload fingerprint + scheduler config
+        self.result_cache = ResultCache()
+        # simulation in progress on the worker thread, if any
+        self._run: Optional[BackgroundRun] = None
+        self._color_map = {}
+        self._streaming = None  # scheduler whose partial timeline the Gantt shows
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
     def _apply_styles(self):
         self.style.configure("TFrame", background=colors.BG_PRIMARY)
         self.style.configure("Panel.TFrame", background=colors.PANEL_BG)
@@ -70,59 +90,174 @@ class MainWindow(tk.Tk):
             Task(pid="P3", arrival=4, burst=1, priority=3),
             Task(pid="P4", arrival=6, burst=7, priority=2),
         ]
-        # clear existing and feed into listbox
-        self.input_panel._tasks = []
-        self.input_panel.task_listbox.delete(0, "end")
-        for t in sample:
-            self.input_panel._tasks.append(t)
-            self.input_panel.task_listbox.insert("end", f"{t.pid} | arrival={t.arrival} | burst={t.burst} | prio={t.priority}")
+        self.input_panel.set_tasks(sample)
         self._set_status("Loaded sample workload.")
 
     def _set_status(self, text: str):
         self.status.configure(text=text)
 
-    def on_run_request(self, tasks: List[Task], config: dict):
+    def on_run_request(self, tasks: Workload, config: dict):
         """
         Main orchestration: run selected scheduler(s) and render results.
-        For fairness, each scheduler uses SimulationEngine which clones tasks.
+        Each scheduler runs through a lazy IncrementalSimulator: a fresh
+        workload gets a plain batch run, and checkpoints are only kept once
+        a workload is edited and re-run, so later edits resume from the last
+        valid checkpoint. Simulation happens on a worker thread; _poll_run
+        feeds progress, partial timelines and results back into the panels.
         """
-        # set energy params in evaluation module (temporary override)
-        from evaluation.energy_model import DEFAULT_ENERGY_PARAMS, EnergyParams
+        # energy weights from the sliders; results are re-scored with them,
+        # so moving a slider never needs a new simulation
         alpha, beta, gamma = config["alpha"], config["beta"], config["gamma"]
-        # patch default params (simple approach)
-        DEFAULT_ENERGY_PARAMS = EnergyParams(alpha=alpha, beta=beta, gamma=gamma)
-        # update compute_energy calls by monkeypatching if necessary - simpler approach:
-        # we'll pass params via evaluate_simulation by temporarily modifying DEFAULT_ENERGY_PARAMS in module
-        import importlib, evaluation.energy_model as em
-        em.DEFAULT_ENERGY_PARAMS = EnergyParams(alpha=alpha, beta=beta, gamma=gamma)
+        energy_params = EnergyParams(alpha=alpha, beta=beta, gamma=gamma)
 
         algo = config["algorithm"]
-        schedulers = []
-        if algo == "FCFS":
-            schedulers = [FCFS()]
-        elif algo == "SJF":
-            schedulers = [SJF()]
-        elif algo == "RoundRobin":
-            schedulers = [RoundRobin(quantum=config.get("quantum", 2))]
-        elif algo == "Priority":
-            schedulers = [PriorityScheduler()]
-        
-        elif algo == "EnergyAware":
-            schedulers = [EnergyAwareScheduler()]
-        else:
-            schedulers = [FCFS()]
+        params = config.get("params", {})
+        try:
+            specs = list(REGISTRY.values()) if algo == RACE_ALL else [REGISTRY[algo]]
+            schedulers = [spec.from_config(params) for spec in specs]
+        except (KeyError, ValueError) as exc:
+            self._set_status(f"Invalid scheduler settings: {exc}")
+            return
+
+        # a new run replaces one still in progress, which is cancelled and left
+        # to wind down on its own thread; _poll_run ignores its messages
+        if self._run is not None:
+            self._run.cancel()
+            self._run = None
 
         # clear UI outputs
         self.metrics_panel.clear()
         # Prebuild color map from tasks to ensure consistent colors
-        color_map = _make_color_map(tasks)
-        # run each scheduler
+        self._color_map = _make_color_map(tasks)
+        self._streaming = None
+        if algo == RACE_ALL:
+            self.chart_panel.show_race([s.name for s in schedulers], self._color_map)
+            self._run = BackgroundRun(
+                lambda cancel, post: self._race(schedulers, tasks, energy_params, cancel, post)).start()
+        else:
+            self.chart_panel.show_single()
+            self.chart_panel.gantt.clear()
+            self._run = BackgroundRun(
+                lambda cancel, post: self._simulate(schedulers, tasks, energy_params, cancel, post)).start()
+        self.input_panel.set_running(True)
+        self._set_status(f"Running: {', '.join(s.name for s in schedulers)}")
+        self.after(POLL_MS, self._poll_run, self._run)
+
+    def _simulate(self, schedulers, tasks, energy_params, cancel, post):
+        """Worker-thread side of a run: posts messages only, never touches Tk."""
+        # converted and hashed once for every cache lookup and store of the run
+        table = as_task_table(tasks)
+        fingerprint = workload_fingerprint(table)
+        for s in schedulers:
+            cancel.raise_if_cancelled()
+            res = self.result_cache.get(table, s, energy_params, fingerprint)
+            if res is None and not s.streams:
+                # plugin scheduler with a run() of its own: one plain run, cancellable and
+                # reporting progress if its run() takes cancel/progress
+                report = self._reporter(s.name, post)
+                res = SimulationEngine(s).run(table, cancel=cancel, progress=report)
+                self.result_cache.put(table, s, res, fingerprint)
+                res = replace(res, energy=rescore_energy(res, energy_params))
+            if res is None:
+                key = scheduler_key(s)
+                sim = self._simulators.pop(key, None) or IncrementalSimulator(s, lazy=True)
+                report = self._reporter(s.name, post)
+
+                def progress(done, total):
+                    report(done, total, sim.timeline)
+
+                try:
+                    res = sim.run(tasks, cancel=cancel, progress=progress)
+                finally:
+                    # a cancelled simulator has reset itself and stays usable
+                    self._simulators.setdefault(key, sim)
+                self.result_cache.put(table, s, res, fingerprint)
+                res = replace(res, energy=rescore_energy(res, energy_params))
+            post(("result", s.name, res))
+
+    @staticmethod
+    def _reporter(name, post):
+        """
+        progress(done, total, timeline) posting the counts and the entries not
+        sent yet, but the last one: a compressed timeline may still extend it,
+        and the result redraws the whole chart anyway.
+        """
+        sent = 0
+
+        def report(done, total, timeline):
+            nonlocal sent
+            chunk = timeline[sent:len(timeline) - 1]
+            sent += len(chunk)
+            post(("progress", name, done, total))
+            if chunk:
+                post(("chunk", name, chunk))
+        return report
+
+    def _race(self, schedulers, tasks, energy_params, cancel, post):
+        """
+        Worker-thread side of "Race all": cached results are posted at once,
+        the rest run in parallel on one shared TaskTable (see core.race) and
+        are posted in finishing order.
+        """
+        table = as_task_table(tasks)
+        fingerprint = workload_fingerprint(table)
+        pending = []
         for s in schedulers:
-            engine = SimulationEngine(s)
-            res = engine.run(tasks)
-            # render timeline
-            # build a simple pid->color map based on tasks
-            self.chart_panel.gantt.draw_timeline(res.timeline, color_map)
-            # display metrics
-            self.metrics_panel.display_result(s.name, res)
-            self._set_status(f"Completed: {s.name} — Energy: {res.energy:.3f}")
+            res = self.result_cache.get(table, s, energy_params, fingerprint)
+            if res is None:
+                pending.append(s)
+            else:
+                post(("race_result", s.name, res))
+        for s, res in RaceRunner(pending, ordered=False).iter_results(table, cancel):
+            self.result_cache.put(table, s, res, fingerprint)
+            res = replace(res, energy=rescore_energy(res, energy_params))
+            post(("race_result", s.name, res))
+
+    def _poll_run(self, run: BackgroundRun):
+        if run is not self._run:
+            return  # superseded by a newer run
+        for msg in run.drain():
+            kind = msg[0]
+            if kind == "progress":
+                _, name, done, total = msg
+                self._set_status(f"Running: {name} — {done}/{total} tasks")
+            elif kind == "chunk":
+                _, name, segments = msg
+                if name != self._streaming:
+                    self._streaming = name
+                    self.chart_panel.gantt.clear()
+                self.chart_panel.gantt.append_segments(segments, self._color_map)
+            elif kind == "result":
+                _, name, res = msg
+                self._streaming = None
+                # render timeline
+                self.chart_panel.gantt.draw_timeline(res.timeline, self._color_map)
+                # display metrics
+                self.metrics_panel.display_result(name, res)
+                self._set_status(f"Completed: {name} — Energy: {res.energy:.3f}")
+            elif kind == "race_result":
+                _, name, res = msg
+                self.chart_panel.race.add_result(name, res)
+                self._set_status(f"Race: {name} finished — Energy: {res.energy:.3f}")
+            else:
+                self._finish_run(msg)
+                return
+        self.after(POLL_MS, self._poll_run, run)
+
+    def _finish_run(self, msg):
+        self._run = None
+        self.input_panel.set_running(False)
+        if msg[0] == "cancelled":
+            self._set_status("Cancelled.")
+        elif msg[0] == "error":
+            self._set_status(f"Error: {msg[1]}")
+
+    def on_cancel_request(self):
+        if self._run is not None:
+            self._run.cancel()
+            self._set_status("Cancelling…")
+
+    def _on_close(self):
+        if self._run is not None:
+            self._run.cancel()
+        self.destroy()
@@ -3,15 +3,33 @@ import tkinter as tk
 from tkinter import ttk   # <-- REQUIRED
 from ui.components.card import Card
 from ui.components.gannt_canvas import GanttCanvas
+from ui.panels.race_panel import RacePanel
 from ui.theme import colors
 
 
 class ChartPanel(ttk.Frame):
-    """Center panel containing the Gantt canvas and simple controls."""
+    """Center panel containing the Gantt canvas (or the race view) and simple controls."""
     def __init__(self, parent, **kwargs):
         super().__init__(parent, style="Panel.TFrame", **kwargs)
         self.card = Card(self)
         self.card.pack(fill="both", expand=True, padx=8, pady=8)
-        ttk.Label(self.card, text="Timeline Visualizer", foreground=colors.TEXT_PRIMARY, background=colors.PANEL_BG).pack(anchor="w")
+        header = ttk.Frame(self.card, style="Card.TFrame")
+        header.pack(fill="x")
+        ttk.Label(header, text="Timeline Visualizer", foreground=colors.TEXT_PRIMARY, background=colors.PANEL_BG).pack(side="left")
         self.gantt = GanttCanvas(self.card, height=360)
+        # zoom controls; the canvas also zooms on mouse wheel and pans on drag
+        for text, command in (("Fit", self.gantt.fit), ("+", self.gantt.zoom_in), ("-", self.gantt.zoom_out)):
+            ttk.Button(header, text=text, width=4, command=command).pack(side="right", padx=(4, 0))
         self.gantt.pack(fill="both", expand=True, pady=(6,0))
+        self.race = RacePanel(self.card)
+
+    def show_single(self):
+        """Show the single-scheduler Gantt chart."""
+        self.race.pack_forget()
+        self.gantt.pack(fill="both", expand=True, pady=(6,0))
+
+    def show_race(self, names, color_map: dict):
+        """Swap in stacked lanes and the comparison table for a race between `names`."""
+        self.gantt.pack_forget()
+        self.race.start(names, color_map)
+        self.race.pack(fill="both", expand=True, pady=(6,0))
@@ -2,27 +2,41 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
-import random
 
 from ui.components.labeled_entry import LabeledEntry
+from ui.components.table import VirtualTable
 from ui.components.buttons import ActionButton
 from ui.components.card import Card
 from core.task import Task
-from typing import Callable, List
+from core.task_table import TaskTable, Workload
+from core.workloads import PRESETS
+from evaluation.replication import WorkloadSpec
+from schedulers.registry import REGISTRY, Param
+from typing import Callable, Dict, List, Optional
 from ui.theme import colors
 
 
+# algorithm choice that races every scheduler side by side
+RACE_ALL = "Race all"
+
+MAX_GENERATED_TASKS = 1_000_000
+
+
 class InputPanel(ttk.Frame):
     """
     Left-side panel: add tasks manually, generate random tasks,
-    select algorithm, set quantum, set energy params, and run.
+    select algorithm, set its parameters, set energy params, and run.
+    The algorithm list and parameter controls come from the scheduler
+    registry, so registered plugins show up without UI changes.
     """
 
-    def __init__(self, parent, on_run: Callable, on_load_sample: Callable, **kwargs):
+    def __init__(self, parent, on_run: Callable, on_load_sample: Callable,
+                 on_cancel: Optional[Callable] = None, **kwargs):
         super().__init__(parent, style="Panel.TFrame", **kwargs)
 
         self.on_run = on_run
         self.on_load_sample = on_load_sample
+        self.on_cancel = on_cancel
 
         # -----------------------------------------
         #  TASK CREATION CARD
@@ -68,16 +82,17 @@ class InputPanel(ttk.Frame):
             background=colors.PANEL_BG
         ).pack(anchor="w")
 
-        self.task_listbox = tk.Listbox(
+        # virtualized: only the visible rows are formatted, so generated
+        # workloads of any size load at once
+        self.task_table = VirtualTable(
             self.task_list_card,
-            height=10,
-            bg=colors.CARD_BG,
-            fg=colors.TEXT_PRIMARY
+            [("PID", 80), ("Arrival", 70), ("Burst", 60), ("Prio", 50)]
         )
-        self.task_listbox.pack(fill="both", expand=True, padx=4, pady=6)
+        self.task_table.pack(fill="both", expand=True, padx=4, pady=6)
 
         # Internal storage
-        self._tasks: List[Task] = []
+        # a Task list, or a TaskTable as generated (rows built only for display)
+        self._tasks: Workload = []
 
         # -----------------------------------------
         # SCHEDULER SELECTION
@@ -96,38 +111,18 @@ class InputPanel(ttk.Frame):
         self.algo_menu = ttk.Combobox(
             ctrl_card,
             textvariable=self.algo_var,
-            values=[
-                "FCFS",
-                "SJF",
-                "RoundRobin",
-                "Priority",
-                "SRTF",
-                "EnergyAware"
-            ],
+            values=[*REGISTRY, RACE_ALL],
             state="readonly"
         )
         self.algo_menu.pack(fill="x", pady=4)
 
-        # QUANTUM (Visible always for simplicity)
-        qframe = ttk.Frame(ctrl_card)
-        qframe.pack(fill="x", pady=4)
-
-        ttk.Label(
-            qframe,
-            text="Quantum:",
-            foreground=colors.TEXT_PRIMARY,
-            background=colors.PANEL_BG
-        ).pack(side="left")
-
-        self.quantum_var = tk.IntVar(value=2)
-        self.quantum_spin = ttk.Spinbox(
-            qframe,
-            from_=1,
-            to=20,
-            width=4,
-            textvariable=self.quantum_var
-        )
-        self.quantum_spin.pack(side="left", padx=6)
+        # PARAMETERS of the selected scheduler, rebuilt from its schema;
+        # values persist by name across algorithm switches
+        self.params_frame = ttk.Frame(ctrl_card)
+        self.params_frame.pack(fill="x", pady=4)
+        self._param_vars: Dict[str, tk.Variable] = {}
+        self.algo_var.trace_add("write", lambda *args: self._build_param_controls())
+        self._build_param_controls()
 
         # -----------------------------------------
         # ENERGY PARAMETERS
@@ -165,9 +160,21 @@ class InputPanel(ttk.Frame):
         run_btn = ActionButton(run_card, text="▶ Run Simulation", command=self._run)
         run_btn.pack(fill="x", pady=(0, 6))
 
+        self.cancel_btn = ActionButton(run_card, text="■ Cancel", command=self._cancel)
+        self.cancel_btn.pack(fill="x", pady=(0, 6))
+        self.cancel_btn.btn.configure(state="disabled")
+
         sample_btn = ActionButton(run_card, text="Load Sample Workload", command=self._load_sample)
         sample_btn.pack(fill="x")
 
+        self.workload_var = tk.StringVar(value=next(iter(PRESETS)))
+        ttk.Combobox(
+            run_card,
+            textvariable=self.workload_var,
+            values=list(PRESETS),
+            state="readonly"
+        ).pack(fill="x", pady=(6, 0))
+
         gen_btn = ActionButton(run_card, text="Generate Random Tasks", command=self._generate_random)
         gen_btn.pack(fill="x", pady=(6, 0))
 
@@ -192,8 +199,11 @@ class InputPanel(ttk.Frame):
             return
 
         t = Task(pid=pid, arrival=arr, burst=burst, priority=prio)
+        if isinstance(self._tasks, TaskTable):
+            self._tasks = self._tasks.to_tasks()
         self._tasks.append(t)
-        self.task_listbox.insert("end", f"{pid} | arrival={arr} | burst={burst} | prio={prio}")
+        self._refresh_task_list()
+        self.task_table.see(len(self._tasks) - 1)
 
         # clear fields
         self.entry_pid.var.set("")
@@ -201,37 +211,53 @@ class InputPanel(ttk.Frame):
         self.entry_burst.var.set("")
         self.entry_priority.var.set("")
 
+    def set_tasks(self, tasks: Workload):
+        """Replace the task list in one go; a TaskTable is kept as it is."""
+        self._tasks = tasks if isinstance(tasks, TaskTable) else list(tasks)
+        self._refresh_task_list()
+
+    def _refresh_task_list(self):
+        tasks = self._tasks
+        if isinstance(tasks, TaskTable):
+            pid, arrival, burst, priority = tasks.pid, tasks.arrival, tasks.burst, tasks.priority
+
+            def row(i: int):
+                return pid[i], str(arrival[i]), str(burst[i]), str(priority[i])
+        else:
+            def row(i: int):
+                t = tasks[i]
+                return t.pid, str(t.arrival), str(t.burst), str(t.priority)
+        self.task_table.set_rows(len(tasks), row)
+
     def _generate_random(self):
-        """Generate N random tasks with reasonable ranges."""
+        """Generate N random tasks from the selected workload preset (see core.workloads)."""
         count = simpledialog.askinteger(
             "Generate Tasks",
             "How many random tasks?",
             minvalue=1,
-            maxvalue=300
+            maxvalue=MAX_GENERATED_TASKS
         )
         if not count:
             return
 
-        self._tasks.clear()
-        self.task_listbox.delete(0, "end")
-
-        for i in range(count):
-            pid = f"P{i+1}"
-            arrival = random.randint(0, 30)
-            burst = random.randint(1, 15)
-            prio = random.randint(1, 5)
-
-            t = Task(pid=pid, arrival=arrival, burst=burst, priority=prio)
-            self._tasks.append(t)
-            self.task_listbox.insert("end", f"{pid} | arrival={arrival} | burst={burst} | prio={prio}")
+        try:
+            table = PRESETS[self.workload_var.get()].generate(tasks=count)
+        except ImportError:
+            # no NumPy: the original uniform ranges, drawn in Python
+            table = WorkloadSpec(tasks=count).generate()
+        self.set_tasks(table)
 
     def _run(self):
         """Package tasks + config and send to main window."""
-        tasks_copy = [Task(t.pid, t.arrival, t.burst, t.priority) for t in self._tasks]
+        if isinstance(self._tasks, TaskTable):
+            # never modified in place (edits replace it), so the worker can share it
+            tasks_copy = self._tasks
+        else:
+            tasks_copy = [Task(t.pid, t.arrival, t.burst, t.priority) for t in self._tasks]
 
         config = {
             "algorithm": self.algo_var.get(),
-            "quantum": self.quantum_var.get(),
+            "params": {name: var.get() for name, var in self._param_vars.items() if name in self._shown_params},
             "alpha": self.alpha_var.get(),
             "beta": self.beta_var.get(),
             "gamma": self.gamma_var.get(),
@@ -239,5 +265,56 @@ class InputPanel(ttk.Frame):
 
         self.on_run(tasks_copy, config)
 
+    def _selected_params(self) -> List[Param]:
+        algo = self.algo_var.get()
+        if algo != RACE_ALL:
+            return list(REGISTRY[algo].params)
+        # racing: one control per parameter name across every scheduler
+        merged = {}
+        for spec in REGISTRY.values():
+            for p in spec.params:
+                merged.setdefault(p.name, p)
+        return list(merged.values())
+
+    def _build_param_controls(self):
+        for child in self.params_frame.winfo_children():
+            child.destroy()
+        params = self._selected_params()
+        self._shown_params = {p.name for p in params}
+        for row, p in enumerate(params):
+            ttk.Label(
+                self.params_frame,
+                text=f"{p.title}:",
+                foreground=colors.TEXT_PRIMARY,
+                background=colors.PANEL_BG
+            ).grid(row=row, column=0, sticky="w")
+            var = self._param_vars.get(p.name)
+            if var is None:
+                var = tk.BooleanVar(value=p.default) if p.type is bool else tk.StringVar(value=str(p.default))
+                self._param_vars[p.name] = var
+            if p.type is bool:
+                widget = ttk.Checkbutton(self.params_frame, variable=var)
+            elif p.choices:
+                widget = ttk.Combobox(self.params_frame, textvariable=var, values=list(p.choices),
+                                      state="readonly", width=8)
+            else:
+                widget = ttk.Spinbox(
+                    self.params_frame,
+                    from_=p.min if p.min is not None else 0,
+                    to=p.max if p.max is not None else 1000,
+                    increment=1 if p.type is int else 0.1,
+                    width=6,
+                    textvariable=var
+                )
+            widget.grid(row=row, column=1, sticky="w", padx=6, pady=1)
+
+    def _cancel(self):
+        if self.on_cancel is not None:
+            self.on_cancel()
+
+    def set_running(self, running: bool):
+        """Enable the cancel button while a simulation is in progress."""
+        self.cancel_btn.btn.configure(state="normal" if running else "disabled")
+
     def _load_sample(self):
         self.on_load_sample()
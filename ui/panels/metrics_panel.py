@@ -1,38 +1,142 @@
 # ui/panels/metrics_panel.py
 import tkinter as tk
+from array import array
+from bisect import bisect_right
 from tkinter import ttk
 from ui.components.card import Card
+from ui.components.labeled_entry import LabeledEntry
+from ui.components.table import VirtualTable
 from ui.theme import colors
-from typing import Dict
+from core.timeline import IDLE_INDEX, as_timeline
+from typing import Dict, Optional, Tuple
+
+
+class TimelineRows:
+    """
+    Row source for the timeline list: reads the timeline's columns on demand
+    and formats only the rows asked for. A pid filter keeps just the indices
+    of matching slices instead of copying them.
+    """
+    def __init__(self, timeline):
+        # Timeline and MappedTimeline already have columns; plain lists are compressed once
+        self.timeline = timeline if hasattr(timeline, "pid_index") else as_timeline(timeline)
+        self.indices: Optional[array] = None  # matching slice indices, None = all
+
+    def filter(self, text: str) -> int:
+        """Keep slices whose pid contains `text` (case-insensitive); returns the row count."""
+        text = text.strip().lower()
+        if not text:
+            self.indices = None
+            return len(self)
+        tl = self.timeline
+        keys = {k for k, pid in enumerate(tl.pids) if text in pid.lower()}
+        if text in "idle":
+            keys.add(IDLE_INDEX)
+        self.indices = array("q", (i for i, k in enumerate(tl.pid_index) if k in keys))
+        return len(self)
+
+    def __len__(self) -> int:
+        return len(self.timeline.start) if self.indices is None else len(self.indices)
+
+    def row(self, i: int) -> Tuple[str, str, str, str]:
+        tl = self.timeline
+        j = i if self.indices is None else self.indices[i]
+        s, e, k = tl.start[j], tl.end[j], tl.pid_index[j]
+        return str(s), str(e), str(e - s), "IDLE" if k == IDLE_INDEX else tl.pids[k]
+
+    def row_at_time(self, t: int) -> int:
+        """First row whose slice ends after time t (slices are in time order)."""
+        ends = self.timeline.end
+        if self.indices is None:
+            return bisect_right(ends, t)
+        return bisect_right(self.indices, t, key=lambda j: ends[j])
+
 
 class MetricsPanel(ttk.Frame):
-    """Right-side metrics and comparison panel."""
+    """
+    Right-side metrics and comparison panel: a summary tree with one entry
+    per result, and a virtual timeline list for the selected result that
+    can be filtered by pid and jumped to a time.
+    """
     def __init__(self, parent, **kwargs):
         super().__init__(parent, style="Panel.TFrame", **kwargs)
         self.card = Card(self)
         self.card.pack(fill="both", expand=True, padx=8, pady=8)
         ttk.Label(self.card, text="Metrics & Energy", foreground=colors.TEXT_PRIMARY, background=colors.PANEL_BG).pack(anchor="w")
-        self.metrics_text = tk.Text(self.card, bg=colors.CARD_BG, fg=colors.TEXT_PRIMARY, height=20, wrap="word")
-        self.metrics_text.pack(fill="both", expand=True, pady=6)
-        self.metrics_text.configure(state="disabled")
+
+        self.summary = ttk.Treeview(self.card, columns=("value",), show="tree headings", height=9)
+        self.summary.heading("#0", text="Result")
+        self.summary.heading("value", text="Value")
+        self.summary.column("#0", width=140)
+        self.summary.column("value", width=90, anchor="e")
+        self.summary.pack(fill="x", pady=6)
+        self.summary.bind("<<TreeviewSelect>>", self._on_select)
+
+        controls = ttk.Frame(self.card, style="Card.TFrame")
+        controls.pack(fill="x")
+        self.pid_filter = LabeledEntry(controls, "PID", width=8)
+        self.pid_filter.pack(side="left")
+        self.pid_filter.var.trace_add("write", lambda *args: self._apply_filter())
+        self.goto = LabeledEntry(controls, "Time", width=7)
+        self.goto.pack(side="left")
+        self.goto.entry.bind("<Return>", lambda e: self._goto_time())
+        self.count_label = ttk.Label(controls, text="", foreground=colors.TEXT_MUTED, background=colors.PANEL_BG)
+        self.count_label.pack(side="right")
+
+        self.timeline_list = VirtualTable(self.card, columns=(("Start", 60), ("End", 60), ("Len", 50), ("PID", 70)))
+        self.timeline_list.pack(fill="both", expand=True, pady=6)
+
+        self._rows: Dict[str, TimelineRows] = {}  # summary item id -> rows
+        self._shown: Optional[TimelineRows] = None
 
     def display_result(self, name: str, result):
-        """Append a simulation result (SimulationResult) to text area."""
-        self.metrics_text.configure(state="normal")
-        txt = f"--- {name} ---\n"
-        txt += f"Energy: {result.energy:.3f}\n"
+        """Add a simulation result (SimulationResult) to the summary and list its timeline."""
+        for item in self.summary.get_children():
+            self.summary.item(item, open=False)
+        item = self.summary.insert("", "end", text=name, values=(f"{result.energy:.3f}",), open=True)
         for k, v in result.metrics.items():
-            txt += f"{k}: {v}\n"
-        txt += f"Context Switches: {result.context_switches}\n"
-        txt += f"Idle Cycles: {result.idle_cycles}\n"
-        txt += "Timeline:\n"
-        for s, e, pid in result.timeline:
-            txt += f"  [{s},{e}) -> {pid}\n"
-        txt += "\n"
-        self.metrics_text.insert("end", txt)
-        self.metrics_text.configure(state="disabled")
+            self.summary.insert(item, "end", text=k, values=(f"{v:.3f}" if isinstance(v, float) else v,))
+        self.summary.insert(item, "end", text="Context Switches", values=(result.context_switches,))
+        self.summary.insert(item, "end", text="Idle Cycles", values=(result.idle_cycles,))
+        self._rows[item] = TimelineRows(result.timeline)
+        self.summary.selection_set(item)
+        self.summary.see(item)
+        self._show(self._rows[item])
 
     def clear(self):
-        self.metrics_text.configure(state="normal")
-        self.metrics_text.delete("1.0", "end")
-        self.metrics_text.configure(state="disabled")
+        self.summary.delete(*self.summary.get_children())
+        self._rows = {}
+        self._shown = None
+        self.timeline_list.set_rows(0, lambda i: ())
+        self.count_label.configure(text="")
+
+    def _on_select(self, event=None):
+        selection = self.summary.selection()
+        if not selection:
+            return
+        item = selection[0]
+        item = self.summary.parent(item) or item
+        rows = self._rows.get(item)
+        if rows is not None and rows is not self._shown:
+            self._show(rows)
+
+    def _show(self, rows: TimelineRows):
+        self._shown = rows
+        self._apply_filter()
+
+    def _apply_filter(self):
+        rows = self._shown
+        if rows is None:
+            return
+        count = rows.filter(self.pid_filter.var.get())
+        self.timeline_list.set_rows(count, rows.row)
+        self.count_label.configure(text=f"{count} slices")
+
+    def _goto_time(self):
+        if self._shown is None:
+            return
+        try:
+            t = int(self.goto.var.get())
+        except ValueError:
+            return
+        self.timeline_list.see(self._shown.row_at_time(t))
@@ -0,0 +1,81 @@
+# ui/panels/race_panel.py
+import tkinter as tk
+from tkinter import ttk
+from typing import Dict, List
+from ui.components.gannt_canvas import GanttLane, link_views
+from ui.theme import colors
+
+
+class RacePanel(ttk.Frame):
+    """
+    "Race all" view: one Gantt lane per scheduler, stacked and zoomed/panned
+    together, above a comparison table that fills in as results arrive.
+    Click a column heading to sort by it.
+    """
+    COLUMNS = (
+        ("energy", "Energy"),
+        ("avg_wait", "Avg wait"),
+        ("avg_turnaround", "Avg turnaround"),
+        ("response_p95", "p95 response"),
+        ("response_p99", "p99 response"),
+        ("throughput", "Throughput"),
+        ("context_switches", "Ctx switches"),
+    )
+
+    def __init__(self, parent, **kwargs):
+        super().__init__(parent, style="Card.TFrame", **kwargs)
+        self.lanes_frame = ttk.Frame(self, style="Card.TFrame")
+        self.lanes_frame.pack(fill="both", expand=True)
+        self.lanes: Dict[str, GanttLane] = {}
+        self._color_map = {}
+        self._values: Dict[str, Dict[str, float]] = {}
+        self._sort = ("energy", False)
+
+        names = [name for name, _ in self.COLUMNS]
+        self.table = ttk.Treeview(self, columns=names, show="tree headings", height=7)
+        self.table.heading("#0", text="Scheduler")
+        self.table.column("#0", width=110, stretch=False)
+        for name, title in self.COLUMNS:
+            self.table.heading(name, text=title, command=lambda n=name: self._sort_by(n))
+            self.table.column(name, width=90, anchor="e")
+        self.table.tag_configure("best", foreground=colors.BUTTON_BG)
+        self.table.pack(fill="x", pady=(6, 0))
+
+    def start(self, names: List[str], color_map: dict):
+        """Reset for a new race between the named schedulers."""
+        for lane in self.lanes.values():
+            lane.destroy()
+        self.lanes = {}
+        self._color_map = color_map
+        self._values = {}
+        self.table.delete(*self.table.get_children())
+        for name in names:
+            lane = GanttLane(self.lanes_frame, title=name)
+            lane.pack(fill="x", pady=(0, 2))
+            self.lanes[name] = lane
+        link_views(list(self.lanes.values()))
+
+    def add_result(self, name: str, result):
+        lane = self.lanes.get(name)
+        if lane is not None:
+            lane.draw_timeline(result.timeline, self._color_map)
+        values = {"energy": result.energy, "context_switches": result.context_switches}
+        for key in ("avg_wait", "avg_turnaround", "response_p95", "response_p99", "throughput"):
+            values[key] = result.metrics.get(key, 0.0)
+        self._values[name] = values
+        self._refresh()
+
+    def _sort_by(self, column: str):
+        col, reverse = self._sort
+        self._sort = (column, not reverse if col == column else False)
+        self._refresh()
+
+    def _refresh(self):
+        col, reverse = self._sort
+        self.table.delete(*self.table.get_children())
+        # highlight the winner of the sorted column (lowest, but highest throughput)
+        pick = max if col == "throughput" else min
+        best = pick(v[col] for v in self._values.values())
+        for name, v in sorted(self._values.items(), key=lambda kv: kv[1][col], reverse=reverse):
+            cells = [f"{v[k]:.3f}" if isinstance(v[k], float) else v[k] for k, _ in self.COLUMNS]
+            self.table.insert("", "end", text=name, values=cells, tags=("best",) if v[col] == best else ())
@@ -0,0 +1,275 @@
+# core/workloads.py
+"""
+Seeded synthetic workloads, generated in bulk with NumPy.
+
+A Workload combines an arrival process, a burst distribution and a
+priority mix; generate(seed, tasks) draws every column as one array and
+packs them into a TaskTable (pids P1..Pn in arrival order), so 10^5 tasks
+take milliseconds. Replay builds workloads from a recorded trace instead.
+Both have the generate(seed) signature of evaluation.replication's
+WorkloadSpec and can be passed to replicate().
+
+Arrival processes (times are floored to integers):
+    Poisson(rate)                       exponential gaps
+    MMPP(rates, dwell)                  Markov-modulated Poisson: bursty phases
+    Diurnal(rate, amplitude, period)    sinusoidal rate, by thinning
+    UniformArrivals(low, high)          uniform over a window
+Burst distributions (integers >= 1, optionally capped):
+    Pareto(alpha), LogNormal(median, sigma), Exponential(mean), UniformBursts(low, high),
+    Bimodal(short, long, p_long)
+Priorities:
+    PriorityMix({level: weight, ...})
+
+PRESETS names a few ready-made workloads (the UI offers them).
+"""
+import math
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, Mapping, Optional, Sequence, Union
+from core.task_table import TaskTable
+from core.trace_io import open_tasks
+
+try:
+    import numpy as np
+except ImportError:  # generate() raises instead
+    np = None
+
+
+def _rng(seed: Optional[int]):
+    if np is None:
+        raise ImportError("workload generation requires NumPy")
+    return np.random.default_rng(seed)
+
+def _int_column(values) -> array:
+    return array("q", np.ascontiguousarray(values, dtype=np.int64).tobytes())
+
+def _to_bursts(values, cap: Optional[int]):
+    bursts = np.maximum(np.ceil(values), 1)
+    if cap is not None:
+        bursts = np.minimum(bursts, cap)
+    return bursts.astype(np.int64)
+
+def _table(arrival, burst, priority, prefix: str = "P") -> TaskTable:
+    pids = [f"{prefix}{i}" for i in range(1, len(arrival) + 1)]
+    return TaskTable(pids, _int_column(arrival), _int_column(burst), _int_column(priority))
+
+
+# ---- arrival processes: sample(rng, n) -> n sorted arrival times ----
+
+@dataclass(frozen=True)
+class Poisson:
+    rate: float  # arrivals per time unit
+
+    def sample(self, rng, n: int):
+        return np.floor(np.cumsum(rng.exponential(1 / self.rate, n)))
+
+
+@dataclass(frozen=True)
+class MMPP:
+    """
+    Markov-modulated Poisson process: the source stays in phase k for an
+    exponential time of mean dwell[k], emitting arrivals at rates[k], then
+    jumps to another phase chosen uniformly. Two phases, one quiet and one
+    busy, give on/off burstiness.
+    """
+    rates: Sequence[float] = (0.05, 1.0)
+    dwell: Sequence[float] = (200.0, 20.0)
+
+    def sample(self, rng, n: int):
+        rates = np.asarray(self.rates, dtype=float)
+        dwell = np.asarray(self.dwell, dtype=float)
+        m = len(rates)
+        times = []
+        found = 0
+        start, phase = 0.0, 0
+        mean_rate = float((rates * dwell).sum() / dwell.sum())
+        while found < n:
+            # enough sojourns for the remaining arrivals, on average, plus slack
+            k = max(16, int(1.2 * (n - found) / max(mean_rate * dwell.mean(), 1e-9)) + 1)
+            jumps = rng.integers(1, m, k) if m > 1 else np.zeros(k, dtype=np.int64)
+            phases = (phase + np.concatenate(([0], np.cumsum(jumps[:-1])))) % m
+            lengths = rng.exponential(dwell[phases])
+            starts = start + np.concatenate(([0.0], np.cumsum(lengths[:-1])))
+            counts = rng.poisson(rates[phases] * lengths)
+            chunk = np.repeat(starts, counts) + rng.random(int(counts.sum())) * np.repeat(lengths, counts)
+            chunk.sort()
+            times.append(chunk)
+            found += len(chunk)
+            start = float(starts[-1] + lengths[-1])
+            phase = int((phases[-1] + jumps[-1]) % m)
+        return np.floor(np.concatenate(times)[:n])
+
+
+@dataclass(frozen=True)
+class Diurnal:
+    """
+    Non-homogeneous Poisson process with rate(t) = rate * (1 + amplitude *
+    sin(2*pi*t / period + phase)), sampled by thinning a Poisson process at
+    the peak rate. amplitude is in [0, 1].
+    """
+    rate: float
+    amplitude: float = 0.8
+    period: float = 10_000.0
+    phase: float = 0.0
+
+    def sample(self, rng, n: int):
+        peak = self.rate * (1 + self.amplitude)
+        times = []
+        found = 0
+        start = 0.0
+        while found < n:
+            k = int((n - found) * (1 + self.amplitude) * 1.1) + 16
+            candidates = start + np.cumsum(rng.exponential(1 / peak, k))
+            rate = self.rate * (1 + self.amplitude * np.sin(2 * math.pi * candidates / self.period + self.phase))
+            kept = candidates[rng.random(k) * peak < rate]
+            times.append(kept)
+            found += len(kept)
+            start = float(candidates[-1])
+        return np.floor(np.concatenate(times)[:n])
+
+
+@dataclass(frozen=True)
+class UniformArrivals:
+    low: int = 0
+    high: int = 30  # inclusive
+
+    def sample(self, rng, n: int):
+        return np.sort(rng.integers(self.low, self.high + 1, n))
+
+
+# ---- burst distributions: sample(rng, n) -> n integer bursts >= 1 ----
+
+@dataclass(frozen=True)
+class Pareto:
+    """Pareto with shape alpha and minimum `minimum`: heavy-tailed for alpha <= 2."""
+    alpha: float = 1.5
+    minimum: float = 1.0
+    cap: Optional[int] = 10_000
+
+    def sample(self, rng, n: int):
+        return _to_bursts(self.minimum * (1 + rng.pareto(self.alpha, n)), self.cap)
+
+
+@dataclass(frozen=True)
+class LogNormal:
+    median: float = 5.0
+    sigma: float = 1.0
+    cap: Optional[int] = 10_000
+
+    def sample(self, rng, n: int):
+        return _to_bursts(rng.lognormal(math.log(self.median), self.sigma, n), self.cap)
+
+
+@dataclass(frozen=True)
+class Exponential:
+    mean: float = 5.0
+    cap: Optional[int] = None
+
+    def sample(self, rng, n: int):
+        return _to_bursts(rng.exponential(self.mean, n), self.cap)
+
+
+@dataclass(frozen=True)
+class UniformBursts:
+    low: int = 1
+    high: int = 15  # inclusive
+
+    def sample(self, rng, n: int):
+        return rng.integers(self.low, self.high + 1, n)
+
+
+@dataclass(frozen=True)
+class Bimodal:
+    """Mostly short bursts uniform in `short`, a fraction p_long of long ones uniform in `long` (inclusive)."""
+    short: Sequence[int] = (1, 5)
+    long: Sequence[int] = (50, 200)
+    p_long: float = 0.1
+
+    def sample(self, rng, n: int):
+        short = rng.integers(self.short[0], self.short[1] + 1, n)
+        long = rng.integers(self.long[0], self.long[1] + 1, n)
+        return np.where(rng.random(n) < self.p_long, long, short)
+
+
+# ---- priorities ----
+
+@dataclass(frozen=True)
+class PriorityMix:
+    """Priority levels drawn independently with the given relative weights."""
+    weights: Mapping[int, float] = field(default_factory=lambda: {0: 1.0})
+
+    def sample(self, rng, n: int):
+        levels = np.fromiter(self.weights.keys(), dtype=np.int64)
+        p = np.fromiter(self.weights.values(), dtype=float)
+        return rng.choice(levels, n, p=p / p.sum())
+
+
+# ---- workloads ----
+
+@dataclass(frozen=True)
+class Workload:
+    """Arrival process x burst distribution x priority mix; `tasks` is the default size."""
+    arrivals: object = Poisson(0.18)
+    bursts: object = Exponential(5.0)
+    priorities: PriorityMix = PriorityMix()
+    tasks: int = 1000
+
+    def generate(self, seed: Optional[int] = None, tasks: Optional[int] = None) -> TaskTable:
+        rng = _rng(seed)
+        n = self.tasks if tasks is None else tasks
+        return _table(self.arrivals.sample(rng, n), self.bursts.sample(rng, n), self.priorities.sample(rng, n))
+
+
+@dataclass(frozen=True)
+class Replay:
+    """
+    A recorded trace (TaskTable or trace file path) replayed at another
+    scale: inter-arrival gaps divided by `speed`, bursts multiplied by
+    burst_scale. Workloads longer than the trace repeat it, one mean gap
+    after its last arrival. bootstrap=True instead resamples gaps and tasks
+    with replacement, so every seed gives a different workload with the
+    trace's statistics.
+    """
+    trace: Union[TaskTable, str]
+    speed: float = 1.0
+    burst_scale: float = 1.0
+    bootstrap: bool = False
+    tasks: Optional[int] = None  # default: the trace's length
+
+    def generate(self, seed: Optional[int] = None, tasks: Optional[int] = None) -> TaskTable:
+        rng = _rng(seed)
+        table = open_tasks(self.trace) if isinstance(self.trace, str) else self.trace
+        m = len(table)
+        n = tasks if tasks is not None else self.tasks if self.tasks is not None else m
+        if m == 0 or n == 0:
+            return _table(np.zeros(0), np.zeros(0), np.zeros(0))
+        arrival = np.frombuffer(table.arrival, dtype=np.int64)
+        order = np.argsort(arrival, kind="stable")
+        arrival = arrival[order].astype(float)
+        gaps = np.diff(arrival, prepend=arrival[0])
+        # the gap that precedes a repetition of the trace
+        gaps[0] = (arrival[-1] - arrival[0]) / (m - 1) if m > 1 else 1.0
+        if self.bootstrap:
+            rows = rng.integers(0, m, n)
+            steps = rng.choice(gaps, n)
+        else:
+            rows = np.resize(np.arange(m), n)
+            steps = gaps[rows]
+        times = arrival[0] + (np.cumsum(steps) - steps[0]) / self.speed
+        burst = np.frombuffer(table.burst, dtype=np.int64)[order][rows]
+        priority = np.frombuffer(table.priority, dtype=np.int64)[order][rows]
+        return _table(np.floor(times), _to_bursts(burst * self.burst_scale, None), priority)
+
+
+PRESETS: Dict[str, Workload] = {
+    # the ranges of the original "Generate Random Tasks"
+    "Uniform": Workload(UniformArrivals(0, 30), UniformBursts(1, 15), PriorityMix({p: 1 for p in range(1, 6)})),
+    "Poisson / exponential": Workload(Poisson(0.18), Exponential(5.0), PriorityMix({1: 1, 2: 1, 3: 1})),
+    "Poisson / Pareto": Workload(Poisson(0.2), Pareto(1.5, 1.0), PriorityMix({1: 1, 2: 1, 3: 1})),
+    "Bursty (MMPP) / lognormal": Workload(MMPP((0.02, 0.6), (300.0, 30.0)), LogNormal(3.0, 1.0),
+                                          PriorityMix({1: 0.2, 2: 0.5, 3: 0.3})),
+    "Diurnal / lognormal": Workload(Diurnal(0.15, 0.8, 5_000.0), LogNormal(4.0, 0.8),
+                                    PriorityMix({1: 0.1, 2: 0.3, 3: 0.6})),
+    "Interactive + batch": Workload(Poisson(0.2), LogNormal(2.0, 1.2, cap=500),
+                                    PriorityMix({1: 0.7, 5: 0.3})),
+}